@@ -1,6 +1,6 @@
 """PT losses package."""
 
-from pt_losses.services.calculator import calculate_losses
+from pt_losses.services.calculator import calculate_losses, calculate_losses_batch
 from pt_losses.services.io import load_input_file
 
-__all__ = ["calculate_losses", "load_input_file"]
+__all__ = ["calculate_losses", "calculate_losses_batch", "load_input_file"]
@@ -2,18 +2,41 @@ from __future__ import annotations
 
 import argparse
 import json
+import sys
+from contextlib import ExitStack
+from dataclasses import replace
 from pathlib import Path
 
 from pt_losses.adapters.rfem_client import Rfem6ApiAdapter
 from pt_losses.adapters.rfem_stub import Rfem6AdapterStub
-from pt_losses.services.calculator import calculate_losses
-from pt_losses.services.io import load_input_file, write_result_file
+from pt_losses.domain.models import LossesInput
+from pt_losses.services.archive import convert_archive
+from pt_losses.services.cache import DiskCache
+from pt_losses.services.calculator import calculate_losses, columns_from_inputs
+from pt_losses.services.coupled import SECTION_KEYS, solve_coupled
+from pt_losses.services.io import (
+    iter_input_mappings,
+    load_input_mapping,
+    process_csv_file,
+)
+from pt_losses.services.kernels import BACKENDS, resolve_backend
+from pt_losses.services.project import ProjectStore, iter_source_records
 from pt_losses.services.rfem_conversion import build_rfem_load_payload
+from pt_losses.services.sensitivity import calculate_sensitivities, format_tornado
+from pt_losses.services.serialization import SERIALIZER_BACKENDS, JsonSerializer, write_bytes, write_stdout
+from pt_losses.services.streaming import iter_json_records, stream_batch
+from pt_losses.services.sweep import DEFAULT_CHUNK_SIZE, SWEEP_OUTPUT_EXTENSIONS, SweepAxis, write_sweep
+from pt_losses.services.watch import DEFAULT_DEBOUNCE, DEFAULT_INTERVAL, DirectoryWatcher
 
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
-        description="Calcula perdidas de postensado y deformaciones equivalentes para RFEM 6."
+        description="Calcula perdidas de postensado y deformaciones equivalentes para RFEM 6.",
+        epilog=(
+            "Subcomandos: 'sweep' para barridos parametricos (pt-losses sweep --help), 'proyecto' para "
+            "proyectos SQLite (pt-losses proyecto --help), 'convertir' para pasar un archivo columnar "
+            ".npycols a CSV o NDJSON y 'watch' para recalcular al guardar (pt-losses watch --help)."
+        ),
     )
     parser.add_argument(
         "--input",
@@ -26,7 +49,25 @@ def build_parser() -> argparse.ArgumentParser:
         "--output",
         "--salida",
         dest="output",
-        help="Ruta opcional para guardar el resultado en formato JSON.",
+        help="Ruta opcional para guardar el resultado en formato JSON (.gz o .xz para comprimirlo).",
+    )
+    parser.add_argument(
+        "--compact",
+        "--compacto",
+        dest="compact",
+        action="store_true",
+        help="Escribe el JSON del resultado sin sangria ni espacios.",
+    )
+    parser.add_argument(
+        "--serializer",
+        "--serializador",
+        dest="serializer",
+        choices=SERIALIZER_BACKENDS,
+        default="json",
+        help=(
+            "Serializador del JSON del resultado. 'orjson' es mas rapido pero escribe NaN como null, "
+            "los flotantes pequenos sin exponente y el texto no ASCII sin escapar; 'auto' lo usa si esta instalado."
+        ),
     )
     parser.add_argument(
         "--export-rfem-stub",
@@ -34,6 +75,46 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Incluye en la salida JSON la carga simulada para la futura integracion con RFEM 6.",
     )
+    parser.add_argument(
+        "--batch",
+        "--lote",
+        dest="batch",
+        action="store_true",
+        help=(
+            "Lee la entrada como NDJSON o arreglo JSON ('-' para stdin) y escribe una linea JSON compacta "
+            "por registro en stdout o en --salida. Con un archivo .csv escribe un CSV de resultados en --salida. "
+            "El campo 'id' se copia a cada resultado."
+        ),
+    )
+    parser.add_argument(
+        "--coupled",
+        "--acoplado",
+        dest="coupled",
+        action="store_true",
+        help=(
+            "Calcula concrete_stress_at_tendon a partir de la fuerza efectiva usando section_area (m2), "
+            "section_inertia (m4) y external_moment (kN m) del archivo de entrada."
+        ),
+    )
+    parser.add_argument(
+        "--sensitivities",
+        "--sensibilidades",
+        dest="sensitivities",
+        action="store_true",
+        help="Incluye las derivadas de la fuerza final respecto de cada parametro, ordenadas por impacto.",
+    )
+    parser.add_argument(
+        "--cache",
+        metavar="DIRECTORIO",
+        help="Directorio de cache en disco: reutiliza el resultado si la entrada no cambio.",
+    )
+    parser.add_argument(
+        "--stats",
+        "--estadisticas",
+        dest="stats",
+        action="store_true",
+        help="Imprime por la salida de error los aciertos y fallos de la cache (requiere --cache).",
+    )
     parser.add_argument(
         "--probar-conexion-rfem",
         action="store_true",
@@ -98,21 +179,213 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def build_sweep_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="pt-losses sweep",
+        description="Barrido parametrico de perdidas sobre el producto cartesiano de los rangos indicados.",
+    )
+    parser.add_argument(
+        "--input",
+        "--entrada",
+        dest="input",
+        required=True,
+        help="Archivo base JSON o YAML con todos los parametros de entrada.",
+    )
+    parser.add_argument(
+        "--param",
+        "--parametro",
+        dest="params",
+        action="append",
+        default=[],
+        metavar="CLAVE=INICIO:FIN:N|CLAVE=V1,V2,...",
+        help="Parametro a barrer. Puede repetirse, por ejemplo --parametro mu_fric=0.10:0.30:21.",
+    )
+    parser.add_argument(
+        "--output",
+        "--salida",
+        dest="output",
+        required=True,
+        help=(
+            "Archivo de salida .csv o .ndjson/.jsonl escrito por bloques, o directorio .npycols con una "
+            "columna .npy por campo (ver 'pt-losses convertir')."
+        ),
+    )
+    parser.add_argument(
+        "--chunk-size",
+        "--tamano-bloque",
+        dest="chunk_size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="Cantidad de combinaciones evaluadas por bloque vectorizado.",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default="auto",
+        help="Motor de calculo por lotes: numpy, numba (kernel compilado) o auto.",
+    )
+    return parser
+
+
+def build_project_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="pt-losses proyecto",
+        description="Importa tendones a un proyecto SQLite, recalcula los modificados y consulta resultados.",
+    )
+    parser.add_argument("project", metavar="PROYECTO", help="Archivo del proyecto (.db, .sqlite o .sqlite3).")
+    parser.add_argument(
+        "--import",
+        "--importar",
+        dest="imports",
+        action="append",
+        default=[],
+        metavar="ARCHIVO",
+        help="Archivo CSV, NDJSON, arreglo JSON o YAML con tendones (clave 'id'). Puede repetirse.",
+    )
+    parser.add_argument(
+        "--calculate",
+        "--calcular",
+        dest="calculate",
+        action="store_true",
+        help="Recalcula solo los tendones nuevos o modificados.",
+    )
+    parser.add_argument(
+        "--query",
+        "--consultar",
+        dest="query",
+        action="store_true",
+        help="Escribe una linea JSON por tendon con resultado que cumpla los filtros.",
+    )
+    parser.add_argument("--min-eta-total", "--eta-min", dest="min_eta_total", type=float, help="Filtro eta_total > valor.")
+    parser.add_argument("--group", "--grupo", dest="group", help="Filtro por grupo de tendones.")
+    parser.add_argument("--member", "--miembro", dest="member", type=int, help="Filtro por numero de miembro RFEM.")
+    parser.add_argument("--material", help="Filtro por nombre de material.")
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default="auto",
+        help="Motor de calculo por lotes: numpy, numba (kernel compilado) o auto.",
+    )
+    return parser
+
+
+def build_convert_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="pt-losses convertir",
+        description="Convierte un archivo columnar .npycols (barridos, Monte Carlo) a CSV o NDJSON por bloques.",
+    )
+    parser.add_argument("source", metavar="ARCHIVO", help="Directorio .npycols con manifest.json.")
+    parser.add_argument("output", metavar="SALIDA", help="Archivo .csv o .ndjson/.jsonl de destino.")
+    parser.add_argument(
+        "--chunk-size",
+        "--tamano-bloque",
+        dest="chunk_size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="Cantidad de filas convertidas por bloque.",
+    )
+    return parser
+
+
+def build_watch_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="pt-losses watch",
+        description=(
+            "Vigila un directorio de entradas JSON/YAML y recalcula solo los archivos modificados, "
+            "reescribiendo su resultado e imprimiendo el cambio de eta_total y de la fuerza final."
+        ),
+    )
+    parser.add_argument("directory", metavar="DIRECTORIO", help="Directorio con los archivos de entrada.")
+    parser.add_argument(
+        "--output",
+        "--salida",
+        dest="output",
+        help="Directorio de resultados (por defecto DIRECTORIO/resultados).",
+    )
+    parser.add_argument(
+        "--interval",
+        "--intervalo",
+        dest="interval",
+        type=float,
+        default=DEFAULT_INTERVAL,
+        help="Segundos entre revisiones del directorio.",
+    )
+    parser.add_argument(
+        "--debounce",
+        "--espera",
+        dest="debounce",
+        type=float,
+        default=DEFAULT_DEBOUNCE,
+        help="Segundos sin cambios antes de recalcular, para agrupar guardados seguidos.",
+    )
+    parser.add_argument(
+        "--once",
+        "--una-vez",
+        dest="once",
+        action="store_true",
+        help="Calcula todos los archivos una vez y termina.",
+    )
+    return parser
+
+
 def run(argv: list[str] | None = None) -> int:
+    arguments = sys.argv[1:] if argv is None else list(argv)
+    if arguments and arguments[0] in SUBCOMMANDS:
+        return SUBCOMMANDS[arguments[0]](arguments[1:])
+
     parser = build_parser()
-    args = parser.parse_args(argv)
+    args = parser.parse_args(arguments)
+    if args.stats and not args.cache:
+        parser.error("--stats requiere --cache.")
+    if args.batch:
+        return run_batch(args, parser)
 
-    losses_input = load_input_file(args.input)
-    result = calculate_losses(losses_input)
-    payloads = build_rfem_load_payload(result)
+    try:
+        serializer = JsonSerializer(compact=args.compact, backend=args.serializer)
+    except ValueError as error:
+        parser.error(str(error))
 
-    payload: dict[str, object] = result.to_nested_dict()
+    mapping = load_input_mapping(args.input)
+    losses_input = LossesInput.from_mapping(mapping)
+    coupling: dict[str, object] | None = None
+    if args.coupled:
+        missing = [key for key in SECTION_KEYS[:2] if key not in mapping]
+        if missing:
+            parser.error(f"El modo acoplado requiere {', '.join(missing)} en el archivo de entrada.")
+        solution = solve_coupled(
+            columns_from_inputs([losses_input]),
+            section_area=float(mapping["section_area"]),
+            section_inertia=float(mapping["section_inertia"]),
+            external_moment=float(mapping.get("external_moment", 0.0)),
+        )
+        losses_input = replace(losses_input, concrete_stress_at_tendon_mpa=float(solution.concrete_stress_mpa[0]))
+        coupling = {
+            "tension_hormigon_MPa": losses_input.concrete_stress_at_tendon_mpa,
+            "convergido": bool(solution.converged[0]),
+            "iteraciones": int(solution.iterations[0]),
+        }
+    if args.cache:
+        cache = DiskCache(args.cache)
+        payload: dict[str, object] = cache.nested_result(losses_input)
+        if args.stats:
+            print(json.dumps({"cache": cache.stats.to_dict()}, sort_keys=True), file=sys.stderr)
+    else:
+        payload = calculate_losses(losses_input).to_nested_dict()
+    if args.export_rfem_stub or args.aplicar_en_rfem:
+        payloads = build_rfem_load_payload(calculate_losses(losses_input))
+    if coupling is not None:
+        payload["acoplamiento"] = coupling
     if args.export_rfem_stub:
         payload["rfem_stub"] = Rfem6AdapterStub().export_axial_strain_states(
             tendon_id=Path(args.input).stem,
             payloads=payloads,
         )
 
+    if args.sensitivities:
+        tornado = calculate_sensitivities(columns_from_inputs([losses_input])).tornado()
+        payload["sensibilidades"] = tornado
+        print(format_tornado(tornado, "fuerza_final_total_kN"), file=sys.stderr)
+
     if args.probar_conexion_rfem:
         adapter = Rfem6ApiAdapter(api_key_name=args.api_key_name, port=args.puerto_rfem)
         payload["rfem_conexion"] = adapter.probar_conexion()
@@ -135,11 +408,151 @@ def run(argv: list[str] | None = None) -> int:
             member_load_start_no=args.inicio_cargas_miembro_rfem,
         )
 
-    rendered = json.dumps(payload, indent=2, sort_keys=True)
-    print(rendered)
+    rendered = serializer.dumps(payload)
+    write_stdout(rendered)
 
     if args.output:
-        write_result_file(args.output, payload)
+        write_bytes(args.output, rendered)
+
+    return 0
+
+
+def run_batch(args: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    incompatible = [
+        flag
+        for flag, enabled in (
+            ("--exportar-rfem-stub", args.export_rfem_stub),
+            ("--probar-conexion-rfem", args.probar_conexion_rfem),
+            ("--aplicar-en-rfem", args.aplicar_en_rfem),
+            ("--acoplado", args.coupled),
+            ("--sensibilidades", args.sensitivities),
+            ("--cache", bool(args.cache)),
+        )
+        if enabled
+    ]
+    if incompatible:
+        parser.error(f"--batch no admite {', '.join(incompatible)}.")
+
+    suffix = Path(args.input).suffix.lower()
+    if suffix == ".csv":
+        if not args.output:
+            parser.error("Debes indicar --salida para procesar un archivo CSV por lotes.")
+        rows = process_csv_file(args.input, args.output)
+        print(json.dumps({"filas": rows, "salida": str(args.output)}, sort_keys=True))
+        return 0
+
+    with ExitStack() as stack:
+        if suffix in {".yaml", ".yml"}:
+            records = iter_input_mappings(args.input)
+        else:
+            source = sys.stdin if args.input == "-" else stack.enter_context(open(args.input, encoding="utf-8"))
+            records = iter_json_records(source)
+        if args.output:
+            target_path = Path(args.output)
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+            target = stack.enter_context(target_path.open("w", encoding="utf-8", newline="\n"))
+        else:
+            target = sys.stdout
+        stream_batch(records, target.write)
+    return 0
+
+
+def run_sweep(argv: list[str]) -> int:
+    parser = build_sweep_parser()
+    args = parser.parse_args(argv)
+    if Path(args.output).suffix.lower() not in SWEEP_OUTPUT_EXTENSIONS:
+        parser.error(f"--salida debe terminar en {', '.join(sorted(SWEEP_OUTPUT_EXTENSIONS))}.")
+
+    try:
+        axes = [SweepAxis.parse(spec) for spec in args.params]
+    except ValueError as error:
+        parser.error(str(error))
+
+    try:
+        backend = resolve_backend(args.backend)
+    except ValueError as error:
+        parser.error(str(error))
+
+    rows = write_sweep(args.output, load_input_mapping(args.input), axes, chunk_size=args.chunk_size, backend=backend)
+    print(json.dumps({"filas": rows, "salida": str(args.output)}, sort_keys=True))
+    return 0
+
 
+def run_project(argv: list[str]) -> int:
+    parser = build_project_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        backend = resolve_backend(args.backend)
+        store = ProjectStore(args.project)
+    except ValueError as error:
+        parser.error(str(error))
+
+    with store:
+        try:
+            imported = sum(store.add_tendons(iter_source_records(path)) for path in args.imports)
+        except (FileNotFoundError, KeyError, ValueError) as error:
+            message = error.args[0] if isinstance(error, KeyError) and error.args else error
+            parser.error(f"No se pudo importar: {message}")
+        recalculated = store.recalculate(backend=backend) if args.calculate else 0
+        summary = {
+            "importados": imported,
+            "recalculados": recalculated,
+            "pendientes": store.dirty_count(),
+            "tendones": store.tendon_count(),
+        }
+        if not args.query:
+            print(json.dumps(summary, sort_keys=True))
+            return 0
+        for row in store.query_results(
+            min_eta_total=args.min_eta_total,
+            tendon_group=args.group,
+            member_no=args.member,
+            material=args.material,
+        ):
+            sys.stdout.write(json.dumps(row, separators=(",", ":")) + "\n")
+        print(json.dumps(summary, sort_keys=True), file=sys.stderr)
+    return 0
+
+
+def run_convert(argv: list[str]) -> int:
+    parser = build_convert_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        rows = convert_archive(args.source, args.output, chunk_size=args.chunk_size)
+    except (FileNotFoundError, ValueError) as error:
+        parser.error(str(error))
+    print(json.dumps({"filas": rows, "salida": str(args.output)}, sort_keys=True))
     return 0
 
+
+def run_watch(argv: list[str]) -> int:
+    parser = build_watch_parser()
+    args = parser.parse_args(argv)
+    if args.interval <= 0 or args.debounce < 0:
+        parser.error("--intervalo debe ser mayor que cero y --espera no puede ser negativo.")
+
+    try:
+        watcher = DirectoryWatcher(args.directory, args.output, debounce=0.0 if args.once else args.debounce)
+    except NotADirectoryError as error:
+        parser.error(str(error))
+
+    if args.once:
+        for line in watcher.poll():
+            print(line)
+        return 0
+    print(f"Vigilando {watcher.directory} (Ctrl+C para salir).", file=sys.stderr)
+    try:
+        watcher.run(interval=args.interval, echo=lambda line: print(line, flush=True))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+SUBCOMMANDS = {
+    "sweep": run_sweep,
+    "proyecto": run_project,
+    "convertir": run_convert,
+    "watch": run_watch,
+}
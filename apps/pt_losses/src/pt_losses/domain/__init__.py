@@ -1,12 +1,25 @@
 from pt_losses.domain.materials import ConcreteMaterial, PrestressingSteel
-from pt_losses.domain.models import LossComponents, LossesInput, LossesResult, RfemStrainState
+from pt_losses.domain.models import (
+    INPUT_KEYS,
+    RESULT_FIELDS,
+    LossComponents,
+    LossesInput,
+    LossesResult,
+    LossesResultBatch,
+    LossesResultRow,
+    RfemStrainState,
+)
 from pt_losses.domain.tendon_geometry import TendonGeometry
 
 __all__ = [
+    "INPUT_KEYS",
+    "RESULT_FIELDS",
     "ConcreteMaterial",
     "LossComponents",
     "LossesInput",
     "LossesResult",
+    "LossesResultBatch",
+    "LossesResultRow",
     "PrestressingSteel",
     "RfemStrainState",
     "TendonGeometry",
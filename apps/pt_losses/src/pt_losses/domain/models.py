@@ -1,11 +1,64 @@
 from __future__ import annotations
 
+import math
+import operator
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+from numpy.typing import ArrayLike
 
 from pt_losses.domain.materials import ConcreteMaterial, PrestressingSteel
 from pt_losses.domain.tendon_geometry import TendonGeometry
 
 
+INPUT_KEYS: tuple[str, ...] = (
+    "Ep",
+    "Ec",
+    "fpk",
+    "fp01k",
+    "fc",
+    "Ap",
+    "n_tendons",
+    "tendon_length",
+    "theta_total",
+    "eccentricity",
+    "mu_tesado",
+    "mu_fric",
+    "k_wobble",
+    "anchorage_slip_mm",
+    "concrete_stress_at_tendon",
+    "creep_coeff",
+    "shrinkage_strain",
+    "relaxation_loss_ratio",
+)
+
+RESULT_FIELDS: tuple[tuple[str, str], ...] = (
+    ("sigma_max_mpa", "tension_maxima_MPa"),
+    ("sigma_0_mpa", "tension_inicial_MPa"),
+    ("sigma_inf_mpa", "tension_final_MPa"),
+    ("eta_fr", "eta_fr"),
+    ("eta_anc", "eta_anc"),
+    ("eta_el", "eta_el"),
+    ("eta_rel", "eta_rel"),
+    ("eta_flu", "eta_flu"),
+    ("eta_ret", "eta_ret"),
+    ("eta_total", "eta_total"),
+    ("t0_percent", "T0_percent"),
+    ("tinf_percent", "Tinf_percent"),
+    ("t0_permille", "T0_por_mil"),
+    ("tinf_permille", "Tinf_por_mil"),
+    ("initial_force_per_tendon_kn", "fuerza_inicial_por_tendon_kN"),
+    ("initial_force_total_kn", "fuerza_inicial_total_kN"),
+    ("final_force_per_tendon_kn", "fuerza_final_por_tendon_kN"),
+    ("final_force_total_kn", "fuerza_final_total_kN"),
+)
+
+_LOSS_KEYS = ("eta_fr", "eta_anc", "eta_el", "eta_rel", "eta_flu", "eta_ret", "eta_total")
+_RFEM_KEYS = ("T0_percent", "Tinf_percent", "T0_por_mil", "Tinf_por_mil")
+
+
 @dataclass(frozen=True, slots=True)
 class LossesInput:
     steel: PrestressingSteel
@@ -42,7 +95,7 @@ class LossesInput:
             raise ValueError("shrinkage_strain no puede ser negativo.")
 
     @classmethod
-    def from_mapping(cls, data: dict[str, float]) -> "LossesInput":
+    def from_mapping(cls, data: Mapping[str, Any]) -> "LossesInput":
         return cls(
             steel=PrestressingSteel(
                 elastic_modulus_mpa=float(data["Ep"]),
@@ -53,13 +106,7 @@ class LossesInput:
                 elastic_modulus_mpa=float(data["Ec"]),
                 compressive_strength_mpa=float(data["fc"]),
             ),
-            geometry=TendonGeometry(
-                area_mm2=float(data["Ap"]),
-                count=int(data["n_tendons"]),
-                length_m=float(data["tendon_length"]),
-                theta_total_rad=float(data["theta_total"]),
-                eccentricity_m=float(data["eccentricity"]),
-            ),
+            geometry=_geometry_from_mapping(data),
             mu_tesado=float(data["mu_tesado"]),
             mu_fric=float(data["mu_fric"]),
             k_wobble=float(data["k_wobble"]),
@@ -70,6 +117,52 @@ class LossesInput:
             relaxation_loss_ratio=float(data["relaxation_loss_ratio"]),
         )
 
+    def to_mapping(self) -> dict[str, Any]:
+        mapping: dict[str, Any] = {
+            "Ep": self.steel.elastic_modulus_mpa,
+            "Ec": self.concrete.elastic_modulus_mpa,
+            "fpk": self.steel.characteristic_strength_mpa,
+            "fp01k": self.steel.proof_strength_mpa,
+            "fc": self.concrete.compressive_strength_mpa,
+            "Ap": self.geometry.area_mm2,
+            "n_tendons": self.geometry.count,
+            "tendon_length": self.geometry.length_m,
+            "theta_total": self.geometry.theta_total_rad,
+            "eccentricity": self.geometry.eccentricity_m,
+            "mu_tesado": self.mu_tesado,
+            "mu_fric": self.mu_fric,
+            "k_wobble": self.k_wobble,
+            "anchorage_slip_mm": self.anchorage_slip_mm,
+            "concrete_stress_at_tendon": self.concrete_stress_at_tendon_mpa,
+            "creep_coeff": self.creep_coeff,
+            "shrinkage_strain": self.shrinkage_strain,
+            "relaxation_loss_ratio": self.relaxation_loss_ratio,
+        }
+        if self.geometry.segments:
+            mapping["tendon_segments"] = [list(segment) for segment in self.geometry.segments]
+        return mapping
+
+
+def _geometry_from_mapping(data: Mapping[str, Any]) -> TendonGeometry:
+    raw_segments = data.get("tendon_segments")
+    if not raw_segments:
+        return TendonGeometry(
+            area_mm2=float(data["Ap"]),
+            count=int(data["n_tendons"]),
+            length_m=float(data["tendon_length"]),
+            theta_total_rad=float(data["theta_total"]),
+            eccentricity_m=float(data["eccentricity"]),
+        )
+    segments = tuple((float(length), float(angle)) for length, angle in raw_segments)
+    return TendonGeometry(
+        area_mm2=float(data["Ap"]),
+        count=int(data["n_tendons"]),
+        length_m=float(data.get("tendon_length", math.fsum(length for length, _ in segments))),
+        theta_total_rad=float(data.get("theta_total", math.fsum(angle for _, angle in segments))),
+        eccentricity_m=float(data["eccentricity"]),
+        segments=segments,
+    )
+
 
 @dataclass(frozen=True, slots=True)
 class LossComponents:
@@ -143,3 +236,201 @@ class LossesResult:
                 "Tinf_por_mil": self.rfem.tinf_permille,
             },
         }
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class LossesResultBatch:
+    """Struct-of-arrays results: one contiguous float64 column per field."""
+
+    sigma_max_mpa: np.ndarray
+    sigma_0_mpa: np.ndarray
+    sigma_inf_mpa: np.ndarray
+    eta_fr: np.ndarray
+    eta_anc: np.ndarray
+    eta_el: np.ndarray
+    eta_rel: np.ndarray
+    eta_flu: np.ndarray
+    eta_ret: np.ndarray
+    eta_total: np.ndarray
+    t0_percent: np.ndarray
+    tinf_percent: np.ndarray
+    t0_permille: np.ndarray
+    tinf_permille: np.ndarray
+    initial_force_per_tendon_kn: np.ndarray
+    initial_force_total_kn: np.ndarray
+    final_force_per_tendon_kn: np.ndarray
+    final_force_total_kn: np.ndarray
+
+    def __post_init__(self) -> None:
+        size: int | None = None
+        for name, _ in RESULT_FIELDS:
+            column = np.ascontiguousarray(getattr(self, name), dtype=np.float64)
+            if column.ndim != 1:
+                raise ValueError(f"La columna {name} debe ser unidimensional.")
+            if size is None:
+                size = column.shape[0]
+            elif column.shape[0] != size:
+                raise ValueError("Todas las columnas del lote deben tener la misma longitud.")
+            object.__setattr__(self, name, column)
+
+    @classmethod
+    def from_columns(cls, columns: Mapping[str, ArrayLike]) -> "LossesResultBatch":
+        return cls(**{name: columns[name] for name, _ in RESULT_FIELDS})
+
+    @classmethod
+    def from_results(cls, results: Iterable[LossesResult]) -> "LossesResultBatch":
+        rows = [_flatten_result(result) for result in results]
+        matrix = np.array(rows, dtype=np.float64).reshape(len(rows), len(RESULT_FIELDS))
+        return cls(**{name: matrix[:, position] for position, (name, _) in enumerate(RESULT_FIELDS)})
+
+    @classmethod
+    def concatenate(cls, batches: Sequence["LossesResultBatch"]) -> "LossesResultBatch":
+        if not batches:
+            return cls.empty()
+        return cls(**{name: np.concatenate([getattr(batch, name) for batch in batches]) for name, _ in RESULT_FIELDS})
+
+    @classmethod
+    def empty(cls) -> "LossesResultBatch":
+        return cls(**{name: np.empty(0) for name, _ in RESULT_FIELDS})
+
+    def __len__(self) -> int:
+        return int(self.eta_total.shape[0])
+
+    def __getitem__(self, key: int | slice | ArrayLike) -> "LossesResultRow | LossesResultBatch":
+        if isinstance(key, (int, np.integer)):
+            index = operator.index(key)
+            size = len(self)
+            if index < 0:
+                index += size
+            if not 0 <= index < size:
+                raise IndexError("Indice de fila fuera de rango.")
+            return LossesResultRow(self, index)
+        return LossesResultBatch(**{name: getattr(self, name)[key] for name, _ in RESULT_FIELDS})
+
+    def __iter__(self) -> Iterator["LossesResultRow"]:
+        for index in range(len(self)):
+            yield LossesResultRow(self, index)
+
+    def columns(self) -> dict[str, np.ndarray]:
+        return {name: getattr(self, name) for name, _ in RESULT_FIELDS}
+
+    def iter_dicts(self) -> Iterator[dict[str, float]]:
+        for row in self:
+            yield row.to_dict()
+
+    def iter_nested_dicts(self) -> Iterator[dict[str, object]]:
+        for row in self:
+            yield row.to_nested_dict()
+
+
+class LossesResultRow:
+    """Read-only view over one row of a ``LossesResultBatch``, shaped like ``LossesResult``."""
+
+    __slots__ = ("_batch", "_index")
+
+    def __init__(self, batch: LossesResultBatch, index: int) -> None:
+        self._batch = batch
+        self._index = index
+
+    def _value(self, name: str) -> float:
+        return float(getattr(self._batch, name)[self._index])
+
+    @property
+    def index(self) -> int:
+        return self._index
+
+    @property
+    def sigma_max_mpa(self) -> float:
+        return self._value("sigma_max_mpa")
+
+    @property
+    def sigma_0_mpa(self) -> float:
+        return self._value("sigma_0_mpa")
+
+    @property
+    def sigma_inf_mpa(self) -> float:
+        return self._value("sigma_inf_mpa")
+
+    @property
+    def losses(self) -> LossComponents:
+        return LossComponents(
+            eta_fr=self._value("eta_fr"),
+            eta_anc=self._value("eta_anc"),
+            eta_el=self._value("eta_el"),
+            eta_rel=self._value("eta_rel"),
+            eta_flu=self._value("eta_flu"),
+            eta_ret=self._value("eta_ret"),
+            eta_total=self._value("eta_total"),
+        )
+
+    @property
+    def rfem(self) -> RfemStrainState:
+        return RfemStrainState(
+            t0_percent=self._value("t0_percent"),
+            tinf_percent=self._value("tinf_percent"),
+            t0_permille=self._value("t0_permille"),
+            tinf_permille=self._value("tinf_permille"),
+        )
+
+    @property
+    def initial_force_per_tendon_kn(self) -> float:
+        return self._value("initial_force_per_tendon_kn")
+
+    @property
+    def initial_force_total_kn(self) -> float:
+        return self._value("initial_force_total_kn")
+
+    @property
+    def final_force_per_tendon_kn(self) -> float:
+        return self._value("final_force_per_tendon_kn")
+
+    @property
+    def final_force_total_kn(self) -> float:
+        return self._value("final_force_total_kn")
+
+    def to_result(self) -> LossesResult:
+        return LossesResult(
+            sigma_max_mpa=self.sigma_max_mpa,
+            sigma_0_mpa=self.sigma_0_mpa,
+            sigma_inf_mpa=self.sigma_inf_mpa,
+            losses=self.losses,
+            rfem=self.rfem,
+            initial_force_per_tendon_kn=self.initial_force_per_tendon_kn,
+            initial_force_total_kn=self.initial_force_total_kn,
+            final_force_per_tendon_kn=self.final_force_per_tendon_kn,
+            final_force_total_kn=self.final_force_total_kn,
+        )
+
+    def to_dict(self) -> dict[str, float]:
+        return {key: self._value(name) for name, key in RESULT_FIELDS}
+
+    def to_nested_dict(self) -> dict[str, object]:
+        summary = self.to_dict()
+        return {
+            "resumen": summary,
+            "perdidas": {key: summary[key] for key in _LOSS_KEYS},
+            "rfem": {key: summary[key] for key in _RFEM_KEYS},
+        }
+
+
+def _flatten_result(result: LossesResult) -> tuple[float, ...]:
+    return (
+        result.sigma_max_mpa,
+        result.sigma_0_mpa,
+        result.sigma_inf_mpa,
+        result.losses.eta_fr,
+        result.losses.eta_anc,
+        result.losses.eta_el,
+        result.losses.eta_rel,
+        result.losses.eta_flu,
+        result.losses.eta_ret,
+        result.losses.eta_total,
+        result.rfem.t0_percent,
+        result.rfem.tinf_percent,
+        result.rfem.t0_permille,
+        result.rfem.tinf_permille,
+        result.initial_force_per_tendon_kn,
+        result.initial_force_total_kn,
+        result.final_force_per_tendon_kn,
+        result.final_force_total_kn,
+    )
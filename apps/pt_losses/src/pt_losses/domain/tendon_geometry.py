@@ -1,17 +1,25 @@
 from __future__ import annotations
 
+import math
+from collections.abc import Iterable
 from dataclasses import dataclass
 
 
 @dataclass(frozen=True, slots=True)
 class TendonGeometry:
-    """Tendon geometry and layout data."""
+    """Tendon geometry and layout data.
+
+    ``segments`` optionally describes the profile as ``(length_m, theta_rad)``
+    pairs from the live end; their totals must match ``length_m`` and
+    ``theta_total_rad``. An empty tuple means a single uniform segment.
+    """
 
     area_mm2: float
     count: int
     length_m: float
     theta_total_rad: float
     eccentricity_m: float
+    segments: tuple[tuple[float, float], ...] = ()
 
     def __post_init__(self) -> None:
         if self.area_mm2 <= 0:
@@ -24,7 +32,42 @@ class TendonGeometry:
             raise ValueError("theta_total no puede ser negativo.")
         if self.eccentricity_m < 0:
             raise ValueError("eccentricity no puede ser negativo.")
+        if self.segments:
+            self._validate_segments()
+
+    @classmethod
+    def from_segments(
+        cls,
+        area_mm2: float,
+        count: int,
+        segments: Iterable[tuple[float, float]],
+        eccentricity_m: float,
+    ) -> "TendonGeometry":
+        normalized = tuple((float(length), float(angle)) for length, angle in segments)
+        return cls(
+            area_mm2=area_mm2,
+            count=count,
+            length_m=math.fsum(length for length, _ in normalized),
+            theta_total_rad=math.fsum(angle for _, angle in normalized),
+            eccentricity_m=eccentricity_m,
+            segments=normalized,
+        )
+
+    @property
+    def profile(self) -> tuple[tuple[float, float], ...]:
+        return self.segments or ((self.length_m, self.theta_total_rad),)
 
     @property
     def length_mm(self) -> float:
         return self.length_m * 1000.0
+
+    def _validate_segments(self) -> None:
+        for length, angle in self.segments:
+            if length <= 0:
+                raise ValueError("La longitud de cada tramo del tendon debe ser mayor que cero.")
+            if angle < 0:
+                raise ValueError("El angulo de cada tramo del tendon no puede ser negativo.")
+        if not math.isclose(math.fsum(length for length, _ in self.segments), self.length_m, rel_tol=1e-9, abs_tol=1e-9):
+            raise ValueError("La suma de los tramos no coincide con tendon_length.")
+        if not math.isclose(math.fsum(angle for _, angle in self.segments), self.theta_total_rad, rel_tol=1e-9, abs_tol=1e-12):
+            raise ValueError("La suma de los angulos de los tramos no coincide con theta_total.")
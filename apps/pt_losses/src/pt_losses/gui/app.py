@@ -2,6 +2,7 @@
 
 import csv
 import json
+import math
 import os
 import sys
 import tkinter as tk
@@ -11,8 +12,9 @@ from tkinter import filedialog, messagebox, ttk
 
 from pt_losses.adapters.rfem_client import Rfem6ApiAdapter
 from pt_losses.domain.models import LossesInput
-from pt_losses.services.calculator import calculate_losses
-from pt_losses.services.io import load_input_file, write_result_file
+from pt_losses.services.cache import CachedCalculator
+from pt_losses.services.io import RESULT_CSV_FIELDS, load_input_file, write_result_file
+from pt_losses.services.project import PROJECT_SUFFIXES, ProjectStore
 from pt_losses.services.rfem_conversion import build_rfem_load_payload
 
 DEFAULT_INPUT: dict[str, float] = {
@@ -106,6 +108,11 @@ class PtLossesApp:
         self.output_path_var = tk.StringVar(value="Sin archivo cargado")
         self.result_payload: dict[str, object] | None = None
         self.current_result = None
+        self.calculator = CachedCalculator()
+        self.project: ProjectStore | None = None
+        self.project_tendon: str | None = None
+        self.project_tendon_var = tk.StringVar(value="")
+        self.project_tendon_combo: ttk.Combobox | None = None
         self.rfem_model_snapshot: dict[str, object] | None = None
 
         self.rfem_model_var = tk.StringVar()
@@ -363,6 +370,22 @@ class PtLossesApp:
             row=0, column=0, sticky="ew"
         )
 
+        tendon_row = ttk.Frame(parent, style="PanelInner.TFrame")
+        tendon_row.pack(fill="x", pady=(10, 0))
+        tendon_row.columnconfigure(1, weight=1)
+        ttk.Label(tendon_row, text="Tendón del proyecto", style="Body.TLabel").grid(
+            row=0, column=0, sticky="w", padx=(0, 16)
+        )
+        self.project_tendon_combo = ttk.Combobox(
+            tendon_row,
+            textvariable=self.project_tendon_var,
+            values=[],
+            state="disabled",
+            width=26,
+        )
+        self.project_tendon_combo.grid(row=0, column=1, sticky="ew")
+        self.project_tendon_combo.bind("<<ComboboxSelected>>", self.select_project_tendon)
+
         ttk.Label(parent, textvariable=self.output_path_var, style="Body.TLabel", wraplength=500).pack(
             anchor="w", pady=(12, 0)
         )
@@ -593,6 +616,8 @@ class PtLossesApp:
             self.variables[key].set(str(value))
         self.result_payload = None
         self.current_result = None
+        self.calculator.clear()
+        self._close_project()
         self.rfem_model_snapshot = None
         self.rfem_members_var.set("")
         self.rfem_member_count_var.set("-")
@@ -634,15 +659,86 @@ class PtLossesApp:
     def load_file(self) -> None:
         selected_file = filedialog.askopenfilename(
             title="Seleccionar archivo de entrada",
-            filetypes=[("Archivos de entrada", "*.json *.yaml *.yml"), ("Todos los archivos", "*.*")],
+            filetypes=[
+                ("Archivos de entrada", "*.json *.yaml *.yml"),
+                ("Proyectos", "*.db *.sqlite *.sqlite3"),
+                ("Todos los archivos", "*.*"),
+            ],
         )
         if not selected_file:
             return
+        if Path(selected_file).suffix.lower() in PROJECT_SUFFIXES:
+            self._load_project(Path(selected_file))
+            return
         self._load_mapping_from_path(Path(selected_file))
 
+    def _load_project(self, path: Path) -> None:
+        project: ProjectStore | None = None
+        try:
+            project = ProjectStore(path)
+            recalculated = project.recalculate()
+            names = project.tendon_names()
+            if not names:
+                raise ValueError("El proyecto no contiene tendones.")
+        except Exception as error:
+            if project is not None:
+                project.close()
+            messagebox.showerror("No se pudo abrir el proyecto", str(error))
+            return
+
+        self._close_project()
+        self.project = project
+        if self.project_tendon_combo is not None:
+            self.project_tendon_combo.configure(values=names, state="readonly")
+        self.project_tendon_var.set(names[0])
+        self._show_project_tendon(names[0])
+        self.output_path_var.set(
+            f"Proyecto cargado: {path} ({len(names)} tendones, {recalculated} recalculados). "
+            f"Tendón en el formulario: {names[0]}"
+        )
+
+    def select_project_tendon(self, _event: object = None) -> None:
+        name = self.project_tendon_var.get()
+        if self.project is None or not name or name == self.project_tendon:
+            return
+        self._show_project_tendon(name)
+        self.output_path_var.set(f"Tendón en el formulario: {name}")
+
+    def _show_project_tendon(self, name: str) -> None:
+        try:
+            mapping = self.project.input_mapping(name)
+        except KeyError as error:
+            messagebox.showerror("Proyecto", str(error.args[0] if error.args else error))
+            return
+        self.project_tendon = name
+        for key, value in mapping.items():
+            self.variables[key].set(str(value))
+        self.calculate()
+
+    def _close_project(self) -> None:
+        if self.project is not None:
+            self.project.close()
+        self.project = None
+        self.project_tendon = None
+        self.project_tendon_var.set("")
+        if self.project_tendon_combo is not None:
+            self.project_tendon_combo.configure(values=[], state="disabled")
+
+    def _form_matches_project_tendon(self) -> bool:
+        """True when the form still holds the values of the project tendon it was loaded from."""
+        if self.project is None or self.project_tendon is None:
+            return False
+        try:
+            form = self._mapping_from_form()
+            stored = self.project.input_mapping(self.project_tendon)
+        except (KeyError, ValueError):
+            return False
+        return all(math.isclose(float(form[key]), float(value)) for key, value in stored.items())
+
     def _load_mapping_from_path(self, path: Path) -> None:
         try:
             loss_input = load_input_file(path)
+            self._close_project()
             mapping = {
                 "Ep": loss_input.steel.elastic_modulus_mpa,
                 "Ec": loss_input.concrete.elastic_modulus_mpa,
@@ -673,7 +769,7 @@ class PtLossesApp:
     def calculate(self) -> None:
         try:
             mapping = self._mapping_from_form()
-            result = calculate_losses(LossesInput.from_mapping(mapping))
+            result = self.calculator(LossesInput.from_mapping(mapping))
         except Exception as error:
             messagebox.showerror("Error de cálculo", str(error))
             return
@@ -799,9 +895,17 @@ class PtLossesApp:
         if self.result_payload is None:
             self.result_payload = self.current_result.to_nested_dict()
         self.result_payload["rfem_real"] = rfem_result
+        recorded = self._form_matches_project_tendon()
+        if recorded:
+            self.project.record_rfem_application(
+                self.project_tendon, rfem_result, model_path=self.rfem_model_var.get().strip() or None
+            )
         self._write_text(self.rfem_text, self._build_rfem_text(rfem_result))
         casos = rfem_result.get("casos", [])
-        self.rfem_status_var.set(f"Aplicación exitosa en RFEM. Se generaron {len(casos)} estados sobre los tendones detectados.")
+        status = f"Aplicación exitosa en RFEM. Se generaron {len(casos)} estados sobre los tendones detectados."
+        if self.project is not None and not recorded:
+            status += f" No se registró en el proyecto: el formulario ya no coincide con el tendón {self.project_tendon}."
+        self.rfem_status_var.set(status)
         self._save_settings()
         messagebox.showinfo("RFEM", "Los estados de postensado se aplicaron correctamente en RFEM.")
     def save_output(self) -> None:
@@ -833,28 +937,9 @@ class PtLossesApp:
         if not selected_file:
             return
 
-        resumen = self.result_payload.get("resumen", {})
-        perdidas = self.result_payload.get("perdidas", {})
-        rfem = self.result_payload.get("rfem", {})
         rows = [
-            ("tension_maxima_MPa", resumen.get("tension_maxima_MPa", "")),
-            ("tension_inicial_MPa", resumen.get("tension_inicial_MPa", "")),
-            ("tension_final_MPa", resumen.get("tension_final_MPa", "")),
-            ("fuerza_inicial_por_tendon_kN", resumen.get("fuerza_inicial_por_tendon_kN", "")),
-            ("fuerza_final_por_tendon_kN", resumen.get("fuerza_final_por_tendon_kN", "")),
-            ("fuerza_inicial_total_kN", resumen.get("fuerza_inicial_total_kN", "")),
-            ("fuerza_final_total_kN", resumen.get("fuerza_final_total_kN", "")),
-            ("eta_fr", perdidas.get("eta_fr", "")),
-            ("eta_anc", perdidas.get("eta_anc", "")),
-            ("eta_el", perdidas.get("eta_el", "")),
-            ("eta_rel", perdidas.get("eta_rel", "")),
-            ("eta_flu", perdidas.get("eta_flu", "")),
-            ("eta_ret", perdidas.get("eta_ret", "")),
-            ("eta_total", perdidas.get("eta_total", "")),
-            ("T0_percent", rfem.get("T0_percent", "")),
-            ("Tinf_percent", rfem.get("Tinf_percent", "")),
-            ("T0_por_mil", rfem.get("T0_por_mil", "")),
-            ("Tinf_por_mil", rfem.get("Tinf_por_mil", "")),
+            (key, self.result_payload.get(section, {}).get(key, ""))
+            for section, key in RESULT_CSV_FIELDS
         ]
 
         try:
@@ -1037,6 +1122,7 @@ class PtLossesApp:
     def _handle_close(self) -> None:
         try:
             self._save_settings()
+            self._close_project()
         finally:
             self.root.destroy()
 
@@ -1,3 +1,3 @@
-from pt_losses.services.calculator import calculate_losses
+from pt_losses.services.calculator import calculate_losses, calculate_losses_batch
 
-__all__ = ["calculate_losses"]
+__all__ = ["calculate_losses", "calculate_losses_batch"]
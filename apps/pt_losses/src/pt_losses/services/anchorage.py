@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+
+ANCHORAGE_MODES = ("influencia", "uniforme")
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class AnchorageSetResult:
+    """Stress profiles before and after lock-off, one row per tendon."""
+
+    x_m: np.ndarray
+    stress_before_mpa: np.ndarray
+    stress_after_mpa: np.ndarray
+    influence_length_m: np.ndarray
+    eta_anc: np.ndarray
+    mode: str
+
+
+def solve_anchorage_set(
+    x_m: ArrayLike,
+    stress_mpa: ArrayLike,
+    slip_mm: ArrayLike,
+    ep_mpa: ArrayLike,
+    sigma_0_mpa: ArrayLike | None = None,
+    mode: str = "influencia",
+) -> AnchorageSetResult:
+    """Apply wedge draw-in at the live end (``x = 0``) of discretized friction profiles.
+
+    In ``influencia`` mode the loss is confined to the influence length ``l``
+    where twice the area between the friction curve and ``sigma(l)`` equals
+    ``Ep * slip``. The station holding the root is bracketed on the cumulative
+    area, and inside it the stress is linear, so the root has a closed form. If
+    the area over the whole tendon is not enough, the remaining drop is spread
+    uniformly. ``uniforme`` mode reproduces the simplified ``Ep * slip / L``
+    loss used by ``calculate_losses``. In both modes ``eta_anc`` is the loss at
+    the anchor divided by ``sigma_0`` (the stress at ``x = 0`` by default).
+    """
+    if mode not in ANCHORAGE_MODES:
+        raise ValueError("El modo de anclaje debe ser 'influencia' o 'uniforme'.")
+    stress = np.atleast_2d(np.asarray(stress_mpa, dtype=np.float64))
+    x = np.broadcast_to(np.atleast_2d(np.asarray(x_m, dtype=np.float64)), stress.shape)
+    rows, stations = stress.shape
+    if stations < 2:
+        raise ValueError("Se necesitan al menos dos estaciones por tendon.")
+    x = x - x[:, :1]
+    length = x[:, -1]
+    if np.any(length <= 0):
+        raise ValueError("La longitud de cada perfil debe ser mayor que cero.")
+    slip = np.broadcast_to(np.asarray(slip_mm, dtype=np.float64), (rows,))
+    ep = np.broadcast_to(np.asarray(ep_mpa, dtype=np.float64), (rows,))
+    target = ep * slip / 1000.0
+
+    if mode == "uniforme":
+        after = stress - (target / length)[:, None]
+        influence = length.copy()
+    else:
+        after, influence = _influence_profile(x, stress, target, length)
+
+    np.maximum(after, 0.0, out=after)
+    sigma_0 = stress[:, 0] if sigma_0_mpa is None else np.broadcast_to(np.asarray(sigma_0_mpa, dtype=np.float64), (rows,))
+    live_end_loss = stress[:, 0] - after[:, 0]
+    eta_anc = np.divide(live_end_loss, sigma_0, out=np.zeros(rows), where=sigma_0 > 0)
+    return AnchorageSetResult(
+        x_m=x,
+        stress_before_mpa=stress,
+        stress_after_mpa=after,
+        influence_length_m=influence,
+        eta_anc=eta_anc,
+        mode=mode,
+    )
+
+
+def _influence_profile(
+    x: np.ndarray,
+    stress: np.ndarray,
+    target: np.ndarray,
+    length: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    rows, stations = stress.shape
+    row_index = np.arange(rows)
+    dx = np.diff(x, axis=1)
+    cumulative = np.zeros_like(stress)
+    np.cumsum(0.5 * (stress[:, 1:] + stress[:, :-1]) * dx, axis=1, out=cumulative[:, 1:])
+    # Twice the area between the friction curve and its value at each station.
+    area = 2.0 * (cumulative - stress * x)
+
+    upper = np.clip(np.count_nonzero(area < target[:, None], axis=1), 1, stations - 1)
+    lower = upper - 1
+    x0 = x[row_index, lower]
+    s0 = stress[row_index, lower]
+    slope = (stress[row_index, upper] - s0) / (x[row_index, upper] - x0)
+    decay = -slope
+    remaining = target - area[row_index, lower]
+    step = np.zeros(rows)
+    solvable = decay > 0
+    step[solvable] = -x0[solvable] + np.sqrt(
+        x0[solvable] ** 2 + np.maximum(remaining[solvable], 0.0) / decay[solvable]
+    )
+    influence = np.minimum(x0 + step, length)
+    sigma_at_influence = s0 + slope * (influence - x0)
+
+    after = np.where(x < influence[:, None], 2.0 * sigma_at_influence[:, None] - stress, stress)
+
+    beyond = target > area[:, -1]
+    if np.any(beyond):
+        excess = (target[beyond] - area[beyond, -1]) / length[beyond]
+        after[beyond] = 2.0 * stress[beyond, -1:] - stress[beyond] - excess[:, None]
+        influence[beyond] = length[beyond]
+
+    idle = target <= 0
+    after[idle] = stress[idle]
+    influence[idle] = 0.0
+    return after, influence
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import csv
+import json
+import os
+from collections.abc import Iterator, Mapping, Sequence
+from pathlib import Path
+from typing import Any, BinaryIO
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from pt_losses.domain.models import RESULT_FIELDS, LossesResultBatch
+
+
+ARCHIVE_SUFFIX = ".npycols"
+MANIFEST_NAME = "manifest.json"
+ARCHIVE_FORMAT = "pt-losses-columnas"
+ARCHIVE_VERSION = 1
+CONVERT_EXTENSIONS = {".csv", ".ndjson", ".jsonl"}
+DEFAULT_CHUNK_SIZE = 65536
+
+_DTYPE = np.dtype("<f8")
+# Fixed-size .npy v1.0 header, so the row count can be rewritten in place on close.
+_HEADER_SIZE = 128
+_RESULT_KEYS = dict(RESULT_FIELDS)
+
+
+class ColumnArchiveWriter:
+    """Append float64 columns chunk by chunk to a directory of ``.npy`` files.
+
+    Each column is a plain ``.npy`` file whose header is rewritten with the
+    final row count on ``close``; the ``manifest.json`` is written last, so an
+    interrupted run leaves no manifest and cannot be opened by mistake.
+    """
+
+    def __init__(self, path: str | Path, columns: Sequence[str]) -> None:
+        if not columns:
+            raise ValueError("El archivo columnar necesita al menos una columna.")
+        if len(set(columns)) != len(columns):
+            raise ValueError("Las columnas del archivo columnar no pueden repetirse.")
+        self.path = Path(path)
+        self.columns = tuple(columns)
+        self.rows = 0
+        self.path.mkdir(parents=True, exist_ok=True)
+        (self.path / MANIFEST_NAME).unlink(missing_ok=True)
+        self._handles: dict[str, BinaryIO] = {}
+        for name in self.columns:
+            handle = (self.path / f"{name}.npy").open("wb")
+            handle.write(_npy_header(0))
+            self._handles[name] = handle
+
+    def __enter__(self) -> "ColumnArchiveWriter":
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *_: object) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    @property
+    def closed(self) -> bool:
+        return not self._handles
+
+    def append(self, columns: Mapping[str, ArrayLike]) -> None:
+        if self.closed:
+            raise ValueError("El archivo columnar ya esta cerrado.")
+        missing = [name for name in self.columns if name not in columns]
+        if missing:
+            raise KeyError(f"Faltan columnas para el archivo columnar: {', '.join(missing)}")
+        arrays = np.broadcast_arrays(*(np.atleast_1d(np.asarray(columns[name], dtype=_DTYPE)) for name in self.columns))
+        if arrays[0].ndim != 1:
+            raise ValueError("Las columnas del archivo columnar deben ser unidimensionales.")
+        for name, values in zip(self.columns, arrays):
+            self._handles[name].write(np.ascontiguousarray(values).data)
+        self.rows += arrays[0].shape[0]
+
+    def append_results(self, results: LossesResultBatch, parameters: Mapping[str, ArrayLike] | None = None) -> None:
+        self.append({**(parameters or {}), **results.columns()})
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        for handle in self._handles.values():
+            handle.seek(0)
+            handle.write(_npy_header(self.rows))
+            handle.close()
+        self._handles = {}
+        manifest = {
+            "formato": ARCHIVE_FORMAT,
+            "version": ARCHIVE_VERSION,
+            "filas": self.rows,
+            "dtype": _DTYPE.str,
+            "columnas": list(self.columns),
+        }
+        temporary = self.path / f".{MANIFEST_NAME}.tmp"
+        temporary.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        os.replace(temporary, self.path / MANIFEST_NAME)
+
+    def abort(self) -> None:
+        """Close the column files without a manifest, leaving the archive unreadable."""
+        for handle in self._handles.values():
+            handle.close()
+        self._handles = {}
+
+
+class ColumnArchive:
+    """Read side of ``ColumnArchiveWriter``: every column is opened lazily as a read-only memmap."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        manifest_path = self.path / MANIFEST_NAME
+        if not manifest_path.exists():
+            raise FileNotFoundError(f"No se encontro el manifiesto del archivo columnar: {manifest_path}")
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if manifest.get("formato") != ARCHIVE_FORMAT or manifest.get("version") != ARCHIVE_VERSION:
+            raise ValueError(f"Formato de archivo columnar no soportado: {manifest_path}")
+        self.rows = int(manifest["filas"])
+        self.columns = tuple(manifest["columnas"])
+        self._cache: dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def column(self, name: str) -> np.ndarray:
+        cached = self._cache.get(name)
+        if cached is None:
+            if name not in self.columns:
+                raise KeyError(f"El archivo columnar no tiene la columna {name}.")
+            cached = np.load(self.path / f"{name}.npy", mmap_mode="r")
+            if cached.shape != (self.rows,):
+                raise ValueError(f"La columna {name} no coincide con el manifiesto.")
+            self._cache[name] = cached
+        return cached
+
+    @property
+    def parameter_names(self) -> tuple[str, ...]:
+        return tuple(name for name in self.columns if name not in _RESULT_KEYS)
+
+    def parameters(self) -> dict[str, np.ndarray]:
+        return {name: self.column(name) for name in self.parameter_names}
+
+    def results(self) -> LossesResultBatch:
+        """Struct-of-arrays view backed by the memmaps; nothing is read until a column is used."""
+        return LossesResultBatch.from_columns({name: self.column(name) for name in _RESULT_KEYS})
+
+    def iter_chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[dict[str, np.ndarray]]:
+        if chunk_size <= 0:
+            raise ValueError("El tamano de bloque debe ser mayor que cero.")
+        columns = {name: self.column(name) for name in self.columns}
+        for start in range(0, self.rows, chunk_size):
+            yield {name: np.asarray(values[start : start + chunk_size]) for name, values in columns.items()}
+
+
+def open_archive(path: str | Path) -> ColumnArchive:
+    return ColumnArchive(path)
+
+
+def convert_archive(source: str | Path, target: str | Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """Write an archive as CSV or NDJSON with the sweep headers; returns the rows written."""
+    archive = open_archive(source)
+    destination = Path(target)
+    suffix = destination.suffix.lower()
+    if suffix not in CONVERT_EXTENSIONS:
+        raise ValueError(f"Formato de conversion no soportado: {destination.suffix}")
+    destination.parent.mkdir(parents=True, exist_ok=True)
+
+    header = [_RESULT_KEYS.get(name, name) for name in archive.columns]
+    written = 0
+    with destination.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle) if suffix == ".csv" else None
+        if writer is not None:
+            writer.writerow(header)
+        for chunk in archive.iter_chunks(chunk_size):
+            rows = zip(*(_python_column(name, values) for name, values in chunk.items()))
+            if writer is not None:
+                writer.writerows(rows)
+            else:
+                handle.writelines(json.dumps(dict(zip(header, row)), separators=(",", ":")) + "\n" for row in rows)
+            written += len(chunk[archive.columns[0]])
+    return written
+
+
+def _python_column(name: str, values: np.ndarray) -> list[Any]:
+    if name == "n_tendons":
+        return values.astype(np.int64).tolist()
+    return values.tolist()
+
+
+def _npy_header(rows: int) -> bytes:
+    fields = f"{{'descr': '{_DTYPE.str}', 'fortran_order': False, 'shape': ({rows},), }}"
+    prefix = b"\x93NUMPY\x01\x00" + (_HEADER_SIZE - 10).to_bytes(2, "little")
+    return prefix + fields.ljust(_HEADER_SIZE - 11).encode("latin1") + b"\n"
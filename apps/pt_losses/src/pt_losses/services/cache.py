@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from pt_losses.domain.models import INPUT_KEYS, LossesInput, LossesResult
+from pt_losses.services.calculator import calculate_losses, columns_from_inputs
+
+
+DEFAULT_MAX_SIZE = 1024
+DEFAULT_DISK_MAX_ENTRIES = 100_000
+# Part of every disk cache key: bump it whenever a formula changes so old entries stop matching.
+CALCULATOR_VERSION = "0.1.0"
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+        return self.hits / lookups
+
+    def to_dict(self) -> dict[str, float]:
+        return {
+            "aciertos": self.hits,
+            "fallos": self.misses,
+            "desalojos": self.evictions,
+            "entradas": self.size,
+            "capacidad": self.max_size,
+            "tasa_aciertos": self.hit_rate,
+        }
+
+
+class CachedCalculator:
+    """Opt-in ``calculate_losses`` memoized on the frozen ``LossesInput`` with a bounded LRU."""
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        if max_size <= 0:
+            raise ValueError("El tamano maximo de la cache debe ser mayor que cero.")
+        self.max_size = max_size
+        self._entries: OrderedDict[LossesInput, LossesResult] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __call__(self, loss_input: LossesInput) -> LossesResult:
+        return self.calculate(loss_input)
+
+    def calculate(self, loss_input: LossesInput) -> LossesResult:
+        cached = self._entries.get(loss_input)
+        if cached is not None:
+            self._entries.move_to_end(loss_input)
+            self._hits += 1
+            return cached
+
+        self._misses += 1
+        result = calculate_losses(loss_input)
+        self._entries[loss_input] = result
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+        return result
+
+    def clear(self) -> None:
+        """Drop every entry and start the hit, miss and eviction counts again."""
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            size=len(self._entries),
+            max_size=self.max_size,
+        )
+
+
+def input_digest(loss_input: LossesInput, version: str = CALCULATOR_VERSION) -> str:
+    """SHA-256 of the canonical input (``INPUT_KEYS`` as floats, sorted) and the calculator version."""
+    columns = columns_from_inputs([loss_input])
+    canonical = {key: float(columns[key][0]) for key in INPUT_KEYS}
+    text = json.dumps({"entrada": canonical, "version": version}, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class DiskCache:
+    """Directory of ``to_nested_dict`` payloads addressed by ``input_digest``.
+
+    Entries are written to a temporary file and moved into place with
+    ``os.replace``, so concurrent runs never read a partial file. A hit touches
+    the file's mtime, and once the store holds more than ``max_entries`` files
+    the least recently used ones are removed.
+    """
+
+    SUFFIX = ".json"
+
+    def __init__(self, directory: str | Path, max_entries: int = DEFAULT_DISK_MAX_ENTRIES) -> None:
+        if max_entries <= 0:
+            raise ValueError("El tamano maximo de la cache debe ser mayor que cero.")
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+        self._size: int | None = None
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def nested_result(self, loss_input: LossesInput) -> dict[str, Any]:
+        key = input_digest(loss_input)
+        cached = self.get(key)
+        if cached is not None:
+            self._hits += 1
+            return cached
+
+        self._misses += 1
+        payload = calculate_losses(loss_input).to_nested_dict()
+        self.put(key, payload)
+        return payload
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        path = self._path(key)
+        try:
+            with path.open("r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            self._discard(path)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return payload
+
+    def put(self, key: str, payload: dict[str, Any]) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if self._size is None:
+            self._size = self._count()
+        existed = path.exists()
+        descriptor, temporary = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=self.SUFFIX)
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle, separators=(",", ":"))
+            os.replace(temporary, path)
+        except BaseException:
+            Path(temporary).unlink(missing_ok=True)
+            raise
+        if not existed:
+            self._size += 1
+        if self._size > self.max_entries:
+            self._evict()
+
+    def clear(self) -> None:
+        for path in self._entries():
+            path.unlink(missing_ok=True)
+        self._size = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            size=self._count() if self._size is None else self._size,
+            max_size=self.max_entries,
+        )
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}{self.SUFFIX}"
+
+    def _entries(self) -> list[Path]:
+        if not self.directory.exists():
+            return []
+        return [path for path in self.directory.glob(f"??/*{self.SUFFIX}") if not path.name.startswith(".")]
+
+    def _count(self) -> int:
+        return len(self._entries())
+
+    def _discard(self, path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            return
+        if self._size is not None:
+            self._size -= 1
+
+    def _evict(self) -> None:
+        aged = []
+        for path in self._entries():
+            try:
+                aged.append((path.stat().st_mtime_ns, path))
+            except OSError:
+                continue
+        aged.sort()
+        excess = len(aged) - self.max_entries
+        for _, path in aged[: max(excess, 0)]:
+            path.unlink(missing_ok=True)
+            self._evictions += 1
+        self._size = min(len(aged), self.max_entries)
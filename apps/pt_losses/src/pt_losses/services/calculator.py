@@ -1,8 +1,21 @@
 from __future__ import annotations
 
 import math
+from collections.abc import Mapping, Sequence
 
-from pt_losses.domain.models import LossComponents, LossesInput, LossesResult, RfemStrainState
+import numpy as np
+from numpy.typing import ArrayLike
+
+from pt_losses.domain.models import (
+    INPUT_KEYS,
+    LossComponents,
+    LossesInput,
+    LossesResult,
+    LossesResultBatch,
+    RfemStrainState,
+)
+from pt_losses.services.kernels import evaluate_fused, resolve_backend
+from pt_losses.services.validation import ON_INVALID_MODES, validate_columns
 
 
 MAX_TOTAL_LOSS_RATIO = 0.99
@@ -54,6 +67,135 @@ def calculate_losses(loss_input: LossesInput) -> LossesResult:
     )
 
 
+def calculate_losses_batch(
+    columns: Mapping[str, ArrayLike],
+    deduplicate: bool = False,
+    backend: str = "numpy",
+    on_invalid: str | None = None,
+) -> LossesResultBatch:
+    """Vectorized counterpart of ``calculate_losses`` over columnar inputs.
+
+    ``columns`` uses the same keys as ``LossesInput.from_mapping``; scalars are
+    broadcast against the array columns. With ``deduplicate`` only the unique
+    input rows are evaluated and their results are scattered back. ``backend``
+    selects the NumPy pipeline or the fused kernel of ``services.kernels``
+    (``auto`` takes numba when it is installed).
+
+    Inputs are not checked unless ``on_invalid`` is given: ``raise`` fails with
+    the validation summary, ``skip`` drops the invalid rows from the result and
+    ``mask`` keeps every row but fills the invalid ones with NaN.
+    """
+    evaluate = _evaluate_batch if resolve_backend(backend) == "numpy" else _evaluate_fused
+    data = broadcast_columns(columns)
+    valid = None if on_invalid is None else _valid_rows(data, on_invalid)
+    if valid is not None:
+        data = {key: values[valid] for key, values in data.items()}
+    if deduplicate:
+        unique_data, inverse = _unique_rows(data)
+        results = evaluate(data) if inverse is None else evaluate(unique_data)[inverse]
+    else:
+        results = evaluate(data)
+    if valid is not None and on_invalid == "mask":
+        return _scatter_rows(results, valid)
+    return results
+
+
+def _valid_rows(data: dict[str, np.ndarray], on_invalid: str) -> np.ndarray | None:
+    if on_invalid not in ON_INVALID_MODES:
+        raise ValueError("on_invalid debe ser 'raise', 'skip' o 'mask'.")
+    report = validate_columns(data)
+    if report.is_valid:
+        return None
+    if on_invalid == "raise":
+        raise ValueError(f"Entradas invalidas:\n{report.summary()}")
+    return report.valid
+
+
+def _scatter_rows(results: LossesResultBatch, valid: np.ndarray) -> LossesResultBatch:
+    columns = {}
+    for name, values in results.columns().items():
+        column = np.full(valid.shape[0], np.nan)
+        column[valid] = values
+        columns[name] = column
+    return LossesResultBatch.from_columns(columns)
+
+
+def _evaluate_fused(data: dict[str, np.ndarray]) -> LossesResultBatch:
+    return LossesResultBatch(**evaluate_fused(data, MAX_TOTAL_LOSS_RATIO))
+
+
+def _evaluate_batch(data: dict[str, np.ndarray]) -> LossesResultBatch:
+    ep = data["Ep"]
+    area_mm2 = data["Ap"]
+    count = data["n_tendons"]
+
+    sigma_max = np.minimum(0.80 * data["fpk"], 0.94 * data["fp01k"])
+    sigma_0 = data["mu_tesado"] * sigma_max
+
+    eta_fr = 1.0 - np.exp(-(data["mu_fric"] * data["theta_total"] + data["k_wobble"] * data["tendon_length"]))
+    anchorage_mpa = ep * (data["anchorage_slip_mm"] / (data["tendon_length"] * 1000.0))
+    elastic_mpa = ep * (data["concrete_stress_at_tendon"] / data["Ec"])
+    creep_mpa = ep * data["creep_coeff"] * (data["concrete_stress_at_tendon"] / data["Ec"])
+    shrinkage_mpa = ep * data["shrinkage_strain"]
+    eta_anc = _safe_ratio_array(anchorage_mpa, sigma_0)
+    eta_el = _safe_ratio_array(elastic_mpa, sigma_0)
+    eta_flu = _safe_ratio_array(creep_mpa, sigma_0)
+    eta_ret = _safe_ratio_array(shrinkage_mpa, sigma_0)
+    eta_rel = data["relaxation_loss_ratio"]
+
+    eta_total = np.minimum(eta_fr + eta_anc + eta_el + eta_rel + eta_flu + eta_ret, MAX_TOTAL_LOSS_RATIO)
+    sigma_inf = sigma_0 * (1.0 - eta_total)
+
+    t0_percent = -(sigma_0 / ep) * 100.0
+    tinf_percent = -(sigma_inf / ep) * 100.0
+
+    initial_force_per_tendon_kn = _stress_to_force_kn(sigma_0, area_mm2)
+    final_force_per_tendon_kn = _stress_to_force_kn(sigma_inf, area_mm2)
+
+    return LossesResultBatch(
+        sigma_max_mpa=sigma_max,
+        sigma_0_mpa=sigma_0,
+        sigma_inf_mpa=sigma_inf,
+        eta_fr=eta_fr,
+        eta_anc=eta_anc,
+        eta_el=eta_el,
+        eta_rel=eta_rel.copy(),
+        eta_flu=eta_flu,
+        eta_ret=eta_ret,
+        eta_total=eta_total,
+        t0_percent=t0_percent,
+        tinf_percent=tinf_percent,
+        t0_permille=t0_percent * 10.0,
+        tinf_permille=tinf_percent * 10.0,
+        initial_force_per_tendon_kn=initial_force_per_tendon_kn,
+        initial_force_total_kn=initial_force_per_tendon_kn * count,
+        final_force_per_tendon_kn=final_force_per_tendon_kn,
+        final_force_total_kn=final_force_per_tendon_kn * count,
+    )
+
+
+def columns_from_inputs(inputs: Sequence[LossesInput]) -> dict[str, np.ndarray]:
+    """Stack ``LossesInput`` objects into the columns read by ``calculate_losses_batch``."""
+    matrix = np.array(
+        [[mapping[key] for key in INPUT_KEYS] for mapping in (item.to_mapping() for item in inputs)],
+        dtype=np.float64,
+    ).reshape(len(inputs), len(INPUT_KEYS))
+    return {key: matrix[:, position] for position, key in enumerate(INPUT_KEYS)}
+
+
+def broadcast_columns(columns: Mapping[str, ArrayLike]) -> dict[str, np.ndarray]:
+    """Validate the key set and broadcast every input column to a common float64 shape."""
+    missing = [key for key in INPUT_KEYS if key not in columns]
+    if missing:
+        raise KeyError(f"Faltan columnas de entrada: {', '.join(missing)}")
+    arrays = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(columns[key], dtype=np.float64)) for key in INPUT_KEYS)
+    )
+    data = {key: np.ascontiguousarray(array) for key, array in zip(INPUT_KEYS, arrays)}
+    data["n_tendons"] = np.trunc(data["n_tendons"])
+    return data
+
+
 def _calculate_friction_loss(loss_input: LossesInput) -> float:
     exponent = -(
         loss_input.mu_fric * loss_input.geometry.theta_total_rad
@@ -92,5 +234,19 @@ def _safe_ratio(numerator: float, denominator: float) -> float:
     return numerator / denominator
 
 
+def _safe_ratio_array(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    positive = denominator > 0
+    return np.divide(numerator, denominator, out=np.zeros_like(numerator), where=positive)
+
+
+def _unique_rows(data: dict[str, np.ndarray]) -> tuple[dict[str, np.ndarray], np.ndarray | None]:
+    matrix = np.column_stack([data[key] for key in INPUT_KEYS])
+    unique, inverse = np.unique(matrix, axis=0, return_inverse=True)
+    if unique.shape[0] == matrix.shape[0]:
+        return data, None
+    unique_data = {key: np.ascontiguousarray(unique[:, position]) for position, key in enumerate(INPUT_KEYS)}
+    return unique_data, inverse.reshape(-1)
+
+
 def _stress_to_force_kn(stress_mpa: float, area_mm2: float) -> float:
     return (stress_mpa * area_mm2) / 1000.0
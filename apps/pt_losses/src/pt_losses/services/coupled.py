@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from pt_losses.domain.models import LossesResultBatch
+from pt_losses.services.calculator import broadcast_columns, calculate_losses_batch
+
+
+SECTION_KEYS = ("section_area", "section_inertia", "external_moment")
+DEFAULT_TOLERANCE = 1e-9
+DEFAULT_MAX_ITERATIONS = 50
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class CoupledSolution:
+    """Converged concrete stress at the tendon and the losses evaluated with it.
+
+    ``iterations`` counts the fixed-point updates spent per row; rows that hit
+    the iteration cap keep their last iterate and ``converged = False``.
+    """
+
+    concrete_stress_mpa: np.ndarray
+    converged: np.ndarray
+    iterations: np.ndarray
+    results: LossesResultBatch
+
+
+def concrete_stress_from_force(
+    force_kn: ArrayLike,
+    section_area_m2: ArrayLike,
+    section_inertia_m4: ArrayLike,
+    eccentricity_m: ArrayLike,
+    external_moment_knm: ArrayLike = 0.0,
+) -> np.ndarray:
+    """Compression at the tendon level, ``P/A + P*e^2/I - M*e/I`` in MPa, floored at zero.
+
+    ``external_moment_knm`` is positive when it opens the tendon side (sagging
+    with the tendon below the centroid).
+    """
+    force = np.asarray(force_kn, dtype=np.float64)
+    eccentricity = np.asarray(eccentricity_m, dtype=np.float64)
+    inertia = np.asarray(section_inertia_m4, dtype=np.float64)
+    stress_kpa = (
+        force / np.asarray(section_area_m2, dtype=np.float64)
+        + force * eccentricity**2 / inertia
+        - np.asarray(external_moment_knm, dtype=np.float64) * eccentricity / inertia
+    )
+    return np.maximum(stress_kpa / 1000.0, 0.0)
+
+
+def solve_coupled(
+    columns: Mapping[str, ArrayLike],
+    section_area: ArrayLike,
+    section_inertia: ArrayLike,
+    external_moment: ArrayLike = 0.0,
+    tolerance: float = DEFAULT_TOLERANCE,
+    max_iterations: int = DEFAULT_MAX_ITERATIONS,
+    accelerate: bool = True,
+) -> CoupledSolution:
+    """Iterate ``concrete_stress_at_tendon`` against the final prestress force until it is consistent.
+
+    The stress produced by the effective force ``final_force_total_kN`` feeds
+    the elastic and creep losses, which in turn change that force. The
+    supplied ``concrete_stress_at_tendon`` is the starting point. With
+    ``accelerate`` every update is an Aitken delta-squared extrapolation of two
+    plain steps, which is exact while the loss cap is not active. Only rows
+    still pending are re-evaluated.
+    """
+    data = broadcast_columns(columns)
+    rows = data["Ep"].shape[0]
+    area, inertia, moment = (
+        np.broadcast_to(np.asarray(value, dtype=np.float64), (rows,)) for value in (section_area, section_inertia, external_moment)
+    )
+    if np.any(area <= 0):
+        raise ValueError("section_area debe ser mayor que cero.")
+    if np.any(inertia <= 0):
+        raise ValueError("section_inertia debe ser mayor que cero.")
+
+    stress = data["concrete_stress_at_tendon"].copy()
+    converged = np.zeros(rows, dtype=bool)
+    iterations = np.zeros(rows, dtype=np.int64)
+    pending = np.arange(rows)
+    for _ in range(max_iterations):
+        if pending.size == 0:
+            break
+        subset = {key: values[pending] for key, values in data.items()}
+
+        def update(current: np.ndarray) -> np.ndarray:
+            force = calculate_losses_batch({**subset, "concrete_stress_at_tendon": current}).final_force_total_kn
+            return concrete_stress_from_force(
+                force, area[pending], inertia[pending], subset["eccentricity"], moment[pending]
+            )
+
+        current = stress[pending]
+        first = update(current)
+        following = first
+        if accelerate:
+            second = update(first)
+            curvature = second - 2.0 * first + current
+            usable = np.abs(curvature) > 1e-12 * np.maximum(1.0, np.abs(current))
+            following = np.where(
+                usable,
+                second - (second - first) ** 2 / np.where(usable, curvature, 1.0),
+                second,
+            )
+            following = np.maximum(following, 0.0)
+
+        iterations[pending] += 1
+        done = np.abs(first - current) <= tolerance * np.maximum(1.0, np.abs(current))
+        stress[pending] = np.where(done, current, following)
+        converged[pending[done]] = True
+        pending = pending[~done]
+
+    results = calculate_losses_batch({**data, "concrete_stress_at_tendon": stress})
+    return CoupledSolution(concrete_stress_mpa=stress, converged=converged, iterations=iterations, results=results)
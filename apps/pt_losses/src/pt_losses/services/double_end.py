@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from pt_losses.services.anchorage import solve_anchorage_set
+from pt_losses.services.calculator import broadcast_columns
+from pt_losses.services.friction_profile import uniform_friction_profiles
+
+
+DEFAULT_STATIONS = 201
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class DoubleEndResult:
+    """Lock-off profiles of tendons stressed from both anchors, one row per tendon.
+
+    Stations are measured from the left anchor. Each point keeps the stress
+    delivered by the anchor that governs it, so ``envelope_mpa`` is the larger
+    of the two one-end profiles and its minimum is the low point.
+    """
+
+    x_m: np.ndarray
+    stress_left_mpa: np.ndarray
+    stress_right_mpa: np.ndarray
+    envelope_mpa: np.ndarray
+    influence_left_m: np.ndarray
+    influence_right_m: np.ndarray
+    low_point_m: np.ndarray
+    low_point_stress_mpa: np.ndarray
+    average_stress_mpa: np.ndarray
+    average_force_total_kn: np.ndarray
+
+    def to_dict(self, row: int = 0) -> dict[str, float]:
+        return {
+            "punto_bajo_m": float(self.low_point_m[row]),
+            "tension_punto_bajo_MPa": float(self.low_point_stress_mpa[row]),
+            "tension_media_MPa": float(self.average_stress_mpa[row]),
+            "fuerza_media_total_kN": float(self.average_force_total_kn[row]),
+            "longitud_influencia_izquierda_m": float(self.influence_left_m[row]),
+            "longitud_influencia_derecha_m": float(self.influence_right_m[row]),
+        }
+
+
+def double_end_envelope(
+    x_m: ArrayLike,
+    stress_from_left_mpa: ArrayLike,
+    stress_from_right_mpa: ArrayLike,
+    slip_mm: ArrayLike,
+    ep_mpa: ArrayLike,
+    force_per_mpa_kn: ArrayLike = 0.0,
+    mode: str = "influencia",
+) -> DoubleEndResult:
+    """Combine two friction profiles, each already on the stations measured from the left anchor.
+
+    Anchorage set is applied to each profile at its own anchor before the
+    envelope is taken. ``force_per_mpa_kn`` (``n * Ap / 1000``) converts the
+    average stress into the average total force.
+    """
+    left = np.atleast_2d(np.asarray(stress_from_left_mpa, dtype=np.float64))
+    right = np.atleast_2d(np.asarray(stress_from_right_mpa, dtype=np.float64))
+    x = np.broadcast_to(np.atleast_2d(np.asarray(x_m, dtype=np.float64)), left.shape)
+    x = x - x[:, :1]
+    length = x[:, -1:]
+
+    left_set = solve_anchorage_set(x, left, slip_mm, ep_mpa, mode=mode)
+    right_set = solve_anchorage_set(length - x[:, ::-1], right[:, ::-1], slip_mm, ep_mpa, mode=mode)
+    left_after = left_set.stress_after_mpa
+    right_after = right_set.stress_after_mpa[:, ::-1]
+
+    envelope = np.maximum(left_after, right_after)
+    rows = envelope.shape[0]
+    low = np.argmin(envelope, axis=1)
+    average = np.sum(0.5 * (envelope[:, 1:] + envelope[:, :-1]) * np.diff(x, axis=1), axis=1) / length[:, 0]
+    return DoubleEndResult(
+        x_m=x,
+        stress_left_mpa=left_after,
+        stress_right_mpa=right_after,
+        envelope_mpa=envelope,
+        influence_left_m=left_set.influence_length_m,
+        influence_right_m=right_set.influence_length_m,
+        low_point_m=x[np.arange(rows), low],
+        low_point_stress_mpa=envelope[np.arange(rows), low],
+        average_stress_mpa=average,
+        average_force_total_kn=average * np.broadcast_to(np.asarray(force_per_mpa_kn, dtype=np.float64), (rows,)),
+    )
+
+
+def solve_double_end(
+    columns: Mapping[str, ArrayLike],
+    stations: int = DEFAULT_STATIONS,
+    mode: str = "influencia",
+) -> DoubleEndResult:
+    """Double-end stressing for many single-segment tendons given as ``calculate_losses_batch`` columns.
+
+    Both anchors jack to ``sigma_0``. With the angular change spread uniformly,
+    the profile from the right anchor is the left one mirrored.
+    """
+    data = broadcast_columns(columns)
+    sigma_0 = data["mu_tesado"] * np.minimum(0.80 * data["fpk"], 0.94 * data["fp01k"])
+    x, from_left = uniform_friction_profiles(
+        sigma_0, data["mu_fric"], data["theta_total"], data["k_wobble"], data["tendon_length"], stations=stations
+    )
+    return double_end_envelope(
+        x,
+        from_left,
+        from_left[:, ::-1],
+        data["anchorage_slip_mm"],
+        data["Ep"],
+        force_per_mpa_kn=data["n_tendons"] * data["Ap"] / 1000.0,
+        mode=mode,
+    )
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from pt_losses.domain.models import LossesInput
+from pt_losses.domain.tendon_geometry import TendonGeometry
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class FrictionProfile:
+    """Prefix arrays of a segmented tendon for friction queries at any station.
+
+    Stations are measured in metres from the live end. The angular change is
+    assumed uniform within each segment, so a query is a binary search over
+    ``x_nodes_m`` plus one exponential.
+    """
+
+    x_nodes_m: np.ndarray
+    theta_nodes_rad: np.ndarray
+    curvature_rad_per_m: np.ndarray
+    mu_fric: float
+    k_wobble: float
+
+    @classmethod
+    def from_geometry(cls, geometry: TendonGeometry, mu_fric: float, k_wobble: float) -> "FrictionProfile":
+        profile = np.asarray(geometry.profile, dtype=np.float64)
+        lengths = profile[:, 0]
+        angles = profile[:, 1]
+        x_nodes = np.concatenate(([0.0], np.cumsum(lengths)))
+        theta_nodes = np.concatenate(([0.0], np.cumsum(angles)))
+        return cls(
+            x_nodes_m=x_nodes,
+            theta_nodes_rad=theta_nodes,
+            curvature_rad_per_m=angles / lengths,
+            mu_fric=mu_fric,
+            k_wobble=k_wobble,
+        )
+
+    @classmethod
+    def from_input(cls, loss_input: LossesInput) -> "FrictionProfile":
+        return cls.from_geometry(loss_input.geometry, loss_input.mu_fric, loss_input.k_wobble)
+
+    @property
+    def length_m(self) -> float:
+        return float(self.x_nodes_m[-1])
+
+    def angle_at(self, x_m: ArrayLike) -> np.ndarray:
+        stations = self._stations(x_m)
+        segment = np.clip(
+            np.searchsorted(self.x_nodes_m, stations, side="right") - 1,
+            0,
+            self.curvature_rad_per_m.shape[0] - 1,
+        )
+        return self.theta_nodes_rad[segment] + (stations - self.x_nodes_m[segment]) * self.curvature_rad_per_m[segment]
+
+    def loss_ratio_at(self, x_m: ArrayLike) -> np.ndarray:
+        return 1.0 - np.exp(-self._exponent(x_m))
+
+    def stress_at(self, x_m: ArrayLike, sigma_0_mpa: float) -> np.ndarray:
+        return sigma_0_mpa * np.exp(-self._exponent(x_m))
+
+    def _exponent(self, x_m: ArrayLike) -> np.ndarray:
+        stations = self._stations(x_m)
+        return self.mu_fric * self.angle_at(stations) + self.k_wobble * stations
+
+    def _stations(self, x_m: ArrayLike) -> np.ndarray:
+        stations = np.asarray(x_m, dtype=np.float64)
+        tolerance = 1e-9 * max(self.length_m, 1.0)
+        if np.any(stations < -tolerance) or np.any(stations > self.length_m + tolerance):
+            raise ValueError("Las estaciones deben estar entre 0 y la longitud del tendon.")
+        return np.clip(stations, 0.0, self.length_m)
+
+
+def uniform_friction_profiles(
+    sigma_0_mpa: ArrayLike,
+    mu_fric: ArrayLike,
+    theta_total_rad: ArrayLike,
+    k_wobble: ArrayLike,
+    length_m: ArrayLike,
+    stations: int = 101,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Friction stress profiles for many single-segment tendons at once.
+
+    Returns ``(x_m, stress_mpa)`` with shape ``(tendons, stations)``; the angular
+    change is spread uniformly along each tendon.
+    """
+    if stations < 2:
+        raise ValueError("Se necesitan al menos dos estaciones por tendon.")
+    sigma_0, mu, theta, wobble, length = (
+        np.atleast_1d(np.asarray(value, dtype=np.float64))
+        for value in np.broadcast_arrays(sigma_0_mpa, mu_fric, theta_total_rad, k_wobble, length_m)
+    )
+    fraction = np.linspace(0.0, 1.0, stations)
+    x_m = length[:, None] * fraction
+    exponent = (mu * theta)[:, None] * fraction + wobble[:, None] * x_m
+    return x_m, sigma_0[:, None] * np.exp(-exponent)
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from pt_losses.domain.models import INPUT_KEYS, LossesResultBatch
+from pt_losses.services.calculator import calculate_losses_batch
+
+
+SOLVE_MODES = ("mu_tesado", "n_tendons", "ambos")
+DEFAULT_TOLERANCE = 1e-12
+DEFAULT_MAX_ITERATIONS = 100
+WARM_START_STEP = 0.02
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class InverseSolution:
+    """Required ``mu_tesado`` / ``n_tendons`` per row and the results they produce.
+
+    Infeasible rows (the target cannot be reached with ``mu_tesado <= 1``, i.e.
+    within ``sigma_max``) keep ``mu_tesado = 1`` and ``feasible = False``.
+    """
+
+    mu_tesado: np.ndarray
+    n_tendons: np.ndarray
+    feasible: np.ndarray
+    iterations: int
+    results: LossesResultBatch
+
+
+def bracketed_root(
+    function: Callable[[np.ndarray], np.ndarray],
+    lower: ArrayLike,
+    upper: ArrayLike,
+    guess: ArrayLike | None = None,
+    tolerance: float = DEFAULT_TOLERANCE,
+    max_iterations: int = DEFAULT_MAX_ITERATIONS,
+) -> tuple[np.ndarray, int]:
+    """Vectorized Illinois (modified regula falsi) root finder on increasing ``function``.
+
+    Every row must satisfy ``function(lower) <= 0 <= function(upper)``. A
+    ``guess`` (for example the previous solution) narrows each bracket before
+    iterating.
+    """
+    low, high = np.broadcast_arrays(
+        np.array(lower, dtype=np.float64, ndmin=1),
+        np.array(upper, dtype=np.float64, ndmin=1),
+    )
+    f_low = function(low)
+    f_high = function(high)
+    shape = np.broadcast_shapes(low.shape, f_low.shape, f_high.shape)
+    low, high, f_low, f_high = (np.array(np.broadcast_to(value, shape)) for value in (low, high, f_low, f_high))
+    if guess is not None:
+        low, high, f_low, f_high = _warm_start(function, low, high, f_low, f_high, np.asarray(guess, dtype=np.float64))
+
+    root = np.where(f_low >= 0, low, high)
+    pending = (f_low < 0) & (f_high > 0)
+    side = np.zeros(low.shape, dtype=np.int8)
+    iterations = 0
+    while np.any(pending) and iterations < max_iterations:
+        iterations += 1
+        candidate = np.where(pending, high - f_high * (high - low) / np.where(pending, f_high - f_low, 1.0), root)
+        f_candidate = function(candidate)
+        root = np.where(pending, candidate, root)
+
+        move_high = pending & (f_candidate > 0)
+        move_low = pending & (f_candidate < 0)
+        high = np.where(move_high, candidate, high)
+        f_high = np.where(move_high, f_candidate, f_high)
+        low = np.where(move_low, candidate, low)
+        f_low = np.where(move_low, f_candidate, f_low)
+        # Illinois step: halve the retained end when the same side moves twice.
+        f_low = np.where(move_high & (side == 1), 0.5 * f_low, f_low)
+        f_high = np.where(move_low & (side == -1), 0.5 * f_high, f_high)
+        side = np.where(move_high, 1, np.where(move_low, -1, side)).astype(np.int8)
+
+        converged = (f_candidate == 0) | (high - low <= tolerance * np.maximum(1.0, np.abs(candidate)))
+        pending &= ~converged
+    return root, iterations
+
+
+def solve_for_target(
+    columns: Mapping[str, ArrayLike],
+    target_force_kn: ArrayLike | None = None,
+    target_sigma_inf_mpa: ArrayLike | None = None,
+    mode: str = "mu_tesado",
+    guess: ArrayLike | None = None,
+    tolerance: float = DEFAULT_TOLERANCE,
+    max_iterations: int = DEFAULT_MAX_ITERATIONS,
+) -> InverseSolution:
+    """Find the jacking ratio, the minimum tendon count, or both, for a target final state.
+
+    ``mu_tesado`` solves ``final_force_total_kN`` (or ``sigma_inf``) for the
+    jacking ratio with the tendon count fixed. ``n_tendons`` keeps the jacking
+    ratio and returns the smallest count reaching the target force. ``ambos``
+    first takes the smallest count that works at ``mu_tesado = 1``, then
+    solves the ratio for that count. The ``eta_total`` cap is honoured because
+    every evaluation goes through ``calculate_losses_batch``.
+    """
+    if mode not in SOLVE_MODES:
+        raise ValueError("El modo debe ser 'mu_tesado', 'n_tendons' o 'ambos'.")
+    if (target_force_kn is None) == (target_sigma_inf_mpa is None):
+        raise ValueError("Indica exactamente uno de target_force_kn o target_sigma_inf_mpa.")
+    if target_sigma_inf_mpa is not None and mode != "mu_tesado":
+        raise ValueError("Una tension objetivo solo permite resolver mu_tesado.")
+
+    target_name = "final_force_total_kn" if target_force_kn is not None else "sigma_inf_mpa"
+    raw_target = np.atleast_1d(
+        np.asarray(target_force_kn if target_force_kn is not None else target_sigma_inf_mpa, dtype=np.float64)
+    )
+    rows = np.broadcast(raw_target, *(np.atleast_1d(np.asarray(columns[key])) for key in INPUT_KEYS)).shape[0]
+    base = {key: np.broadcast_to(np.asarray(columns[key], dtype=np.float64), (rows,)) for key in INPUT_KEYS}
+    target = np.broadcast_to(raw_target, (rows,))
+    if np.any(target <= 0):
+        raise ValueError("El objetivo debe ser mayor que cero.")
+
+    counts = np.trunc(base["n_tendons"]).astype(np.int64)
+    mu = base["mu_tesado"].copy()
+    if mode in {"n_tendons", "ambos"}:
+        if mode == "ambos":
+            mu = np.ones(rows)
+        per_tendon = calculate_losses_batch({**base, "mu_tesado": mu}).final_force_per_tendon_kn
+        reachable = per_tendon > 0
+        required = np.ceil(target / np.where(reachable, per_tendon, 1.0) * (1.0 - 1e-12))
+        counts = np.where(reachable, np.maximum(required, 1.0), counts).astype(np.int64)
+        feasible = reachable
+    iterations = 0
+    if mode in {"mu_tesado", "ambos"}:
+        solving = {**base, "n_tendons": counts.astype(np.float64)}
+
+        def residual(ratio: np.ndarray) -> np.ndarray:
+            return getattr(calculate_losses_batch({**solving, "mu_tesado": ratio}), target_name) - target
+
+        feasible = residual(np.ones(rows)) >= 0
+        mu, iterations = bracketed_root(
+            residual,
+            lower=np.zeros(rows),
+            upper=np.ones(rows),
+            guess=guess,
+            tolerance=tolerance,
+            max_iterations=max_iterations,
+        )
+        mu = np.where(feasible, np.clip(mu, 0.0, 1.0), 1.0)
+
+    results = calculate_losses_batch({**base, "mu_tesado": mu, "n_tendons": counts.astype(np.float64)})
+    return InverseSolution(
+        mu_tesado=mu,
+        n_tendons=counts,
+        feasible=np.asarray(feasible, dtype=bool),
+        iterations=iterations,
+        results=results,
+    )
+
+
+def _warm_start(
+    function: Callable[[np.ndarray], np.ndarray],
+    low: np.ndarray,
+    high: np.ndarray,
+    f_low: np.ndarray,
+    f_high: np.ndarray,
+    guess: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    step = WARM_START_STEP * (high - low)
+    for probe in (guess, guess - step, guess + step):
+        point = np.clip(np.broadcast_to(probe, low.shape), low, high)
+        value = function(point)
+        tighten_low = (value < 0) & (point > low)
+        tighten_high = (value >= 0) & (point < high)
+        low = np.where(tighten_low, point, low)
+        f_low = np.where(tighten_low, value, f_low)
+        high = np.where(tighten_high, point, high)
+        f_high = np.where(tighten_high, value, f_high)
+    return low, high, f_low, f_high
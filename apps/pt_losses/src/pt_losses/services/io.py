@@ -1,10 +1,19 @@
 from __future__ import annotations
 
+import csv
 import json
+import math
+from collections.abc import Iterator, Mapping
 from pathlib import Path
 from typing import Any
 
-from pt_losses.domain.models import LossesInput
+import numpy as np
+
+from pt_losses.domain.models import RESULT_FIELDS, LossesInput, LossesResultBatch
+from pt_losses.services.calculator import calculate_losses_batch
+from pt_losses.services.schema import DEFAULT_CHUNK_SIZE, InputSchema
+from pt_losses.services.serialization import STREAM_KEY, JsonSerializer
+from pt_losses.services.validation import validate_columns
 
 try:
     import yaml  # type: ignore
@@ -13,9 +22,40 @@ except ModuleNotFoundError:
 
 
 SUPPORTED_EXTENSIONS = {".json", ".yaml", ".yml"}
+PROJECT_DEFAULTS_KEY = "defaults"
+PROJECT_TENDONS_KEY = "tendones"
+CSV_ID_COLUMN = "id"
+CSV_ERROR_COLUMN = "errores"
+
+# Field order of the GUI CSV export, as (section of to_nested_dict, key).
+RESULT_CSV_FIELDS: tuple[tuple[str, str], ...] = (
+    ("resumen", "tension_maxima_MPa"),
+    ("resumen", "tension_inicial_MPa"),
+    ("resumen", "tension_final_MPa"),
+    ("resumen", "fuerza_inicial_por_tendon_kN"),
+    ("resumen", "fuerza_final_por_tendon_kN"),
+    ("resumen", "fuerza_inicial_total_kN"),
+    ("resumen", "fuerza_final_total_kN"),
+    ("perdidas", "eta_fr"),
+    ("perdidas", "eta_anc"),
+    ("perdidas", "eta_el"),
+    ("perdidas", "eta_rel"),
+    ("perdidas", "eta_flu"),
+    ("perdidas", "eta_ret"),
+    ("perdidas", "eta_total"),
+    ("rfem", "T0_percent"),
+    ("rfem", "Tinf_percent"),
+    ("rfem", "T0_por_mil"),
+    ("rfem", "Tinf_por_mil"),
+)
+_CSV_RESULT_ATTRIBUTES = {key: name for name, key in RESULT_FIELDS}
 
 
 def load_input_file(path: str | Path) -> LossesInput:
+    return LossesInput.from_mapping(load_input_mapping(path))
+
+
+def load_input_mapping(path: str | Path) -> dict[str, Any]:
     source = Path(path)
     if not source.exists():
         raise FileNotFoundError(f"No se encontro el archivo de entrada: {source}")
@@ -28,44 +68,237 @@ def load_input_file(path: str | Path) -> LossesInput:
     if not isinstance(data, dict):
         raise ValueError("El archivo de entrada debe contener un objeto o mapa de claves y valores.")
 
-    return LossesInput.from_mapping(data)
+    return data
+
+
+def iter_input_mappings(path: str | Path) -> Iterator[Mapping[str, Any]]:
+    """Yield one input mapping per tendon from a JSON/YAML project file.
+
+    Each ``---`` document is either a single input mapping or a
+    ``defaults:`` + ``tendones:`` layout. Each tendon is flattened once into a
+    plain dict of the defaults updated with its overrides, with the defaults'
+    key order first, so tendons with the same keys share one schema layout.
+    """
+    source = Path(path)
+    if not source.exists():
+        raise FileNotFoundError(f"No se encontro el archivo de entrada: {source}")
+    if source.suffix.lower() not in SUPPORTED_EXTENSIONS:
+        raise ValueError(f"Tipo de archivo no soportado: {source.suffix}")
+
+    with source.open("r", encoding="utf-8") as handle:
+        documents = _parse_documents(handle.read(), source.suffix.lower())
+
+    for document in documents:
+        if not isinstance(document, dict):
+            raise ValueError("Cada documento debe contener un objeto o mapa de claves y valores.")
+        if PROJECT_TENDONS_KEY not in document:
+            yield document
+            continue
+        defaults = document.get(PROJECT_DEFAULTS_KEY) or {}
+        tendons = document[PROJECT_TENDONS_KEY] or []
+        if not isinstance(defaults, dict) or not isinstance(tendons, list):
+            raise ValueError("'defaults' debe ser un mapa y 'tendones' una lista de mapas.")
+        for tendon in tendons:
+            if not isinstance(tendon, dict):
+                raise ValueError("Cada elemento de 'tendones' debe ser un mapa de claves y valores.")
+            yield {**defaults, **tendon}
+
+
+def write_result_file(path: str | Path, payload: dict[str, Any], serializer: JsonSerializer | None = None) -> None:
+    """Write ``payload`` as JSON; ``.gz``/``.xz`` suffixes compress, and an ``rfem_real`` section is streamed."""
+    serializer = serializer or JsonSerializer()
+    if STREAM_KEY in payload:
+        serializer.write_stream(path, payload)
+    else:
+        serializer.write(path, payload)
+
+
+def iter_csv_input_chunks(
+    path: str | Path,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    schema: InputSchema | None = None,
+) -> Iterator[tuple[list[str] | None, dict[str, np.ndarray]]]:
+    """Stream a tendon schedule CSV (one row per tendon) as ``(ids, columns)`` chunks.
 
+    ``ids`` holds the ``id`` column of the chunk when the file has one.
+    """
+    schema = schema or InputSchema()
+    with Path(path).open("r", encoding="utf-8-sig", newline="") as handle:
+        reader = csv.reader(handle)
+        header = [name.strip() for name in next(reader, [])]
+        id_position = header.index(CSV_ID_COLUMN) if CSV_ID_COLUMN in header else None
+        ids: list[str] = []
 
-def write_result_file(path: str | Path, payload: dict[str, Any]) -> None:
+        def rows() -> Iterator[list[str]]:
+            yield header
+            for row in reader:
+                # Empty rows are skipped by the schema, so only record ids of real rows.
+                if row and id_position is not None:
+                    ids.append(row[id_position] if id_position < len(row) else "")
+                yield row
+
+        for columns in schema.iter_csv_columns(rows(), chunk_size=chunk_size):
+            chunk_ids = ids[:] if id_position is not None else None
+            ids.clear()
+            yield chunk_ids, columns
+
+
+def write_results_csv(
+    path: str | Path,
+    chunks: Iterator[tuple[list[str] | None, LossesResultBatch, list[str] | None]],
+) -> int:
+    """Write result chunks as one CSV row per tendon, with columns in ``RESULT_CSV_FIELDS`` order.
+
+    Each chunk is ``(ids, results, errors)``; rows with an error message get
+    empty result cells.
+    """
     target = Path(path)
     target.parent.mkdir(parents=True, exist_ok=True)
-    with target.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=2, sort_keys=True)
+    written = 0
+    with target.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.writer(handle)
+        header_written = False
+        for ids, results, errors in chunks:
+            if not header_written:
+                id_header = [CSV_ID_COLUMN] if ids is not None else []
+                writer.writerow(id_header + [key for _, key in RESULT_CSV_FIELDS] + [CSV_ERROR_COLUMN])
+                header_written = True
+            columns = [
+                ["" if math.isnan(value) else value for value in getattr(results, _CSV_RESULT_ATTRIBUTES[key]).tolist()]
+                for _, key in RESULT_CSV_FIELDS
+            ]
+            leading = [ids] if ids is not None else []
+            trailing = [errors if errors is not None else [""] * len(results)]
+            writer.writerows(zip(*leading, *columns, *trailing))
+            written += len(results)
+        if not header_written:
+            writer.writerow([key for _, key in RESULT_CSV_FIELDS] + [CSV_ERROR_COLUMN])
+    return written
+
+
+def process_csv_file(
+    input_path: str | Path,
+    output_path: str | Path,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    backend: str = "numpy",
+) -> int:
+    """Compute every tendon of a CSV schedule and stream the results CSV; invalid rows keep their messages."""
+
+    def chunks() -> Iterator[tuple[list[str] | None, LossesResultBatch, list[str] | None]]:
+        for ids, columns in iter_csv_input_chunks(input_path, chunk_size):
+            report = validate_columns(columns)
+            results = calculate_losses_batch(columns, backend=backend, on_invalid="mask")
+            errors = None
+            if not report.is_valid:
+                errors = [""] * len(results)
+                for row, field, message in report.issues():
+                    if np.isnan(columns[field][row]):
+                        message = f"{field} vacio o no numerico."
+                    errors[row] = f"{errors[row]} {message}".strip()
+            yield ids, results, errors
+
+    return write_results_csv(output_path, chunks())
 
 
 def _parse_mapping(raw_text: str, suffix: str) -> dict[str, Any]:
+    documents = _parse_documents(raw_text, suffix)
+    if len(documents) > 1:
+        raise ValueError("El archivo contiene varios documentos; procesalo con --batch.")
+    if not documents or not isinstance(documents[0], dict):
+        raise ValueError("El archivo de entrada debe contener un objeto o mapa de claves y valores.")
+    if PROJECT_TENDONS_KEY in documents[0]:
+        raise ValueError("El archivo contiene una lista de tendones; procesalo con --batch.")
+    return documents[0]
+
+
+def _parse_documents(raw_text: str, suffix: str) -> list[Any]:
     if suffix == ".json":
-        return json.loads(raw_text)
+        return [json.loads(raw_text)]
     if yaml is not None:
-        parsed = yaml.safe_load(raw_text)
-        if isinstance(parsed, dict):
-            return parsed
-        raise ValueError("El archivo YAML debe contener un objeto o mapa de claves y valores.")
-    return _parse_simple_yaml_mapping(raw_text)
+        return [document for document in yaml.safe_load_all(raw_text) if document is not None]
+    return _parse_simple_yaml_documents(raw_text)
+
 
+def _parse_simple_yaml_documents(raw_text: str) -> list[dict[str, Any]]:
+    """Single pass over the lines for the subset used by project files.
 
-def _parse_simple_yaml_mapping(raw_text: str) -> dict[str, Any]:
-    parsed: dict[str, Any] = {}
-    for raw_line in raw_text.splitlines():
+    Supports ``---`` separated documents, top-level ``key: value`` pairs and
+    one level of nesting under a top-level key: either a mapping of
+    ``key: value`` lines or a list of mappings started by ``- key: value``,
+    with the ``-`` indented or at column 0 as PyYAML writes it.
+    """
+    documents: list[dict[str, Any]] = []
+    current: dict[str, Any] = {}
+    block_key: str | None = None
+    block: dict[str, Any] | list[dict[str, Any]] | None = None
+    item: dict[str, Any] | None = None
+    for number, raw_line in enumerate(raw_text.splitlines(), start=1):
         line = raw_line.strip()
         if not line or line.startswith("#"):
             continue
-        if ":" not in line:
-            raise ValueError("El analizador YAML simple solo admite pares clave: valor.")
-        key, value = line.split(":", 1)
-        parsed[key.strip()] = _coerce_scalar(value.strip())
-    return parsed
+        if line in {"---", "..."}:
+            if current:
+                documents.append(current)
+            current, block_key, block, item = {}, None, None, None
+            continue
+
+        list_item = line == "-" or line.startswith("- ")
+        if not raw_line[0].isspace() and not (list_item and block_key is not None):
+            key, value = _split_pair(line, number)
+            if value:
+                current[key] = _coerce_scalar(value)
+                block_key = None
+            else:
+                current[key] = None
+                block_key, block, item = key, None, None
+            continue
+        if block_key is None:
+            raise ValueError(f"Linea {number}: indentacion inesperada en el YAML simple.")
+
+        if list_item:
+            if block is None:
+                block = current[block_key] = []
+            if not isinstance(block, list):
+                raise ValueError(f"Linea {number}: no se pueden mezclar claves y elementos de lista.")
+            item = {}
+            block.append(item)
+            line = line[1:].strip()
+            if not line:
+                continue
+        elif block is None:
+            block = current[block_key] = {}
+
+        key, value = _split_pair(line, number)
+        if isinstance(block, list):
+            if item is None:
+                raise ValueError(f"Linea {number}: falta '-' al inicio del elemento de lista.")
+            item[key] = _coerce_scalar(value)
+        else:
+            block[key] = _coerce_scalar(value)
+
+    if current:
+        documents.append(current)
+    return documents
+
+
+def _split_pair(line: str, number: int) -> tuple[str, str]:
+    if ":" not in line:
+        raise ValueError(f"Linea {number}: el analizador YAML simple solo admite pares clave: valor.")
+    key, value = line.split(":", 1)
+    return key.strip(), value.strip()
 
 
 def _coerce_scalar(value: str) -> Any:
     lowered = value.lower()
     if lowered in {"true", "false"}:
         return lowered == "true"
+    if lowered in {"null", "~"}:
+        return None
+    if value[:1] in {"[", "{"}:
+        try:
+            return json.loads(value)
+        except ValueError:
+            return value
     try:
         if any(char in value for char in [".", "e", "E"]):
             return float(value)
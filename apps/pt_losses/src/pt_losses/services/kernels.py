@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from pt_losses.domain.models import INPUT_KEYS, RESULT_FIELDS
+
+try:
+    import numba  # type: ignore
+except ModuleNotFoundError:
+    numba = None
+
+
+BACKENDS = ("auto", "numpy", "numba")
+prange = numba.prange if numba is not None else range
+
+# Column positions as plain ints, so numba folds them into the compiled kernel.
+_IN_EP = INPUT_KEYS.index("Ep")
+_IN_EC = INPUT_KEYS.index("Ec")
+_IN_FPK = INPUT_KEYS.index("fpk")
+_IN_FP01K = INPUT_KEYS.index("fp01k")
+_IN_AP = INPUT_KEYS.index("Ap")
+_IN_N_TENDONS = INPUT_KEYS.index("n_tendons")
+_IN_TENDON_LENGTH = INPUT_KEYS.index("tendon_length")
+_IN_THETA_TOTAL = INPUT_KEYS.index("theta_total")
+_IN_MU_TESADO = INPUT_KEYS.index("mu_tesado")
+_IN_MU_FRIC = INPUT_KEYS.index("mu_fric")
+_IN_K_WOBBLE = INPUT_KEYS.index("k_wobble")
+_IN_ANCHORAGE_SLIP_MM = INPUT_KEYS.index("anchorage_slip_mm")
+_IN_CONCRETE_STRESS_AT_TENDON = INPUT_KEYS.index("concrete_stress_at_tendon")
+_IN_CREEP_COEFF = INPUT_KEYS.index("creep_coeff")
+_IN_SHRINKAGE_STRAIN = INPUT_KEYS.index("shrinkage_strain")
+_IN_RELAXATION_LOSS_RATIO = INPUT_KEYS.index("relaxation_loss_ratio")
+
+_RESULT_NAMES = tuple(name for name, _ in RESULT_FIELDS)
+_OUT_SIGMA_MAX_MPA = _RESULT_NAMES.index("sigma_max_mpa")
+_OUT_SIGMA_0_MPA = _RESULT_NAMES.index("sigma_0_mpa")
+_OUT_SIGMA_INF_MPA = _RESULT_NAMES.index("sigma_inf_mpa")
+_OUT_ETA_FR = _RESULT_NAMES.index("eta_fr")
+_OUT_ETA_ANC = _RESULT_NAMES.index("eta_anc")
+_OUT_ETA_EL = _RESULT_NAMES.index("eta_el")
+_OUT_ETA_REL = _RESULT_NAMES.index("eta_rel")
+_OUT_ETA_FLU = _RESULT_NAMES.index("eta_flu")
+_OUT_ETA_RET = _RESULT_NAMES.index("eta_ret")
+_OUT_ETA_TOTAL = _RESULT_NAMES.index("eta_total")
+_OUT_T0_PERCENT = _RESULT_NAMES.index("t0_percent")
+_OUT_TINF_PERCENT = _RESULT_NAMES.index("tinf_percent")
+_OUT_T0_PERMILLE = _RESULT_NAMES.index("t0_permille")
+_OUT_TINF_PERMILLE = _RESULT_NAMES.index("tinf_permille")
+_OUT_INITIAL_FORCE_PER_TENDON_KN = _RESULT_NAMES.index("initial_force_per_tendon_kn")
+_OUT_INITIAL_FORCE_TOTAL_KN = _RESULT_NAMES.index("initial_force_total_kn")
+_OUT_FINAL_FORCE_PER_TENDON_KN = _RESULT_NAMES.index("final_force_per_tendon_kn")
+_OUT_FINAL_FORCE_TOTAL_KN = _RESULT_NAMES.index("final_force_total_kn")
+
+
+def available_backends() -> tuple[str, ...]:
+    return ("numpy", "numba") if numba is not None else ("numpy",)
+
+
+def resolve_backend(backend: str) -> str:
+    """Map ``auto`` to the fastest installed backend and reject unknown or missing ones."""
+    if backend not in BACKENDS:
+        raise ValueError("El backend debe ser 'auto', 'numpy' o 'numba'.")
+    if backend == "auto":
+        return "numba" if numba is not None else "numpy"
+    if backend == "numba" and numba is None:
+        raise ValueError("El backend 'numba' requiere instalar numba (pip install pt-losses[fast]).")
+    return backend
+
+
+def fused_rows(inputs: np.ndarray, cap: float, out: np.ndarray) -> None:
+    """Whole loss chain for each row of ``inputs`` (columns in ``INPUT_KEYS`` order) in one pass.
+
+    ``out`` receives one row per entry of ``RESULT_FIELDS``. Written with
+    scalar arithmetic only so that numba can compile it without temporaries.
+    """
+    for row in prange(inputs.shape[0]):
+        ep = inputs[row, _IN_EP]
+        ec = inputs[row, _IN_EC]
+        fpk = inputs[row, _IN_FPK]
+        fp01k = inputs[row, _IN_FP01K]
+        area = inputs[row, _IN_AP]
+        count = inputs[row, _IN_N_TENDONS]
+        length = inputs[row, _IN_TENDON_LENGTH]
+        theta = inputs[row, _IN_THETA_TOTAL]
+        mu_tesado = inputs[row, _IN_MU_TESADO]
+        mu_fric = inputs[row, _IN_MU_FRIC]
+        wobble = inputs[row, _IN_K_WOBBLE]
+        slip = inputs[row, _IN_ANCHORAGE_SLIP_MM]
+        concrete_stress = inputs[row, _IN_CONCRETE_STRESS_AT_TENDON]
+        creep = inputs[row, _IN_CREEP_COEFF]
+        shrinkage = inputs[row, _IN_SHRINKAGE_STRAIN]
+        eta_rel = inputs[row, _IN_RELAXATION_LOSS_RATIO]
+
+        sigma_max = min(0.80 * fpk, 0.94 * fp01k)
+        sigma_0 = mu_tesado * sigma_max
+        eta_fr = 1.0 - math.exp(-(mu_fric * theta + wobble * length))
+        eta_anc = 0.0
+        eta_el = 0.0
+        eta_flu = 0.0
+        eta_ret = 0.0
+        if sigma_0 > 0:
+            eta_anc = ep * (slip / (length * 1000.0)) / sigma_0
+            eta_el = ep * (concrete_stress / ec) / sigma_0
+            eta_flu = ep * creep * (concrete_stress / ec) / sigma_0
+            eta_ret = ep * shrinkage / sigma_0
+        eta_total = min(eta_fr + eta_anc + eta_el + eta_rel + eta_flu + eta_ret, cap)
+        sigma_inf = sigma_0 * (1.0 - eta_total)
+        t0_percent = -(sigma_0 / ep) * 100.0
+        tinf_percent = -(sigma_inf / ep) * 100.0
+        initial_per_tendon = sigma_0 * area / 1000.0
+        final_per_tendon = sigma_inf * area / 1000.0
+
+        out[_OUT_SIGMA_MAX_MPA, row] = sigma_max
+        out[_OUT_SIGMA_0_MPA, row] = sigma_0
+        out[_OUT_SIGMA_INF_MPA, row] = sigma_inf
+        out[_OUT_ETA_FR, row] = eta_fr
+        out[_OUT_ETA_ANC, row] = eta_anc
+        out[_OUT_ETA_EL, row] = eta_el
+        out[_OUT_ETA_REL, row] = eta_rel
+        out[_OUT_ETA_FLU, row] = eta_flu
+        out[_OUT_ETA_RET, row] = eta_ret
+        out[_OUT_ETA_TOTAL, row] = eta_total
+        out[_OUT_T0_PERCENT, row] = t0_percent
+        out[_OUT_TINF_PERCENT, row] = tinf_percent
+        out[_OUT_T0_PERMILLE, row] = t0_percent * 10.0
+        out[_OUT_TINF_PERMILLE, row] = tinf_percent * 10.0
+        out[_OUT_INITIAL_FORCE_PER_TENDON_KN, row] = initial_per_tendon
+        out[_OUT_INITIAL_FORCE_TOTAL_KN, row] = initial_per_tendon * count
+        out[_OUT_FINAL_FORCE_PER_TENDON_KN, row] = final_per_tendon
+        out[_OUT_FINAL_FORCE_TOTAL_KN, row] = final_per_tendon * count
+
+
+if numba is not None:
+    fused_rows = numba.njit(parallel=True, cache=True)(fused_rows)
+
+
+def evaluate_fused(data: dict[str, np.ndarray], cap: float) -> dict[str, np.ndarray]:
+    """Run the compiled kernel over broadcast input columns and return result columns by attribute name."""
+    inputs = np.column_stack([data[key] for key in INPUT_KEYS])
+    out = np.empty((len(RESULT_FIELDS), inputs.shape[0]))
+    fused_rows(inputs, cap, out)
+    return {name: out[position] for position, (name, _) in enumerate(RESULT_FIELDS)}
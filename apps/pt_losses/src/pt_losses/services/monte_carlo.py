@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Mapping, Sequence
+from contextlib import ExitStack
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from pt_losses.domain.models import INPUT_KEYS, RESULT_FIELDS, LossesInput
+from pt_losses.services.archive import ColumnArchiveWriter
+from pt_losses.services.calculator import calculate_losses_batch, columns_from_inputs
+from pt_losses.services.validation import FIELD_RULES
+
+
+DEFAULT_BLOCK_SIZE = 100_000
+DEFAULT_OUTPUTS = ("sigma_inf_mpa", "final_force_total_kn", "eta_total")
+DEFAULT_PERCENTILES = (5.0, 50.0, 95.0)
+MAX_REJECTION_ROUNDS = 100
+
+
+@dataclass(frozen=True, slots=True)
+class Distribution:
+    """Sampling distribution for one input key.
+
+    ``normal`` and ``lognormal`` take the mean and standard deviation of the
+    variable itself; ``uniform`` takes the lower and upper bounds.
+    """
+
+    kind: str
+    first: float
+    second: float
+
+    def __post_init__(self) -> None:
+        if self.kind not in {"normal", "lognormal", "uniform"}:
+            raise ValueError("La distribucion debe ser 'normal', 'lognormal' o 'uniform'.")
+        if self.kind == "uniform":
+            if self.second < self.first:
+                raise ValueError("En una distribucion uniforme el limite superior no puede ser menor al inferior.")
+        elif self.second < 0:
+            raise ValueError("La desviacion estandar no puede ser negativa.")
+        if self.kind == "lognormal" and self.first <= 0:
+            raise ValueError("La media de una distribucion lognormal debe ser mayor que cero.")
+
+    @classmethod
+    def normal(cls, mean: float, std: float) -> "Distribution":
+        return cls("normal", mean, std)
+
+    @classmethod
+    def lognormal(cls, mean: float, std: float) -> "Distribution":
+        return cls("lognormal", mean, std)
+
+    @classmethod
+    def uniform(cls, low: float, high: float) -> "Distribution":
+        return cls("uniform", low, high)
+
+    @classmethod
+    def from_mapping(cls, data: Mapping[str, Any]) -> "Distribution":
+        kind = str(data["tipo"])
+        if kind == "uniform":
+            return cls.uniform(float(data["minimo"]), float(data["maximo"]))
+        return cls(kind, float(data["media"]), float(data["desviacion"]))
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        if self.kind == "normal":
+            return rng.normal(self.first, self.second, size)
+        if self.kind == "uniform":
+            return rng.uniform(self.first, self.second, size)
+        sigma_log = math.sqrt(math.log1p((self.second / self.first) ** 2))
+        mu_log = math.log(self.first) - 0.5 * sigma_log**2
+        return rng.lognormal(mu_log, sigma_log, size)
+
+
+class StreamingStatistics:
+    """Constant-memory mean, variance, extrema and histogram-based percentiles."""
+
+    def __init__(self, bins: int = 8192) -> None:
+        if bins < 2 or bins % 2:
+            raise ValueError("La cantidad de intervalos del histograma debe ser par y mayor que 1.")
+        self.bins = bins
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self._counts = np.zeros(bins, dtype=np.int64)
+        self._low = 0.0
+        self._width = 0.0
+
+    def update(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[np.isfinite(values)]
+        if values.size == 0:
+            return
+
+        block_count = int(values.size)
+        block_mean = float(values.mean())
+        block_m2 = float(np.square(values - block_mean).sum())
+        total = self.count + block_count
+        delta = block_mean - self.mean
+        self.mean += delta * block_count / total
+        self._m2 += block_m2 + delta * delta * self.count * block_count / total
+        self.count = total
+
+        block_min = float(values.min())
+        block_max = float(values.max())
+        if self._width == 0.0:
+            self._initialize_range(block_min, block_max)
+        self.minimum = min(self.minimum, block_min)
+        self.maximum = max(self.maximum, block_max)
+        self._grow_range(block_min, block_max)
+
+        index = np.floor((values - self._low) / self._width).astype(np.int64)
+        np.clip(index, 0, self.bins - 1, out=index)
+        self._counts += np.bincount(index, minlength=self.bins)
+
+    @property
+    def variance(self) -> float:
+        if self.count < 2:
+            return 0.0
+        return self._m2 / (self.count - 1)
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    def percentile(self, percent: float) -> float:
+        if self.count == 0:
+            return math.nan
+        target = (percent / 100.0) * self.count
+        cumulative = np.cumsum(self._counts)
+        index = int(np.searchsorted(cumulative, target, side="left"))
+        index = min(index, self.bins - 1)
+        previous = int(cumulative[index - 1]) if index > 0 else 0
+        in_bin = int(self._counts[index])
+        fraction = (target - previous) / in_bin if in_bin else 0.0
+        value = self._low + (index + fraction) * self._width
+        return float(min(max(value, self.minimum), self.maximum))
+
+    def summary(self, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> dict[str, float]:
+        summary = {
+            "muestras": float(self.count),
+            "media": self.mean,
+            "desviacion": self.std,
+            "minimo": self.minimum,
+            "maximo": self.maximum,
+        }
+        for percent in percentiles:
+            summary[f"p{percent:g}"] = self.percentile(percent)
+        return summary
+
+    def _initialize_range(self, low: float, high: float) -> None:
+        span = high - low
+        if span <= 0:
+            span = max(abs(low) * 1e-6, 1e-12)
+        self._low = low - 0.05 * span
+        self._width = 1.1 * span / self.bins
+
+    def _grow_range(self, low: float, high: float) -> None:
+        half = self.bins // 2
+        while low < self._low:
+            merged = self._counts.reshape(half, 2).sum(axis=1)
+            self._counts = np.concatenate([np.zeros(half, dtype=np.int64), merged])
+            self._low -= self.bins * self._width
+            self._width *= 2.0
+        while high >= self._low + self.bins * self._width:
+            merged = self._counts.reshape(half, 2).sum(axis=1)
+            self._counts = np.concatenate([merged, np.zeros(half, dtype=np.int64)])
+            self._width *= 2.0
+
+
+@dataclass(frozen=True, slots=True)
+class MonteCarloSummary:
+    samples: int
+    seed: int | None
+    statistics: dict[str, StreamingStatistics]
+
+    def to_dict(self, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> dict[str, object]:
+        return {
+            "muestras": self.samples,
+            "semilla": self.seed,
+            "estadisticas": {name: stats.summary(percentiles) for name, stats in self.statistics.items()},
+        }
+
+
+def run_monte_carlo(
+    base: Mapping[str, Any],
+    distributions: Mapping[str, Distribution],
+    samples: int,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    seed: int | None = None,
+    outputs: Sequence[str] = DEFAULT_OUTPUTS,
+    archive: str | Path | None = None,
+) -> MonteCarloSummary:
+    """Propagate the input distributions through the batch calculator in fixed-size blocks.
+
+    With ``archive`` every sampled input and its results are also appended to a
+    columnar archive (see ``services.archive``).
+    """
+    if samples <= 0:
+        raise ValueError("La cantidad de muestras debe ser mayor que cero.")
+    if block_size <= 0:
+        raise ValueError("El tamano de bloque debe ser mayor que cero.")
+    unknown = sorted(set(distributions) - set(INPUT_KEYS))
+    if unknown:
+        raise ValueError(f"Parametros desconocidos en las distribuciones: {', '.join(unknown)}")
+    # Built through LossesInput, so a base given by tendon_segments gets its length and angle.
+    base_input = columns_from_inputs([LossesInput.from_mapping(base)])
+
+    rng = np.random.default_rng(seed)
+    base_columns = {key: float(values[0]) for key, values in base_input.items()}
+    statistics = {name: StreamingStatistics() for name in outputs}
+
+    with ExitStack() as stack:
+        writer = None
+        if archive is not None:
+            names = [*distributions, *(name for name, _ in RESULT_FIELDS)]
+            writer = stack.enter_context(ColumnArchiveWriter(archive, names))
+        remaining = samples
+        while remaining > 0:
+            size = min(block_size, remaining)
+            columns: dict[str, np.ndarray | float] = dict(base_columns)
+            for key, distribution in distributions.items():
+                columns[key] = _sample_truncated(key, distribution, rng, size)
+            results = calculate_losses_batch(columns)
+            for name, stats in statistics.items():
+                stats.update(getattr(results, name))
+            if writer is not None:
+                writer.append_results(results, {key: columns[key] for key in distributions})
+            remaining -= size
+
+    return MonteCarloSummary(samples=samples, seed=seed, statistics=statistics)
+
+
+def _sample_truncated(key: str, distribution: Distribution, rng: np.random.Generator, size: int) -> np.ndarray:
+    values = _prepare_sample(key, distribution.sample(rng, size))
+    invalid = ~_within_limits(key, values)
+    for _ in range(MAX_REJECTION_ROUNDS):
+        pending = int(invalid.sum())
+        if pending == 0:
+            return values
+        values[invalid] = _prepare_sample(key, distribution.sample(rng, pending))
+        invalid = ~_within_limits(key, values)
+    raise ValueError(f"La distribucion de {key} cae casi por completo fuera del rango admisible.")
+
+
+def _prepare_sample(key: str, values: np.ndarray) -> np.ndarray:
+    if key == "n_tendons":
+        return np.rint(values)
+    return values
+
+
+def _within_limits(key: str, values: np.ndarray) -> np.ndarray:
+    return FIELD_RULES[key].within(values)
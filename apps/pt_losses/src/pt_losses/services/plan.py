@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from pt_losses.domain.materials import ConcreteMaterial, PrestressingSteel
+from pt_losses.domain.models import LossComponents, LossesInput, LossesResult, LossesResultBatch, RfemStrainState
+from pt_losses.domain.tendon_geometry import TendonGeometry
+from pt_losses.services.calculator import MAX_TOTAL_LOSS_RATIO
+
+
+@dataclass(frozen=True, slots=True)
+class CalculationPlan:
+    """Material pair and loss parameters with their geometry-independent terms precomputed.
+
+    ``sigma_0``, ``Ep/Ec`` and the elastic, creep, shrinkage and relaxation
+    ratios do not depend on the tendon geometry. They are computed once, so
+    each evaluation only adds friction, anchorage and forces.
+    """
+
+    steel: PrestressingSteel
+    concrete: ConcreteMaterial
+    mu_tesado: float
+    mu_fric: float
+    k_wobble: float
+    anchorage_slip_mm: float
+    concrete_stress_at_tendon_mpa: float
+    creep_coeff: float
+    shrinkage_strain: float
+    relaxation_loss_ratio: float
+    sigma_max_mpa: float = field(init=False, compare=False)
+    sigma_0_mpa: float = field(init=False, compare=False)
+    modular_ratio: float = field(init=False, compare=False)
+    shrinkage_stress_mpa: float = field(init=False, compare=False)
+    eta_el: float = field(init=False, compare=False)
+    eta_flu: float = field(init=False, compare=False)
+    eta_ret: float = field(init=False, compare=False)
+    anchorage_factor: float = field(init=False, compare=False)
+    t0_percent: float = field(init=False, compare=False)
+
+    def __post_init__(self) -> None:
+        ep = self.steel.elastic_modulus_mpa
+        sigma_max = self.steel.sigma_max_mpa
+        sigma_0 = self.mu_tesado * sigma_max
+        modular_ratio = ep / self.concrete.elastic_modulus_mpa
+        shrinkage_stress = ep * self.shrinkage_strain
+        positive = sigma_0 > 0
+        values = {
+            "sigma_max_mpa": sigma_max,
+            "sigma_0_mpa": sigma_0,
+            "modular_ratio": modular_ratio,
+            "shrinkage_stress_mpa": shrinkage_stress,
+            "eta_el": (
+                ep * (self.concrete_stress_at_tendon_mpa / self.concrete.elastic_modulus_mpa) / sigma_0
+                if positive
+                else 0.0
+            ),
+            "eta_flu": (
+                ep * self.creep_coeff * (self.concrete_stress_at_tendon_mpa / self.concrete.elastic_modulus_mpa) / sigma_0
+                if positive
+                else 0.0
+            ),
+            "eta_ret": shrinkage_stress / sigma_0 if positive else 0.0,
+            "anchorage_factor": ep * self.anchorage_slip_mm / sigma_0 if positive else 0.0,
+            "t0_percent": -(sigma_0 / ep) * 100.0,
+        }
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    @classmethod
+    def from_input(cls, loss_input: LossesInput) -> "CalculationPlan":
+        return cls(
+            steel=loss_input.steel,
+            concrete=loss_input.concrete,
+            mu_tesado=loss_input.mu_tesado,
+            mu_fric=loss_input.mu_fric,
+            k_wobble=loss_input.k_wobble,
+            anchorage_slip_mm=loss_input.anchorage_slip_mm,
+            concrete_stress_at_tendon_mpa=loss_input.concrete_stress_at_tendon_mpa,
+            creep_coeff=loss_input.creep_coeff,
+            shrinkage_strain=loss_input.shrinkage_strain,
+            relaxation_loss_ratio=loss_input.relaxation_loss_ratio,
+        )
+
+    def to_input(self, geometry: TendonGeometry) -> LossesInput:
+        return LossesInput(
+            steel=self.steel,
+            concrete=self.concrete,
+            geometry=geometry,
+            mu_tesado=self.mu_tesado,
+            mu_fric=self.mu_fric,
+            k_wobble=self.k_wobble,
+            anchorage_slip_mm=self.anchorage_slip_mm,
+            concrete_stress_at_tendon_mpa=self.concrete_stress_at_tendon_mpa,
+            creep_coeff=self.creep_coeff,
+            shrinkage_strain=self.shrinkage_strain,
+            relaxation_loss_ratio=self.relaxation_loss_ratio,
+        )
+
+    def evaluate(self, geometry: TendonGeometry) -> LossesResult:
+        sigma_0 = self.sigma_0_mpa
+        eta_fr = 1.0 - math.exp(-(self.mu_fric * geometry.theta_total_rad + self.k_wobble * geometry.length_m))
+        eta_anc = self.anchorage_factor / geometry.length_mm
+        eta_total = min(
+            eta_fr + eta_anc + self.eta_el + self.relaxation_loss_ratio + self.eta_flu + self.eta_ret,
+            MAX_TOTAL_LOSS_RATIO,
+        )
+        sigma_inf = sigma_0 * (1.0 - eta_total)
+        tinf_percent = -(sigma_inf / self.steel.elastic_modulus_mpa) * 100.0
+        initial_force_per_tendon_kn = sigma_0 * geometry.area_mm2 / 1000.0
+        final_force_per_tendon_kn = sigma_inf * geometry.area_mm2 / 1000.0
+        return LossesResult(
+            sigma_max_mpa=self.sigma_max_mpa,
+            sigma_0_mpa=sigma_0,
+            sigma_inf_mpa=sigma_inf,
+            losses=LossComponents(
+                eta_fr=eta_fr,
+                eta_anc=eta_anc,
+                eta_el=self.eta_el,
+                eta_rel=self.relaxation_loss_ratio,
+                eta_flu=self.eta_flu,
+                eta_ret=self.eta_ret,
+                eta_total=eta_total,
+            ),
+            rfem=RfemStrainState(
+                t0_percent=self.t0_percent,
+                tinf_percent=tinf_percent,
+                t0_permille=self.t0_percent * 10.0,
+                tinf_permille=tinf_percent * 10.0,
+            ),
+            initial_force_per_tendon_kn=initial_force_per_tendon_kn,
+            initial_force_total_kn=initial_force_per_tendon_kn * geometry.count,
+            final_force_per_tendon_kn=final_force_per_tendon_kn,
+            final_force_total_kn=final_force_per_tendon_kn * geometry.count,
+        )
+
+    def evaluate_many(self, geometries: Sequence[TendonGeometry]) -> LossesResultBatch:
+        size = len(geometries)
+        return self.evaluate_columns(
+            area_mm2=np.fromiter((geometry.area_mm2 for geometry in geometries), dtype=np.float64, count=size),
+            count=np.fromiter((geometry.count for geometry in geometries), dtype=np.float64, count=size),
+            length_m=np.fromiter((geometry.length_m for geometry in geometries), dtype=np.float64, count=size),
+            theta_total_rad=np.fromiter((geometry.theta_total_rad for geometry in geometries), dtype=np.float64, count=size),
+        )
+
+    def evaluate_columns(
+        self,
+        area_mm2: ArrayLike,
+        count: ArrayLike,
+        length_m: ArrayLike,
+        theta_total_rad: ArrayLike,
+    ) -> LossesResultBatch:
+        area, tendons, length, theta = (
+            np.atleast_1d(np.asarray(value, dtype=np.float64))
+            for value in np.broadcast_arrays(area_mm2, count, length_m, theta_total_rad)
+        )
+        size = area.shape[0]
+        sigma_0 = self.sigma_0_mpa
+        eta_fr = 1.0 - np.exp(-(self.mu_fric * theta + self.k_wobble * length))
+        eta_anc = self.anchorage_factor / (length * 1000.0)
+        eta_total = np.minimum(
+            eta_fr + eta_anc + self.eta_el + self.relaxation_loss_ratio + self.eta_flu + self.eta_ret,
+            MAX_TOTAL_LOSS_RATIO,
+        )
+        sigma_inf = sigma_0 * (1.0 - eta_total)
+        tinf_percent = -(sigma_inf / self.steel.elastic_modulus_mpa) * 100.0
+        initial_force_per_tendon_kn = sigma_0 * area / 1000.0
+        final_force_per_tendon_kn = sigma_inf * area / 1000.0
+        return LossesResultBatch(
+            sigma_max_mpa=np.full(size, self.sigma_max_mpa),
+            sigma_0_mpa=np.full(size, sigma_0),
+            sigma_inf_mpa=sigma_inf,
+            eta_fr=eta_fr,
+            eta_anc=eta_anc,
+            eta_el=np.full(size, self.eta_el),
+            eta_rel=np.full(size, self.relaxation_loss_ratio),
+            eta_flu=np.full(size, self.eta_flu),
+            eta_ret=np.full(size, self.eta_ret),
+            eta_total=eta_total,
+            t0_percent=np.full(size, self.t0_percent),
+            tinf_percent=tinf_percent,
+            t0_permille=np.full(size, self.t0_percent * 10.0),
+            tinf_permille=tinf_percent * 10.0,
+            initial_force_per_tendon_kn=initial_force_per_tendon_kn,
+            initial_force_total_kn=initial_force_per_tendon_kn * np.trunc(tendons),
+            final_force_per_tendon_kn=final_force_per_tendon_kn,
+            final_force_total_kn=final_force_per_tendon_kn * np.trunc(tendons),
+        )
+
+
+def calculate_losses_planned(inputs: Sequence[LossesInput]) -> LossesResultBatch:
+    """Evaluate many inputs by grouping them on a shared plan and running each group vectorized."""
+    groups: dict[tuple[object, ...], list[int]] = {}
+    for position, loss_input in enumerate(inputs):
+        groups.setdefault(_plan_key(loss_input), []).append(position)
+
+    if not groups:
+        return LossesResultBatch.empty()
+    order = np.empty(len(inputs), dtype=np.int64)
+    partial: list[LossesResultBatch] = []
+    offset = 0
+    for positions in groups.values():
+        plan = CalculationPlan.from_input(inputs[positions[0]])
+        partial.append(plan.evaluate_many([inputs[position].geometry for position in positions]))
+        order[positions] = np.arange(offset, offset + len(positions))
+        offset += len(positions)
+    return LossesResultBatch.concatenate(partial)[order]
+
+
+def _plan_key(loss_input: LossesInput) -> tuple[object, ...]:
+    return (
+        loss_input.steel,
+        loss_input.concrete,
+        loss_input.mu_tesado,
+        loss_input.mu_fric,
+        loss_input.k_wobble,
+        loss_input.anchorage_slip_mm,
+        loss_input.concrete_stress_at_tendon_mpa,
+        loss_input.creep_coeff,
+        loss_input.shrinkage_strain,
+        loss_input.relaxation_loss_ratio,
+    )
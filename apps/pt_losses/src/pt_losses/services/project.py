@@ -0,0 +1,354 @@
+from __future__ import annotations
+
+import csv
+import json
+import sqlite3
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from datetime import datetime, timezone
+from itertools import islice, repeat
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from pt_losses.domain.models import INPUT_KEYS, RESULT_FIELDS
+from pt_losses.services.calculator import calculate_losses_batch
+from pt_losses.services.io import iter_input_mappings
+from pt_losses.services.schema import DEFAULT_CHUNK_SIZE, InputSchema
+from pt_losses.services.streaming import iter_json_records
+
+
+PROJECT_SUFFIXES = {".db", ".sqlite", ".sqlite3"}
+NAME_KEY = "id"
+GROUP_KEY = "grupo"
+MEMBER_KEY = "miembro"
+MATERIAL_KEY = "material"
+
+MATERIAL_COLUMNS = ("Ep", "Ec", "fpk", "fp01k", "fc")
+GEOMETRY_COLUMNS = ("Ap", "n_tendons", "tendon_length", "theta_total", "eccentricity")
+PARAMETER_COLUMNS = tuple(key for key in INPUT_KEYS if key not in (*MATERIAL_COLUMNS, *GEOMETRY_COLUMNS))
+RESULT_COLUMNS = tuple(name for name, _ in RESULT_FIELDS)
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS materials (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL DEFAULT '',
+    {", ".join(f"{column} REAL NOT NULL" for column in MATERIAL_COLUMNS)},
+    UNIQUE (name, {", ".join(MATERIAL_COLUMNS)})
+);
+CREATE TABLE IF NOT EXISTS geometries (
+    id INTEGER PRIMARY KEY,
+    {", ".join(f"{column} REAL NOT NULL" for column in GEOMETRY_COLUMNS)},
+    UNIQUE ({", ".join(GEOMETRY_COLUMNS)})
+);
+CREATE TABLE IF NOT EXISTS inputs (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    tendon_group TEXT,
+    member_no INTEGER,
+    material_id INTEGER NOT NULL REFERENCES materials(id),
+    geometry_id INTEGER NOT NULL REFERENCES geometries(id),
+    {", ".join(f"{column} REAL NOT NULL" for column in PARAMETER_COLUMNS)},
+    dirty INTEGER NOT NULL DEFAULT 1
+);
+CREATE TABLE IF NOT EXISTS results (
+    input_id INTEGER PRIMARY KEY REFERENCES inputs(id) ON DELETE CASCADE,
+    {", ".join(f"{column} REAL" for column in RESULT_COLUMNS)},
+    calculated_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rfem_records (
+    id INTEGER PRIMARY KEY,
+    input_id INTEGER NOT NULL REFERENCES inputs(id) ON DELETE CASCADE,
+    model_path TEXT,
+    member_no INTEGER,
+    applied_at TEXT NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS inputs_member_no ON inputs(member_no);
+CREATE INDEX IF NOT EXISTS inputs_tendon_group ON inputs(tendon_group);
+CREATE INDEX IF NOT EXISTS inputs_material ON inputs(material_id);
+CREATE INDEX IF NOT EXISTS inputs_dirty ON inputs(dirty) WHERE dirty = 1;
+CREATE INDEX IF NOT EXISTS results_eta_total ON results(eta_total);
+CREATE INDEX IF NOT EXISTS rfem_records_input ON rfem_records(input_id);
+"""
+
+_INPUT_VALUE_COLUMNS = ("tendon_group", "member_no", "material_id", "geometry_id", *PARAMETER_COLUMNS)
+_CALCULATION_COLUMNS = ("material_id", "geometry_id", *PARAMETER_COLUMNS)
+# An upsert only flags the tendon when a value that enters the calculation changed.
+_UPSERT_INPUT = f"""
+INSERT INTO inputs (name, {", ".join(_INPUT_VALUE_COLUMNS)})
+VALUES ({", ".join("?" * (len(_INPUT_VALUE_COLUMNS) + 1))})
+ON CONFLICT(name) DO UPDATE SET
+    {", ".join(f"{column} = excluded.{column}" for column in _INPUT_VALUE_COLUMNS)},
+    dirty = CASE WHEN {" AND ".join(f"inputs.{column} IS excluded.{column}" for column in _CALCULATION_COLUMNS)}
+        THEN inputs.dirty ELSE 1 END
+"""
+_SELECT_INPUTS = f"""
+SELECT inputs.id, {", ".join(f"materials.{column}" for column in MATERIAL_COLUMNS)},
+    {", ".join(f"geometries.{column}" for column in GEOMETRY_COLUMNS)},
+    {", ".join(f"inputs.{column}" for column in PARAMETER_COLUMNS)}
+FROM inputs
+JOIN materials ON materials.id = inputs.material_id
+JOIN geometries ON geometries.id = inputs.geometry_id
+"""
+_SELECTED_KEYS = (*MATERIAL_COLUMNS, *GEOMETRY_COLUMNS, *PARAMETER_COLUMNS)
+_GEOMETRY_START = len(MATERIAL_COLUMNS)
+_PARAMETER_START = _GEOMETRY_START + len(GEOMETRY_COLUMNS)
+
+
+class ProjectStore:
+    """SQLite project: materials and geometries shared by many tendons, their inputs and results.
+
+    Materials are deduplicated by name and values, geometries by value; an
+    unnamed material is stored with an empty name. Material and geometry rows
+    are never edited in place: new values point the tendon at another row. Any
+    change in a tendon's calculation values therefore flags it as dirty, and
+    ``recalculate`` only evaluates the dirty tendons in vectorized chunks.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        if self.path.suffix.lower() not in PROJECT_SUFFIXES:
+            raise ValueError(f"Tipo de archivo de proyecto no soportado: {self.path.suffix}")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(self.path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> "ProjectStore":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def add_tendons(
+        self,
+        records: Iterable[Mapping[str, Any]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        schema: InputSchema | None = None,
+    ) -> int:
+        """Insert or update tendons with ``executemany``; returns the number of records written.
+
+        Each record holds the input keys (aliases are resolved by ``schema``)
+        plus ``id`` (required, unique), and optionally ``grupo``, ``miembro``
+        and ``material`` (a name for the material row).
+        """
+        if chunk_size <= 0:
+            raise ValueError("El tamano de bloque debe ser mayor que cero.")
+        schema = schema or InputSchema()
+        layouts: dict[tuple[str, ...], Callable[[Mapping[str, Any]], tuple[float, ...]]] = {}
+        iterator = iter(records)
+        written = 0
+        with self.connection:
+            while True:
+                chunk = list(islice(iterator, chunk_size))
+                if not chunk:
+                    return written
+                self._write_tendons(chunk, schema, layouts)
+                written += len(chunk)
+
+    def recalculate(self, chunk_size: int = DEFAULT_CHUNK_SIZE, backend: str = "numpy") -> int:
+        """Evaluate the dirty tendons and store their results; invalid rows get NULL results."""
+        recalculated = 0
+        while True:
+            rows = self.connection.execute(
+                f"{_SELECT_INPUTS} WHERE inputs.dirty = 1 LIMIT ?", (chunk_size,)
+            ).fetchall()
+            if not rows:
+                return recalculated
+            matrix = np.array([tuple(row)[1:] for row in rows], dtype=np.float64)
+            columns = {key: matrix[:, position] for position, key in enumerate(_SELECTED_KEYS)}
+            values = calculate_losses_batch(columns, backend=backend, on_invalid="mask").columns()
+            ids = [row["id"] for row in rows]
+            stamp = _timestamp()
+            # SQLite binds NaN (the masked invalid rows) as NULL.
+            parameters = zip(ids, *(values[name].tolist() for name in RESULT_COLUMNS), repeat(stamp))
+            with self.connection:
+                self.connection.executemany(
+                    f"INSERT OR REPLACE INTO results (input_id, {', '.join(RESULT_COLUMNS)}, calculated_at) "
+                    f"VALUES ({', '.join('?' * (len(RESULT_COLUMNS) + 2))})",
+                    parameters,
+                )
+                self.connection.executemany("UPDATE inputs SET dirty = 0 WHERE id = ?", zip(ids))
+            recalculated += len(rows)
+
+    def dirty_count(self) -> int:
+        return int(self.connection.execute("SELECT COUNT(*) FROM inputs WHERE dirty = 1").fetchone()[0])
+
+    def tendon_count(self) -> int:
+        return int(self.connection.execute("SELECT COUNT(*) FROM inputs").fetchone()[0])
+
+    def input_mapping(self, name: str) -> dict[str, Any]:
+        row = self.connection.execute(f"{_SELECT_INPUTS} WHERE inputs.name = ?", (name,)).fetchone()
+        if row is None:
+            raise KeyError(f"No existe el tendon '{name}' en el proyecto.")
+        return {key: row[key] for key in INPUT_KEYS}
+
+    def tendon_names(self) -> list[str]:
+        return [row[0] for row in self.connection.execute("SELECT name FROM inputs ORDER BY id")]
+
+    def query_results(
+        self,
+        min_eta_total: float | None = None,
+        tendon_group: str | None = None,
+        member_no: int | None = None,
+        material: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield the stored results of the tendons that match every given filter.
+
+        Each filter maps to an indexed column. Dirty tendons keep their last
+        stored result until ``recalculate`` runs.
+        """
+        conditions: list[str] = []
+        parameters: list[Any] = []
+        for condition, value in (
+            ("results.eta_total > ?", min_eta_total),
+            ("inputs.tendon_group = ?", tendon_group),
+            ("inputs.member_no = ?", member_no),
+            ("materials.name = ?", material),
+        ):
+            if value is not None:
+                conditions.append(condition)
+                parameters.append(value)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        cursor = self.connection.execute(
+            f"""
+            SELECT inputs.name, inputs.tendon_group, inputs.member_no, NULLIF(materials.name, '') AS material, inputs.dirty,
+                {", ".join(f"results.{column}" for column in RESULT_COLUMNS)}
+            FROM results
+            JOIN inputs ON inputs.id = results.input_id
+            JOIN materials ON materials.id = inputs.material_id
+            {where}
+            ORDER BY inputs.id
+            """,
+            parameters,
+        )
+        for row in cursor:
+            record: dict[str, Any] = {
+                NAME_KEY: row["name"],
+                GROUP_KEY: row["tendon_group"],
+                MEMBER_KEY: row["member_no"],
+                MATERIAL_KEY: row["material"],
+                "pendiente": bool(row["dirty"]),
+            }
+            record.update((key, row[name]) for name, key in RESULT_FIELDS)
+            yield record
+
+    def record_rfem_application(
+        self,
+        name: str,
+        payload: Mapping[str, Any],
+        model_path: str | None = None,
+        member_no: int | None = None,
+    ) -> int:
+        """Keep the response of an RFEM application for tendon ``name``; returns the record id."""
+        row = self.connection.execute("SELECT id, member_no FROM inputs WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            raise KeyError(f"No existe el tendon '{name}' en el proyecto.")
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO rfem_records (input_id, model_path, member_no, applied_at, payload) VALUES (?, ?, ?, ?, ?)",
+                (
+                    row["id"],
+                    model_path,
+                    row["member_no"] if member_no is None else member_no,
+                    _timestamp(),
+                    json.dumps(payload, sort_keys=True, default=str),
+                ),
+            )
+        return int(cursor.lastrowid)
+
+    def _write_tendons(
+        self,
+        chunk: list[Mapping[str, Any]],
+        schema: InputSchema,
+        layouts: dict[tuple[str, ...], Callable[[Mapping[str, Any]], tuple[float, ...]]],
+    ) -> None:
+        prepared = []
+        for record in chunk:
+            if not isinstance(record, Mapping) or NAME_KEY not in record:
+                raise KeyError(f"Cada tendon del proyecto necesita la clave '{NAME_KEY}'.")
+            keys = tuple(record)
+            getter = layouts.get(keys)
+            if getter is None:
+                getter = layouts[keys] = self._input_getter(schema, keys)
+            prepared.append((record, getter(record)))
+
+        # The same values under two names are two materials, so a later import
+        # never renames the material the earlier tendons were filed under.
+        materials = {(_material_name(record), *values[:_GEOMETRY_START]) for record, values in prepared}
+        self.connection.executemany(
+            f"INSERT OR IGNORE INTO materials (name, {', '.join(MATERIAL_COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?)",
+            materials,
+        )
+        geometries = {values[_GEOMETRY_START:_PARAMETER_START] for _, values in prepared}
+        self.connection.executemany(
+            f"INSERT OR IGNORE INTO geometries ({', '.join(GEOMETRY_COLUMNS)}) VALUES (?, ?, ?, ?, ?)",
+            geometries,
+        )
+        material_ids = self._ids("materials", ("name", *MATERIAL_COLUMNS), materials)
+        geometry_ids = self._ids("geometries", GEOMETRY_COLUMNS, geometries)
+
+        self.connection.executemany(
+            _UPSERT_INPUT,
+            (
+                (
+                    str(record[NAME_KEY]),
+                    record.get(GROUP_KEY),
+                    None if record.get(MEMBER_KEY) in (None, "") else int(record[MEMBER_KEY]),
+                    material_ids[(_material_name(record), *values[:_GEOMETRY_START])],
+                    geometry_ids[values[_GEOMETRY_START:_PARAMETER_START]],
+                    *values[_PARAMETER_START:],
+                )
+                for record, values in prepared
+            ),
+        )
+
+    @staticmethod
+    def _input_getter(schema: InputSchema, keys: tuple[str, ...]) -> Callable[[Mapping[str, Any]], tuple[float, ...]]:
+        mapping = schema.resolve(keys)
+        sources = [mapping.get(key) for key in _SELECTED_KEYS]
+        defaults = [float(schema.defaults.get(key, 0.0)) for key in _SELECTED_KEYS]
+
+        def getter(record: Mapping[str, Any]) -> tuple[float, ...]:
+            return tuple(
+                float(record[source]) if source is not None else default
+                for source, default in zip(sources, defaults)
+            )
+
+        return getter
+
+    def _ids(self, table: str, columns: tuple[str, ...], keys: Iterable[tuple[Any, ...]]) -> dict[tuple[Any, ...], int]:
+        condition = " AND ".join(f"{column} = ?" for column in columns)
+        statement = f"SELECT id FROM {table} WHERE {condition}"
+        return {key: int(self.connection.execute(statement, key).fetchone()[0]) for key in keys}
+
+
+def iter_source_records(path: str | Path) -> Iterator[Mapping[str, Any]]:
+    """Read tendon records to import from a CSV, NDJSON/JSON array or YAML project file."""
+    source = Path(path)
+    suffix = source.suffix.lower()
+    if suffix in {".yaml", ".yml"}:
+        yield from iter_input_mappings(source)
+        return
+    if suffix not in {".csv", ".json", ".ndjson", ".jsonl"}:
+        raise ValueError(f"Tipo de archivo no soportado: {source.suffix}")
+    with source.open("r", encoding="utf-8", newline="") as handle:
+        if suffix == ".csv":
+            yield from csv.DictReader(handle)
+        else:
+            yield from iter_json_records(handle)
+
+
+def _material_name(record: Mapping[str, Any]) -> str:
+    name = record.get(MATERIAL_KEY)
+    return "" if name is None else str(name)
+
+
+def _timestamp() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
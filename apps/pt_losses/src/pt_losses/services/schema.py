@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from itertools import islice
+from operator import itemgetter
+from typing import Any, Callable
+
+import numpy as np
+
+from pt_losses.domain.models import INPUT_KEYS, LossesInput
+
+
+DEFAULT_CHUNK_SIZE = 65536
+
+# Names used by the RFEM model reader in its material and section blocks, plus the
+# ``LossesInput`` attribute name for the concrete stress.
+DEFAULT_ALIASES: dict[str, str] = {
+    "Ep_MPa": "Ep",
+    "Ec_MPa": "Ec",
+    "fpk_MPa": "fpk",
+    "fp01k_MPa": "fp01k",
+    "fc_MPa": "fc",
+    "Ap_mm2": "Ap",
+    "cantidad_cordones": "n_tendons",
+    "longitud_promedio_m": "tendon_length",
+    "relajacion": "relaxation_loss_ratio",
+    "concrete_stress_at_tendon_mpa": "concrete_stress_at_tendon",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class InputSchema:
+    """Maps source keys (canonical names or aliases) to the ``INPUT_KEYS`` columns.
+
+    The lookup is resolved once per distinct key layout, so rows are read with a
+    single ``itemgetter`` call and stacked straight into float64 columns.
+    ``defaults`` fills keys that the source does not provide at all.
+    """
+
+    aliases: Mapping[str, str] = field(default_factory=lambda: dict(DEFAULT_ALIASES))
+    defaults: Mapping[str, float] = field(default_factory=dict)
+    _layouts: dict[tuple[str, ...], tuple[Callable[[Any], Any], tuple[str, ...]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        unknown = sorted({*self.aliases.values(), *self.defaults} - set(INPUT_KEYS))
+        if unknown:
+            raise ValueError(f"Claves desconocidas en el esquema: {', '.join(unknown)}")
+
+    def resolve(self, source_keys: Iterable[str]) -> dict[str, str]:
+        """Return ``{input_key: source_key}`` for the keys present; canonical names win over aliases."""
+        available = list(source_keys)
+        present = set(available)
+        mapping: dict[str, str] = {}
+        for source in available:
+            target = self.aliases.get(source)
+            if target is not None and target not in present and target not in mapping:
+                mapping[target] = source
+        for key in INPUT_KEYS:
+            if key in present:
+                mapping[key] = key
+        missing = [key for key in INPUT_KEYS if key not in mapping and key not in self.defaults]
+        if missing:
+            raise KeyError(f"Faltan columnas de entrada: {', '.join(missing)}")
+        return mapping
+
+    def columns_from_mappings(self, rows: Iterable[Mapping[str, Any]]) -> dict[str, np.ndarray]:
+        values: list[tuple[Any, ...]] = []
+        layout_of_rows: list[tuple[str, ...]] = []
+        source_keys: tuple[str, ...] | None = None
+        targets: tuple[str, ...] = ()
+        getter: Callable[[Any], Any] | None = None
+        for row in rows:
+            # Any change in the key set may change which source feeds a column
+            # (an explicit value over a default, a canonical name over an alias).
+            keys = tuple(row)
+            if keys != source_keys:
+                source_keys = keys
+                targets, getter = self._layout(keys)
+            values.append(getter(row))
+            layout_of_rows.append(targets)
+        if not values:
+            return {key: np.empty(0) for key in INPUT_KEYS}
+        if len(set(layout_of_rows)) > 1:
+            return self._stack_mixed(values, layout_of_rows)
+        targets = layout_of_rows[0]
+        return self._stack(np.array(values, dtype=np.float64).reshape(len(values), len(targets)), targets)
+
+    def iter_csv_columns(
+        self,
+        reader: Iterable[Sequence[str]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[dict[str, np.ndarray]]:
+        """Read a ``csv.reader`` (header first) in chunks of typed columns.
+
+        Blank, non-numeric or missing cells become NaN, so the row is reported
+        by validation instead of stopping the file.
+        """
+        if chunk_size <= 0:
+            raise ValueError("El tamano de bloque debe ser mayor que cero.")
+        rows = iter(reader)
+        header = [name.strip() for name in next(rows, [])]
+        mapping = self.resolve(header)
+        positions = {key: header.index(source) for key, source in mapping.items()}
+        selected = list(positions.values())
+        # Blank lines are dropped before slicing, so a run of them never ends the file early.
+        data_rows = filter(None, rows)
+        while True:
+            chunk = list(islice(data_rows, chunk_size))
+            if not chunk:
+                return
+            try:
+                block = np.array([[row[position] for position in selected] for row in chunk], dtype=np.float64)
+            except (IndexError, ValueError):
+                block = np.array([[_parse_cell(row, position) for position in selected] for row in chunk])
+            yield self._stack(block.reshape(len(chunk), len(selected)), tuple(positions))
+
+    def columns_from_csv(self, reader: Iterable[Sequence[str]]) -> dict[str, np.ndarray]:
+        chunks = list(self.iter_csv_columns(reader))
+        if not chunks:
+            return {key: np.empty(0) for key in INPUT_KEYS}
+        return {key: np.concatenate([chunk[key] for chunk in chunks]) for key in INPUT_KEYS}
+
+    def _layout(self, source_keys: tuple[str, ...]) -> tuple[tuple[str, ...], Callable[[Any], Any]]:
+        cached = self._layouts.get(source_keys)
+        if cached is None:
+            mapping = self.resolve(source_keys)
+            targets = tuple(mapping)
+            cached = (_row_getter([mapping[key] for key in targets]), targets)
+            self._layouts[source_keys] = cached
+        return cached[1], cached[0]
+
+    def _stack(self, block: np.ndarray, targets: tuple[str, ...]) -> dict[str, np.ndarray]:
+        rows = block.shape[0]
+        columns = {key: np.ascontiguousarray(block[:, position]) for position, key in enumerate(targets)}
+        for key in INPUT_KEYS:
+            if key not in columns:
+                columns[key] = np.full(rows, float(self.defaults[key]))
+        return {key: columns[key] for key in INPUT_KEYS}
+
+    def _stack_mixed(self, values: list[tuple[Any, ...]], layouts: list[tuple[str, ...]]) -> dict[str, np.ndarray]:
+        columns = {key: np.array([self.defaults.get(key, np.nan)] * len(values), dtype=np.float64) for key in INPUT_KEYS}
+        for row, (row_values, targets) in enumerate(zip(values, layouts)):
+            for key, value in zip(targets, row_values):
+                columns[key][row] = float(value)
+        return columns
+
+
+def _row_getter(sources: Sequence[str]) -> Callable[[Any], tuple[Any, ...]]:
+    if len(sources) > 1:
+        return itemgetter(*sources)
+    return lambda row: tuple(row[source] for source in sources)
+
+
+def _parse_cell(row: Sequence[str], position: int) -> float:
+    try:
+        return float(row[position])
+    except (IndexError, ValueError):
+        return np.nan
+
+
+def input_at(columns: Mapping[str, np.ndarray], row: int) -> LossesInput:
+    """Build the ``LossesInput`` of one row; this is where the domain checks run."""
+    return LossesInput.from_mapping({key: columns[key][row].item() for key in INPUT_KEYS})
+
+
+def iter_inputs(columns: Mapping[str, np.ndarray]) -> Iterator[LossesInput]:
+    rows = len(columns[INPUT_KEYS[0]])
+    for row in range(rows):
+        yield input_at(columns, row)
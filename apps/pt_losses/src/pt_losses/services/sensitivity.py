@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from pt_losses.domain.models import INPUT_KEYS, LossesResultBatch
+from pt_losses.services.calculator import MAX_TOTAL_LOSS_RATIO, broadcast_columns, calculate_losses_batch
+
+
+SENSITIVITY_OUTPUTS = (
+    "eta_fr",
+    "eta_anc",
+    "eta_el",
+    "eta_rel",
+    "eta_flu",
+    "eta_ret",
+    "eta_total",
+    "sigma_inf_mpa",
+    "final_force_total_kn",
+)
+DEFAULT_RELATIVE_CHANGE = 0.10
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class SensitivityResult:
+    """Closed-form partial derivatives ``jacobian[output][input_key]``, one value per row.
+
+    ``capped`` marks the rows where ``eta_total`` sits on ``MAX_TOTAL_LOSS_RATIO``;
+    there every derivative of ``eta_total`` is zero and ``sigma_inf`` only
+    follows ``sigma_0``.
+    """
+
+    jacobian: dict[str, dict[str, np.ndarray]]
+    inputs: dict[str, np.ndarray]
+    results: LossesResultBatch
+    capped: np.ndarray
+
+    def derivative(self, output: str, key: str) -> np.ndarray:
+        return self.jacobian[output][key]
+
+    def tornado(
+        self,
+        output: str = "final_force_total_kn",
+        row: int = 0,
+        relative_change: float = DEFAULT_RELATIVE_CHANGE,
+    ) -> list[dict[str, object]]:
+        """Linearized swing of ``output`` for a ``+/- relative_change`` on each input, largest first."""
+        entries = []
+        for key in INPUT_KEYS:
+            derivative = float(self.jacobian[output][key][row])
+            step = relative_change * abs(float(self.inputs[key][row]))
+            swing = abs(derivative) * step
+            entries.append(
+                {
+                    "parametro": key,
+                    "derivada": derivative,
+                    "variacion_baja": -derivative * step,
+                    "variacion_alta": derivative * step,
+                    "impacto": swing,
+                }
+            )
+        entries.sort(key=lambda entry: entry["impacto"], reverse=True)
+        return entries
+
+
+def calculate_sensitivities(columns: Mapping[str, ArrayLike]) -> SensitivityResult:
+    data = broadcast_columns(columns)
+    results = calculate_losses_batch(data)
+    rows = len(results)
+    ep = data["Ep"]
+    ec = data["Ec"]
+    length = data["tendon_length"]
+    slip = data["anchorage_slip_mm"]
+    concrete_stress = data["concrete_stress_at_tendon"]
+    creep = data["creep_coeff"]
+    shrinkage = data["shrinkage_strain"]
+    mu_tesado = data["mu_tesado"]
+    mu_fric = data["mu_fric"]
+    theta = data["theta_total"]
+    wobble = data["k_wobble"]
+
+    sigma_0 = results.sigma_0_mpa
+    inverse_sigma_0 = np.divide(1.0, sigma_0, out=np.zeros(rows), where=sigma_0 > 0)
+    governed_by_fpk = 0.80 * data["fpk"] <= 0.94 * data["fp01k"]
+    d_sigma_0 = {
+        "mu_tesado": results.sigma_max_mpa,
+        "fpk": np.where(governed_by_fpk, 0.80 * mu_tesado, 0.0),
+        "fp01k": np.where(governed_by_fpk, 0.0, 0.94 * mu_tesado),
+    }
+
+    remaining = 1.0 - results.eta_fr
+    jacobian: dict[str, dict[str, np.ndarray]] = {
+        "eta_fr": _gradient(
+            rows,
+            mu_fric=theta * remaining,
+            theta_total=mu_fric * remaining,
+            k_wobble=length * remaining,
+            tendon_length=wobble * remaining,
+        ),
+        "eta_anc": _gradient(
+            rows,
+            Ep=slip / (1000.0 * length) * inverse_sigma_0,
+            anchorage_slip_mm=ep / (1000.0 * length) * inverse_sigma_0,
+            tendon_length=-results.eta_anc / length,
+        ),
+        "eta_el": _gradient(
+            rows,
+            Ep=concrete_stress / ec * inverse_sigma_0,
+            Ec=-results.eta_el / ec,
+            concrete_stress_at_tendon=ep / ec * inverse_sigma_0,
+        ),
+        "eta_rel": _gradient(rows, relaxation_loss_ratio=np.ones(rows)),
+        "eta_flu": _gradient(
+            rows,
+            Ep=creep * concrete_stress / ec * inverse_sigma_0,
+            Ec=-results.eta_flu / ec,
+            concrete_stress_at_tendon=ep * creep / ec * inverse_sigma_0,
+            creep_coeff=ep * concrete_stress / ec * inverse_sigma_0,
+        ),
+        "eta_ret": _gradient(
+            rows,
+            Ep=shrinkage * inverse_sigma_0,
+            shrinkage_strain=ep * inverse_sigma_0,
+        ),
+    }
+    for component in ("eta_anc", "eta_el", "eta_flu", "eta_ret"):
+        ratio = getattr(results, component) * inverse_sigma_0
+        for key, derivative in d_sigma_0.items():
+            jacobian[component][key] = jacobian[component][key] - ratio * derivative
+
+    capped = results.eta_total >= MAX_TOTAL_LOSS_RATIO
+    components = ("eta_fr", "eta_anc", "eta_el", "eta_rel", "eta_flu", "eta_ret")
+    jacobian["eta_total"] = {
+        key: np.where(capped, 0.0, sum(jacobian[component][key] for component in components)) for key in INPUT_KEYS
+    }
+
+    retained = 1.0 - results.eta_total
+    jacobian["sigma_inf_mpa"] = {
+        key: d_sigma_0.get(key, 0.0) * retained - sigma_0 * jacobian["eta_total"][key] for key in INPUT_KEYS
+    }
+    count = data["n_tendons"]
+    area = data["Ap"]
+    jacobian["final_force_total_kn"] = {
+        key: count * area / 1000.0 * jacobian["sigma_inf_mpa"][key] for key in INPUT_KEYS
+    }
+    jacobian["final_force_total_kn"]["n_tendons"] = area * results.sigma_inf_mpa / 1000.0
+    jacobian["final_force_total_kn"]["Ap"] = count * results.sigma_inf_mpa / 1000.0
+
+    return SensitivityResult(jacobian=jacobian, inputs=data, results=results, capped=capped)
+
+
+def format_tornado(entries: list[dict[str, object]], label: str, width: int = 30) -> str:
+    """Render tornado entries as a ranked text table with proportional bars."""
+    largest = max((float(entry["impacto"]) for entry in entries), default=0.0)
+    lines = [f"Sensibilidad de {label} (variacion lineal por parametro)"]
+    for position, entry in enumerate(entries, start=1):
+        impact = float(entry["impacto"])
+        if impact == 0.0:
+            continue
+        bar = "#" * max(1, round(width * impact / largest))
+        lines.append(
+            f"{position:>3}. {entry['parametro']:<28} {float(entry['variacion_baja']):>+12.4g} "
+            f"{float(entry['variacion_alta']):>+12.4g}  {bar}"
+        )
+    return "\n".join(lines)
+
+
+def _gradient(rows: int, **partials: np.ndarray) -> dict[str, np.ndarray]:
+    gradient = {key: np.zeros(rows) for key in INPUT_KEYS}
+    for key, value in partials.items():
+        gradient[key] = np.broadcast_to(np.asarray(value, dtype=np.float64), (rows,)).copy()
+    return gradient
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import gzip
+import io
+import json
+import lzma
+import sys
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, TextIO
+
+try:
+    import orjson  # type: ignore
+except ModuleNotFoundError:
+    orjson = None
+
+
+SERIALIZER_BACKENDS = ("auto", "orjson", "json")
+COMPRESSORS: dict[str, Callable[..., BinaryIO]] = {".gz": gzip.open, ".xz": lzma.open}
+STREAM_KEY = "rfem_real"
+WRITE_BUFFER_BYTES = 1 << 20
+
+
+@dataclass(frozen=True, slots=True)
+class JsonSerializer:
+    """Renders payloads to UTF-8 JSON bytes once.
+
+    The default layout is the one of ``json.dumps(indent=2, sort_keys=True)``;
+    ``compact`` drops the whitespace. Both backends turn NumPy scalars and
+    arrays into plain JSON numbers and lists.
+
+    The ``json`` backend is the default and gives byte-identical output to the
+    ``json`` module. ``orjson`` (or ``auto`` when it is installed) is faster but
+    writes NaN and infinities as ``null``, small floats without an exponent
+    (``0.00001`` instead of ``1e-05``) and non-ASCII text unescaped.
+    """
+
+    compact: bool = False
+    sort_keys: bool = True
+    backend: str = "json"
+
+    def __post_init__(self) -> None:
+        if self.backend not in SERIALIZER_BACKENDS:
+            raise ValueError(f"Serializador desconocido: {self.backend}. Opciones: {', '.join(SERIALIZER_BACKENDS)}")
+        if self.backend == "orjson" and orjson is None:
+            raise ValueError("El serializador orjson no esta instalado.")
+
+    @property
+    def uses_orjson(self) -> bool:
+        return orjson is not None and self.backend != "json"
+
+    def dumps(self, payload: Any) -> bytes:
+        if self.uses_orjson:
+            options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            if self.sort_keys:
+                options |= orjson.OPT_SORT_KEYS
+            if not self.compact:
+                options |= orjson.OPT_INDENT_2
+            return orjson.dumps(payload, default=_plain, option=options)
+        if self.compact:
+            text = json.dumps(payload, separators=(",", ":"), sort_keys=self.sort_keys, default=_plain)
+        else:
+            text = json.dumps(payload, indent=2, sort_keys=self.sort_keys, default=_plain)
+        return text.encode("utf-8")
+
+    def iter_chunks(self, payload: Any, depth: int = 3) -> Iterator[bytes]:
+        """Yield the same document as ``dumps`` piece by piece.
+
+        Mappings and lists down to ``depth`` levels are opened element by
+        element, so a large ``rfem_real`` section is never rendered as a whole;
+        deeper values are rendered in one call.
+        """
+        yield from self._iter_value(payload, 0, depth)
+
+    def write(self, path: str | Path, payload: Any) -> None:
+        write_bytes(path, self.dumps(payload))
+
+    def write_stream(self, path: str | Path, payload: Any) -> None:
+        with open_output(path) as handle:
+            for chunk in self.iter_chunks(payload):
+                handle.write(chunk)
+
+    def _iter_value(self, value: Any, level: int, depth: int) -> Iterator[bytes]:
+        if level >= depth or not isinstance(value, (Mapping, list, tuple)) or not value:
+            rendered = self.dumps(value)
+            if not self.compact and level:
+                rendered = rendered.replace(b"\n", b"\n" + b"  " * level)
+            yield rendered
+            return
+
+        mapping = isinstance(value, Mapping)
+        opening, closing = (b"{", b"}") if mapping else (b"[", b"]")
+        inner = b"" if self.compact else b"\n" + b"  " * (level + 1)
+        outer = b"" if self.compact else b"\n" + b"  " * level
+        separator = b":" if self.compact else b": "
+        if mapping:
+            items = sorted(value.items(), key=lambda item: str(item[0])) if self.sort_keys else value.items()
+        else:
+            items = ((None, item) for item in value)
+
+        yield opening
+        for position, (key, item) in enumerate(items):
+            prefix = inner if position == 0 else b"," + inner
+            if mapping:
+                prefix += self.dumps(str(key)) + separator
+            yield prefix
+            yield from self._iter_value(item, level + 1, depth)
+        yield outer + closing
+
+
+def open_output(path: str | Path) -> BinaryIO:
+    """Open ``path`` for binary writing, compressed when the suffix is ``.gz`` or ``.xz``."""
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    compressor = COMPRESSORS.get(target.suffix.lower())
+    if compressor is not None:
+        return compressor(target, "wb")
+    return target.open("wb", buffering=WRITE_BUFFER_BYTES)
+
+
+def write_bytes(path: str | Path, data: bytes) -> None:
+    with open_output(path) as handle:
+        handle.write(data)
+
+
+def write_stdout(data: bytes, stream: TextIO | None = None) -> None:
+    """Write rendered bytes plus a newline, bypassing the text layer when the stream has one."""
+    stream = sys.stdout if stream is None else stream
+    buffer = getattr(stream, "buffer", None)
+    if isinstance(buffer, (io.BufferedIOBase, io.RawIOBase)):
+        stream.flush()
+        buffer.write(data + b"\n")
+        buffer.flush()
+    else:
+        stream.write(data.decode("utf-8") + "\n")
+
+
+def _plain(value: Any) -> Any:
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Objeto no serializable a JSON: {type(value).__name__}")
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, TextIO
+
+from pt_losses.domain.models import RESULT_FIELDS
+from pt_losses.services.calculator import calculate_losses_batch
+from pt_losses.services.schema import InputSchema
+from pt_losses.services.validation import validate_columns
+
+
+DEFAULT_CHUNK_SIZE = 8192
+READ_BLOCK_CHARS = 1 << 16
+MAX_RECORD_CHARS = 1 << 26
+ID_KEY = "id"
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\r\n"
+_NUMBER_TAIL = "0123456789.eE+-"
+
+
+@dataclass(frozen=True, slots=True)
+class InvalidRecord:
+    """Stands in for an NDJSON line that is not valid JSON; ``stream_batch`` reports it as an error line."""
+
+    line: int
+    message: str
+
+
+def iter_json_records(handle: TextIO) -> Iterator[Any]:
+    """Yield the objects of an NDJSON stream or of a top-level JSON array without loading the whole text.
+
+    A malformed NDJSON line yields an ``InvalidRecord`` instead of aborting the
+    stream; a malformed array still raises, since it cannot be resynchronized.
+    """
+    first = _first_character(handle)
+    if first == "":
+        return
+    if first == "[":
+        yield from _iter_array(handle)
+        return
+    pending = first + handle.readline()
+    number = 1
+    while pending:
+        if pending.strip():
+            try:
+                yield json.loads(pending)
+            except json.JSONDecodeError as error:
+                yield InvalidRecord(number, error.msg)
+        pending = handle.readline()
+        number += 1
+
+
+def stream_batch(
+    records: Iterable[Any],
+    write: Callable[[str], Any],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    schema: InputSchema | None = None,
+    backend: str = "numpy",
+) -> int:
+    """Compute ``records`` chunk by chunk and ``write`` one compact JSON line per record.
+
+    A record's ``id`` is copied to its output line. Records that are not
+    objects, miss keys or break a validation rule produce an ``errores`` line
+    instead of aborting the stream. Returns the number of lines written.
+    """
+    if chunk_size <= 0:
+        raise ValueError("El tamano de bloque debe ser mayor que cero.")
+    schema = schema or InputSchema()
+    iterator = iter(records)
+    written = 0
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return written
+        write("".join(_render_chunk(chunk, schema, backend)))
+        written += len(chunk)
+
+
+def _render_chunk(chunk: list[Any], schema: InputSchema, backend: str) -> list[str]:
+    try:
+        if not all(isinstance(record, Mapping) for record in chunk):
+            raise TypeError
+        columns = schema.columns_from_mappings(chunk)
+    except (KeyError, TypeError, ValueError):
+        return [line for record in chunk for line in _render_chunk_slow(record, schema, backend)]
+    return _render_rows(chunk, columns, backend)
+
+
+def _render_rows(chunk: list[Any], columns: dict[str, Any], backend: str) -> list[str]:
+    report = validate_columns(columns)
+    results = calculate_losses_batch(columns, backend=backend, on_invalid="mask")
+    messages: dict[int, list[str]] = {}
+    for row, _, message in report.issues():
+        messages.setdefault(row, []).append(message)
+    values = [results.columns()[name].tolist() for name, _ in RESULT_FIELDS]
+    keys = [key for _, key in RESULT_FIELDS]
+    lines = []
+    for row, record in enumerate(chunk):
+        if row in messages:
+            payload: dict[str, Any] = {"errores": messages[row]}
+        else:
+            payload = dict(zip(keys, (column[row] for column in values)))
+        lines.append(_line(record, payload))
+    return lines
+
+
+def _render_chunk_slow(record: Any, schema: InputSchema, backend: str) -> list[str]:
+    if isinstance(record, InvalidRecord):
+        return [_line({}, {"errores": [f"Linea {record.line}: JSON invalido ({record.message})."]})]
+    if not isinstance(record, Mapping):
+        return [_line({}, {"errores": ["Cada registro debe ser un objeto JSON."]})]
+    try:
+        columns = schema.columns_from_mappings([record])
+    except KeyError as error:
+        return [_line(record, {"errores": [str(error.args[0] if error.args else error)]})]
+    except (TypeError, ValueError):
+        return [_line(record, {"errores": ["El registro tiene valores no numericos."]})]
+    return _render_rows([record], columns, backend)
+
+
+def _line(record: Any, payload: dict[str, Any]) -> str:
+    if isinstance(record, Mapping) and ID_KEY in record:
+        payload = {ID_KEY: record[ID_KEY], **payload}
+    try:
+        return json.dumps(payload, separators=(",", ":"), allow_nan=False) + "\n"
+    except ValueError:
+        # Infinite inputs pass the range rules but give NaN or infinite results,
+        # which strict JSON cannot hold; report the record instead of stopping.
+        errors = {"errores": ["El registro produce valores no finitos; revise las entradas."]}
+        if ID_KEY in payload:
+            try:
+                return json.dumps({ID_KEY: payload[ID_KEY], **errors}, separators=(",", ":"), allow_nan=False) + "\n"
+            except ValueError:
+                pass
+        return json.dumps(errors, separators=(",", ":")) + "\n"
+
+
+def _first_character(handle: TextIO) -> str:
+    while True:
+        character = handle.read(1)
+        if character == "" or character not in _WHITESPACE:
+            return character
+
+
+def _iter_array(handle: TextIO) -> Iterator[Any]:
+    buffer = ""
+    position = 0
+
+    def refill() -> bool:
+        nonlocal buffer, position
+        more = handle.read(READ_BLOCK_CHARS)
+        if not more:
+            return False
+        if len(buffer) - position > MAX_RECORD_CHARS:
+            raise ValueError("Registro JSON demasiado grande o mal formado en el arreglo de entrada.")
+        buffer = buffer[position:] + more
+        position = 0
+        return True
+
+    expect_separator = False
+    first = True
+    while True:
+        while position < len(buffer) and buffer[position] in _WHITESPACE:
+            position += 1
+        if position == len(buffer):
+            if not refill():
+                raise ValueError("El arreglo JSON de entrada no esta cerrado.")
+            continue
+        character = buffer[position]
+        if expect_separator:
+            if character == "]":
+                return
+            if character != ",":
+                raise ValueError("Se esperaba ',' o ']' en el arreglo JSON de entrada.")
+            position += 1
+            expect_separator = False
+            continue
+        if first and character == "]":
+            return
+        try:
+            value, end = _DECODER.raw_decode(buffer, position)
+        except json.JSONDecodeError as error:
+            if refill():
+                continue
+            raise ValueError(f"JSON invalido en el arreglo de entrada: {error.msg}") from error
+        # A number at the very end of the block may be cut; decode it again with more text.
+        if (end == len(buffer) or buffer[end] in _NUMBER_TAIL) and refill():
+            continue
+        yield value
+        position = end
+        first = False
+        expect_separator = True
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from pt_losses.domain.models import LossesInput
+from pt_losses.services.calculator import broadcast_columns
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class StressingSequenceResult:
+    """Elastic-shortening loss of each tendon when the group is stressed one by one.
+
+    ``order`` lists tendon numbers (1..n) in stressing order; ``loss_mpa`` and
+    ``eta_el`` are indexed by tendon number - 1.
+    """
+
+    order: np.ndarray
+    loss_mpa: np.ndarray
+    eta_el: np.ndarray
+    average_loss_mpa: float
+    average_eta_el: float
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "orden_tesado": self.order.tolist(),
+            "perdida_por_tendon_MPa": self.loss_mpa.tolist(),
+            "eta_el_por_tendon": self.eta_el.tolist(),
+            "perdida_media_MPa": self.average_loss_mpa,
+            "eta_el_media": self.average_eta_el,
+        }
+
+
+def sequential_shortening_factor(n_tendons: ArrayLike) -> np.ndarray:
+    """Average fraction ``(n - 1) / (2n)`` of the simultaneous elastic-shortening loss."""
+    count = np.trunc(np.asarray(n_tendons, dtype=np.float64))
+    if np.any(count < 1):
+        raise ValueError("n_tendons debe ser mayor que cero.")
+    return (count - 1.0) / (2.0 * count)
+
+
+def sequential_elastic_loss_ratio(columns: Mapping[str, ArrayLike]) -> np.ndarray:
+    """Average ``eta_el`` per row for sequential stressing, over the same columns as ``calculate_losses_batch``."""
+    data = broadcast_columns(columns)
+    sigma_0 = data["mu_tesado"] * np.minimum(0.80 * data["fpk"], 0.94 * data["fp01k"])
+    simultaneous_mpa = data["Ep"] * data["concrete_stress_at_tendon"] / data["Ec"]
+    average_mpa = sequential_shortening_factor(data["n_tendons"]) * simultaneous_mpa
+    return np.divide(average_mpa, sigma_0, out=np.zeros_like(average_mpa), where=sigma_0 > 0)
+
+
+def sequential_elastic_shortening(
+    loss_input: LossesInput,
+    order: Sequence[int] | None = None,
+) -> StressingSequenceResult:
+    """Distribute the elastic-shortening loss over the tendons of ``loss_input``.
+
+    ``concrete_stress_at_tendon`` is the stress once the whole group is
+    stressed, so each tendon adds ``1/n`` of it. A tendon only loses the part
+    added by the tendons stressed after it, which is a reversed cumulative sum
+    along ``order``.
+    """
+    count = loss_input.geometry.count
+    stressing_order = np.arange(1, count + 1) if order is None else np.asarray(order, dtype=np.int64)
+    if stressing_order.shape != (count,) or not np.array_equal(np.sort(stressing_order), np.arange(1, count + 1)):
+        raise ValueError(f"El orden de tesado debe ser una permutacion de los tendones 1 a {count}.")
+
+    simultaneous_mpa = (
+        loss_input.steel.elastic_modulus_mpa
+        * loss_input.concrete_stress_at_tendon_mpa
+        / loss_input.concrete.elastic_modulus_mpa
+    )
+    contribution = np.full(count, simultaneous_mpa / count)
+    stressed_later = np.cumsum(contribution[::-1])[::-1] - contribution
+    loss_mpa = np.empty(count)
+    loss_mpa[stressing_order - 1] = stressed_later
+
+    sigma_0 = loss_input.mu_tesado * loss_input.steel.sigma_max_mpa
+    eta_el = loss_mpa / sigma_0 if sigma_0 > 0 else np.zeros(count)
+    average_loss_mpa = float(loss_mpa.mean())
+    return StressingSequenceResult(
+        order=stressing_order,
+        loss_mpa=loss_mpa,
+        eta_el=eta_el,
+        average_loss_mpa=average_loss_mpa,
+        average_eta_el=average_loss_mpa / sigma_0 if sigma_0 > 0 else 0.0,
+    )
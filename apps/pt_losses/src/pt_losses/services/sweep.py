@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import csv
+import json
+import math
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from pt_losses.domain.models import INPUT_KEYS, RESULT_FIELDS, LossesInput, LossesResultBatch
+from pt_losses.services.archive import ARCHIVE_SUFFIX, ColumnArchiveWriter
+from pt_losses.services.calculator import calculate_losses_batch, columns_from_inputs
+
+
+DEFAULT_CHUNK_SIZE = 65536
+SWEEP_OUTPUT_EXTENSIONS = {".csv", ".ndjson", ".jsonl", ARCHIVE_SUFFIX}
+
+
+@dataclass(frozen=True, slots=True)
+class SweepAxis:
+    """One swept input key and the values it takes."""
+
+    key: str
+    values: tuple[float, ...]
+
+    def __post_init__(self) -> None:
+        if self.key not in INPUT_KEYS:
+            raise ValueError(f"Parametro de barrido desconocido: {self.key}")
+        if not self.values:
+            raise ValueError(f"El parametro {self.key} no tiene valores para barrer.")
+
+    @classmethod
+    def parse(cls, spec: str) -> "SweepAxis":
+        """Parse ``clave=inicio:fin:n`` (inclusive range) or ``clave=v1,v2,...``."""
+        if "=" not in spec:
+            raise ValueError(f"Formato de barrido invalido: {spec!r}. Usa clave=inicio:fin:n o clave=v1,v2,...")
+        key, raw_values = (part.strip() for part in spec.split("=", 1))
+        if ":" in raw_values:
+            parts = raw_values.split(":")
+            if len(parts) != 3:
+                raise ValueError(f"El rango de {key} debe tener la forma inicio:fin:n.")
+            start, stop, count = float(parts[0]), float(parts[1]), int(parts[2])
+            if count <= 0:
+                raise ValueError(f"El rango de {key} debe tener al menos un valor.")
+            values = tuple(float(value) for value in np.linspace(start, stop, count))
+        else:
+            values = tuple(float(value) for value in raw_values.split(",") if value.strip())
+        return cls(key=key, values=values)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+def sweep_size(axes: Sequence[SweepAxis]) -> int:
+    return math.prod(len(axis) for axis in axes)
+
+
+def validate_sweep(base: Mapping[str, Any], axes: Sequence[SweepAxis]) -> None:
+    keys = [axis.key for axis in axes]
+    duplicated = sorted({key for key in keys if keys.count(key) > 1})
+    if duplicated:
+        raise ValueError(f"Parametros de barrido repetidos: {', '.join(duplicated)}")
+    LossesInput.from_mapping(base)
+    for axis in axes:
+        for value in axis.values:
+            LossesInput.from_mapping({**base, axis.key: value})
+
+
+def iter_sweep_columns(
+    base: Mapping[str, Any],
+    axes: Sequence[SweepAxis],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[dict[str, np.ndarray | float]]:
+    """Yield the Cartesian product of ``axes`` over ``base`` as input column chunks."""
+    if chunk_size <= 0:
+        raise ValueError("El tamano de bloque debe ser mayor que cero.")
+    shape = tuple(len(axis) for axis in axes)
+    total = sweep_size(axes)
+    axis_values = [np.asarray(axis.values, dtype=np.float64) for axis in axes]
+    base_columns = _base_columns(base)
+
+    for start in range(0, total, chunk_size):
+        flat_index = np.arange(start, min(start + chunk_size, total), dtype=np.int64)
+        columns: dict[str, np.ndarray | float] = dict(base_columns)
+        if axes:
+            for axis, values, index in zip(axes, axis_values, np.unravel_index(flat_index, shape)):
+                columns[axis.key] = values[index]
+        else:
+            columns = {key: np.full(flat_index.shape, value) for key, value in base_columns.items()}
+        yield columns
+
+
+def _base_columns(base: Mapping[str, Any]) -> dict[str, float]:
+    # Through LossesInput, so a base given by tendon_segments gets its length and angle.
+    columns = columns_from_inputs([LossesInput.from_mapping(base)])
+    return {key: float(values[0]) for key, values in columns.items()}
+
+
+def iter_sweep_chunks(
+    base: Mapping[str, Any],
+    axes: Sequence[SweepAxis],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    backend: str = "numpy",
+) -> Iterator[tuple[dict[str, np.ndarray], LossesResultBatch]]:
+    """Evaluate the sweep chunk by chunk, yielding the swept values with their results."""
+    validate_sweep(base, axes)
+    for columns in iter_sweep_columns(base, axes, chunk_size):
+        results = calculate_losses_batch(columns, backend=backend)
+        size = len(results)
+        parameters = {
+            axis.key: np.broadcast_to(np.asarray(columns[axis.key], dtype=np.float64), (size,))
+            for axis in axes
+        }
+        yield parameters, results
+
+
+def write_sweep(
+    path: str | Path,
+    base: Mapping[str, Any],
+    axes: Sequence[SweepAxis],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    backend: str = "numpy",
+) -> int:
+    target = Path(path)
+    suffix = target.suffix.lower()
+    if suffix not in SWEEP_OUTPUT_EXTENSIONS:
+        raise ValueError(f"Formato de salida de barrido no soportado: {target.suffix}")
+    target.parent.mkdir(parents=True, exist_ok=True)
+
+    parameter_keys = [axis.key for axis in axes]
+    if suffix == ARCHIVE_SUFFIX:
+        with ColumnArchiveWriter(target, parameter_keys + [name for name, _ in RESULT_FIELDS]) as archive:
+            for parameters, results in iter_sweep_chunks(base, axes, chunk_size, backend):
+                archive.append_results(results, parameters)
+        return archive.rows
+
+    header = parameter_keys + [key for _, key in RESULT_FIELDS]
+    written = 0
+    with target.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle) if suffix == ".csv" else None
+        if writer is not None:
+            writer.writerow(header)
+        for parameters, results in iter_sweep_chunks(base, axes, chunk_size, backend):
+            rows = zip(*_python_columns(parameters, results))
+            if writer is not None:
+                writer.writerows(rows)
+            else:
+                handle.writelines(
+                    json.dumps(dict(zip(header, row)), separators=(",", ":")) + "\n" for row in rows
+                )
+            written += len(results)
+    return written
+
+
+def _python_columns(parameters: Mapping[str, np.ndarray], results: LossesResultBatch) -> list[list[Any]]:
+    columns: list[list[Any]] = []
+    for key, values in parameters.items():
+        if key == "n_tendons":
+            columns.append(values.astype(np.int64).tolist())
+        else:
+            columns.append(values.tolist())
+    columns.extend(getattr(results, name).tolist() for name, _ in RESULT_FIELDS)
+    return columns
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from pt_losses.domain.models import LossesInput, LossesResultBatch
+from pt_losses.services.calculator import MAX_TOTAL_LOSS_RATIO, calculate_losses_batch, columns_from_inputs
+
+
+DEFAULT_TIMES_DAYS = (7.0, 28.0, 90.0, 365.0, 36500.0)
+HOURS_PER_DAY = 24.0
+
+
+@dataclass(frozen=True, slots=True)
+class TimeModel:
+    """Development functions for the long-term losses.
+
+    ``creep_coeff`` and ``shrinkage_strain`` of ``LossesInput`` are taken as the
+    final values, developing as ``(t / (beta_h + t))**0.3`` and
+    ``t / (t + 0.04 * sqrt(h0**3))`` (EN 1992-1-1, Annex B). Intrinsic
+    relaxation follows the class 2 time function of EN 1992-1-1 (3.29),
+    calibrated so it reaches ``relaxation_loss_ratio`` at
+    ``relaxation_reference_hours``. It is reduced by creep and shrinkage with
+    Ghali's factor ``exp((-6.7 + 5.3 * lambda) * omega)``.
+    """
+
+    creep_beta_h_days: float = 1000.0
+    shrinkage_h0_mm: float = 200.0
+    aging_coefficient: float = 0.8
+    relaxation_reference_hours: float = 500_000.0
+    steps: int = 200
+
+    def __post_init__(self) -> None:
+        if self.creep_beta_h_days <= 0:
+            raise ValueError("creep_beta_h_days debe ser mayor que cero.")
+        if self.shrinkage_h0_mm <= 0:
+            raise ValueError("shrinkage_h0_mm debe ser mayor que cero.")
+        if not 0 <= self.aging_coefficient <= 1:
+            raise ValueError("aging_coefficient debe estar entre 0 y 1.")
+        if self.relaxation_reference_hours <= 0:
+            raise ValueError("relaxation_reference_hours debe ser mayor que cero.")
+        if self.steps < 1:
+            raise ValueError("steps debe ser al menos 1.")
+
+    def creep_development(self, days: np.ndarray) -> np.ndarray:
+        return (days / (self.creep_beta_h_days + days)) ** 0.3
+
+    def shrinkage_development(self, days: np.ndarray) -> np.ndarray:
+        return days / (days + 0.04 * self.shrinkage_h0_mm**1.5)
+
+    def relaxation_development(self, days: np.ndarray, stress_ratio: np.ndarray) -> np.ndarray:
+        hours = np.minimum(days * HOURS_PER_DAY, self.relaxation_reference_hours)
+        exponent = 0.75 * (1.0 - stress_ratio)
+        return (hours[None, :] / self.relaxation_reference_hours) ** exponent[:, None]
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class TimeHistoryResult:
+    """Loss history with one row per tendon and one column per requested time."""
+
+    times_days: np.ndarray
+    immediate: LossesResultBatch
+    eta_flu: np.ndarray
+    eta_ret: np.ndarray
+    eta_rel: np.ndarray
+    eta_total: np.ndarray
+    sigma_mpa: np.ndarray
+    final_force_total_kn: np.ndarray
+
+    def to_dict(self, row: int = 0) -> dict[str, list[float]]:
+        return {
+            "tiempos_dias": self.times_days.tolist(),
+            "eta_flu": self.eta_flu[row].tolist(),
+            "eta_ret": self.eta_ret[row].tolist(),
+            "eta_rel": self.eta_rel[row].tolist(),
+            "eta_total": self.eta_total[row].tolist(),
+            "tension_MPa": self.sigma_mpa[row].tolist(),
+            "fuerza_total_kN": self.final_force_total_kn[row].tolist(),
+        }
+
+
+def calculate_time_history(
+    inputs: LossesInput | Sequence[LossesInput],
+    times_days: ArrayLike = DEFAULT_TIMES_DAYS,
+    model: TimeModel | None = None,
+) -> TimeHistoryResult:
+    """Step the creep, shrinkage and relaxation interaction through time.
+
+    Immediate losses come from ``calculate_losses_batch``. Each internal step
+    adds the free creep, shrinkage and reduced relaxation increments. It then
+    removes the elastic and age-adjusted (``aging_coefficient``) recovery of the
+    concrete as the prestress drops, because the concrete stress at the tendon
+    scales with the remaining prestress.
+    """
+    model = model or TimeModel()
+    batch_inputs = [inputs] if isinstance(inputs, LossesInput) else list(inputs)
+    if not batch_inputs:
+        raise ValueError("Se necesita al menos una entrada para calcular la historia temporal.")
+    times = np.asarray(times_days, dtype=np.float64).ravel()
+    if times.size == 0 or np.any(times < 0) or np.any(np.diff(times) <= 0):
+        raise ValueError("Los tiempos deben ser no negativos y estrictamente crecientes.")
+
+    columns = columns_from_inputs(batch_inputs)
+    immediate = calculate_losses_batch(columns)
+    ep = columns["Ep"]
+    modular_ratio = ep / columns["Ec"]
+    sigma_0 = immediate.sigma_0_mpa
+    immediate_eta = immediate.eta_fr + immediate.eta_anc + immediate.eta_el
+    sigma_initial = np.maximum(sigma_0 * (1.0 - immediate_eta), 0.0)
+    active = sigma_initial > 0
+    safe_initial = np.where(active, sigma_initial, 1.0)
+    concrete_stress_0 = np.where(active, columns["concrete_stress_at_tendon"], 0.0)
+    stress_ratio = np.clip(sigma_initial / columns["fpk"], 0.0, 1.0)
+    interaction = modular_ratio * concrete_stress_0 / safe_initial
+    relaxation_reduction_rate = -6.7 + 5.3 * stress_ratio
+
+    grid = _time_grid(times, model.steps)
+    creep = columns["creep_coeff"][:, None] * model.creep_development(grid)[None, :]
+    shrinkage = columns["shrinkage_strain"][:, None] * model.shrinkage_development(grid)[None, :]
+    relaxation = columns["relaxation_loss_ratio"][:, None] * model.relaxation_development(grid, stress_ratio)
+
+    rows = sigma_0.shape[0]
+    output_index = np.searchsorted(grid, times)
+    creep_loss = np.zeros(rows)
+    shrinkage_loss = np.zeros(rows)
+    relaxation_loss = np.zeros(rows)
+    history = np.zeros((3, rows, times.size))
+    output_position = int(np.searchsorted(output_index, 0, side="right"))
+
+    for step in range(1, grid.size):
+        delta_creep = creep[:, step] - creep[:, step - 1]
+        remaining = 1.0 - (creep_loss + shrinkage_loss + relaxation_loss) / safe_initial
+        omega = (creep_loss + shrinkage_loss) / safe_initial
+        free_creep = modular_ratio * delta_creep * concrete_stress_0 * remaining
+        free_shrinkage = ep * (shrinkage[:, step] - shrinkage[:, step - 1])
+        free_relaxation = (
+            np.exp(relaxation_reduction_rate * omega)
+            * (relaxation[:, step] - relaxation[:, step - 1])
+            * sigma_initial
+        )
+        restraint = 1.0 + interaction * (1.0 + model.aging_coefficient * delta_creep)
+        creep_loss += np.where(active, free_creep / restraint, 0.0)
+        shrinkage_loss += np.where(active, free_shrinkage / restraint, 0.0)
+        relaxation_loss += np.where(active, free_relaxation / restraint, 0.0)
+        while output_position < times.size and output_index[output_position] == step:
+            history[:, :, output_position] = (creep_loss, shrinkage_loss, relaxation_loss)
+            output_position += 1
+
+    safe_sigma_0 = np.where(sigma_0 > 0, sigma_0, 1.0)[:, None]
+    eta_flu, eta_ret, eta_rel = (np.where(sigma_0[:, None] > 0, losses / safe_sigma_0, 0.0) for losses in history)
+    eta_total = np.minimum(immediate_eta[:, None] + eta_flu + eta_ret + eta_rel, MAX_TOTAL_LOSS_RATIO)
+    sigma = sigma_0[:, None] * (1.0 - eta_total)
+    force = sigma * (columns["Ap"] * np.trunc(columns["n_tendons"]))[:, None] / 1000.0
+    return TimeHistoryResult(
+        times_days=times,
+        immediate=immediate,
+        eta_flu=eta_flu,
+        eta_ret=eta_ret,
+        eta_rel=eta_rel,
+        eta_total=eta_total,
+        sigma_mpa=sigma,
+        final_force_total_kn=force,
+    )
+
+
+def _time_grid(times: np.ndarray, steps: int) -> np.ndarray:
+    last = float(times[-1])
+    if last <= 0:
+        return np.zeros(1)
+    start = min(0.01, last)
+    fine = np.geomspace(start, last, steps)
+    return np.unique(np.concatenate(([0.0], fine, times)))
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from itertools import islice
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from pt_losses.domain.models import INPUT_KEYS
+
+
+ON_INVALID_MODES = ("raise", "skip", "mask")
+MAX_REPORTED_ISSUES = 10
+
+
+@dataclass(frozen=True, slots=True)
+class FieldRule:
+    """Admissible range of one input column, mirroring the domain ``__post_init__`` checks."""
+
+    lower: float
+    upper: float
+    lower_inclusive: bool
+    message: str
+
+    def within(self, values: np.ndarray) -> np.ndarray:
+        above = values >= self.lower if self.lower_inclusive else values > self.lower
+        return above & (values <= self.upper)
+
+
+FIELD_RULES: dict[str, FieldRule] = {
+    "Ep": FieldRule(0.0, math.inf, False, "Ep debe ser mayor que cero."),
+    "Ec": FieldRule(0.0, math.inf, False, "Ec debe ser mayor que cero."),
+    "fpk": FieldRule(0.0, math.inf, False, "fpk debe ser mayor que cero."),
+    "fp01k": FieldRule(0.0, math.inf, False, "fp01k debe ser mayor que cero."),
+    "fc": FieldRule(0.0, math.inf, False, "fc debe ser mayor que cero."),
+    "Ap": FieldRule(0.0, math.inf, False, "Ap debe ser mayor que cero."),
+    # TendonGeometry stores int(n_tendons), so anything below one becomes zero.
+    "n_tendons": FieldRule(1.0, math.inf, True, "n_tendons debe ser mayor que cero."),
+    "tendon_length": FieldRule(0.0, math.inf, False, "tendon_length debe ser mayor que cero."),
+    "theta_total": FieldRule(0.0, math.inf, True, "theta_total no puede ser negativo."),
+    "eccentricity": FieldRule(0.0, math.inf, True, "eccentricity no puede ser negativo."),
+    "mu_tesado": FieldRule(0.0, 1.0, True, "mu_tesado debe estar entre 0 y 1."),
+    "mu_fric": FieldRule(0.0, 1.0, True, "mu_fric debe estar entre 0 y 1."),
+    "k_wobble": FieldRule(0.0, math.inf, True, "k_wobble no puede ser negativo."),
+    "anchorage_slip_mm": FieldRule(0.0, math.inf, True, "anchorage_slip_mm no puede ser negativo."),
+    "concrete_stress_at_tendon": FieldRule(0.0, math.inf, True, "concrete_stress_at_tendon no puede ser negativo."),
+    "creep_coeff": FieldRule(0.0, math.inf, True, "creep_coeff no puede ser negativo."),
+    "shrinkage_strain": FieldRule(0.0, math.inf, True, "shrinkage_strain no puede ser negativo."),
+    "relaxation_loss_ratio": FieldRule(0.0, 1.0, True, "relaxation_loss_ratio debe estar entre 0 y 1."),
+}
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class ValidationReport:
+    """Per-field masks of the rows that break a rule; ``issues`` expands them on demand."""
+
+    rows: int
+    invalid_by_field: dict[str, np.ndarray]
+
+    @property
+    def invalid(self) -> np.ndarray:
+        mask = np.zeros(self.rows, dtype=bool)
+        for field_mask in self.invalid_by_field.values():
+            mask |= field_mask
+        return mask
+
+    @property
+    def valid(self) -> np.ndarray:
+        return ~self.invalid
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.invalid_by_field
+
+    @property
+    def issue_count(self) -> int:
+        return sum(int(mask.sum()) for mask in self.invalid_by_field.values())
+
+    def issues(self) -> Iterator[tuple[int, str, str]]:
+        """Yield ``(row, field, message)`` ordered by row, then by input key order."""
+        fields = list(self.invalid_by_field)
+        if not fields:
+            return
+        masks = list(self.invalid_by_field.values())
+        rows = np.concatenate([np.flatnonzero(mask) for mask in masks])
+        positions = np.repeat(np.arange(len(fields)), [int(mask.sum()) for mask in masks])
+        for index in np.lexsort((positions, rows)):
+            field = fields[int(positions[index])]
+            yield int(rows[index]), field, FIELD_RULES[field].message
+
+    def summary(self, limit: int = MAX_REPORTED_ISSUES) -> str:
+        lines = [f"fila {row}: {message}" for row, _, message in islice(self.issues(), limit)]
+        hidden = self.issue_count - len(lines)
+        if hidden > 0:
+            lines.append(f"... y {hidden} errores mas.")
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "filas": self.rows,
+            "filas_invalidas": int(self.invalid.sum()),
+            "errores": [
+                {"fila": row, "campo": field, "mensaje": message} for row, field, message in self.issues()
+            ],
+        }
+
+
+def validate_columns(columns: Mapping[str, ArrayLike]) -> ValidationReport:
+    """Apply every input rule to whole columns at once; NaN breaks the rule of its column."""
+    missing = [key for key in INPUT_KEYS if key not in columns]
+    if missing:
+        raise KeyError(f"Faltan columnas de entrada: {', '.join(missing)}")
+    arrays = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(columns[key], dtype=np.float64)) for key in INPUT_KEYS)
+    )
+    invalid_by_field: dict[str, np.ndarray] = {}
+    for key, values in zip(INPUT_KEYS, arrays):
+        mask = ~FIELD_RULES[key].within(values)
+        if mask.any():
+            invalid_by_field[key] = mask
+    return ValidationReport(rows=arrays[0].shape[0], invalid_by_field=invalid_by_field)
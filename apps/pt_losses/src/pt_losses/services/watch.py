@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from pt_losses.domain.models import LossesResult
+from pt_losses.services.cache import CachedCalculator
+from pt_losses.services.io import SUPPORTED_EXTENSIONS, load_input_file, write_result_file
+
+
+DEFAULT_INTERVAL = 0.5
+DEFAULT_DEBOUNCE = 0.3
+OUTPUT_DIRECTORY = "resultados"
+RESULT_SUFFIX = ".resultado.json"
+
+Snapshot = dict[Path, tuple[int, int]]
+
+
+def take_snapshot(directory: Path) -> Snapshot:
+    """``(mtime_ns, size)`` of every input file directly inside ``directory``."""
+    snapshot: Snapshot = {}
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith(".") or name.endswith(RESULT_SUFFIX):
+                continue
+            if Path(name).suffix.lower() not in SUPPORTED_EXTENSIONS or not entry.is_file():
+                continue
+            stat = entry.stat()
+            snapshot[Path(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+class DirectoryWatcher:
+    """Polls a directory and recomputes the input files whose mtime or size changed.
+
+    A change is processed once the directory has looked the same for
+    ``debounce`` seconds, so an editor's save burst triggers one calculation.
+    Results go to ``output_directory`` as ``<archivo>.resultado.json``, keeping
+    the input suffix so ``viga.json`` and ``viga.yaml`` do not share a result.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        output_directory: str | Path | None = None,
+        debounce: float = DEFAULT_DEBOUNCE,
+        calculator: CachedCalculator | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.directory = Path(directory)
+        if not self.directory.is_dir():
+            raise NotADirectoryError(f"No existe el directorio a vigilar: {self.directory}")
+        self.output_directory = Path(output_directory) if output_directory else self.directory / OUTPUT_DIRECTORY
+        self.debounce = debounce
+        self.calculator = calculator or CachedCalculator()
+        self._clock = clock
+        self._seen: Snapshot | None = None
+        self._processed: Snapshot = {}
+        self._last_change = 0.0
+        self._results: dict[Path, LossesResult] = {}
+
+    def poll(self) -> list[str]:
+        """Take one snapshot; return one console line per file processed in this call."""
+        current = take_snapshot(self.directory)
+        now = self._clock()
+        if current != self._seen:
+            self._seen = current
+            self._last_change = now
+            if self.debounce > 0:
+                return []
+        if current == self._processed or now - self._last_change < self.debounce:
+            return []
+
+        lines = []
+        for path in sorted(set(self._processed) - set(current)):
+            self._results.pop(path, None)
+            lines.append(f"{path.name}: eliminado")
+        for path in sorted(current):
+            if self._processed.get(path) != current[path]:
+                lines.append(self._process(path))
+        self._processed = current
+        return lines
+
+    def run(
+        self,
+        interval: float = DEFAULT_INTERVAL,
+        echo: Callable[[str], object] = print,
+        sleep: Callable[[float], object] = time.sleep,
+    ) -> None:
+        while True:
+            for line in self.poll():
+                echo(line)
+            sleep(interval)
+
+    def output_path(self, path: Path) -> Path:
+        return self.output_directory / f"{path.name}{RESULT_SUFFIX}"
+
+    def _process(self, path: Path) -> str:
+        try:
+            result = self.calculator(load_input_file(path))
+        except Exception as error:
+            return f"{path.name}: error: {error}"
+
+        previous = self._results.get(path)
+        self._results[path] = result
+        if previous is not None and previous == result:
+            return f"{path.name}: sin cambios en el resultado"
+        write_result_file(self.output_path(path), result.to_nested_dict())
+        if previous is None:
+            return (
+                f"{path.name}: eta_total {result.losses.eta_total:.4f} | "
+                f"fuerza_final_total_kN {result.final_force_total_kn:.2f}"
+            )
+        return (
+            f"{path.name}: "
+            f"{_describe_change('eta_total', previous.losses.eta_total, result.losses.eta_total, 4)} | "
+            f"{_describe_change('fuerza_final_total_kN', previous.final_force_total_kn, result.final_force_total_kn, 2)}"
+        )
+
+
+def _describe_change(label: str, previous: float, value: float, digits: int) -> str:
+    return f"{label} {previous:.{digits}f} -> {value:.{digits}f} ({value - previous:+.{digits}f})"
@@ -0,0 +1,65 @@
+import unittest
+
+import numpy as np
+
+from pt_losses.domain.models import LossesInput
+from pt_losses.services.anchorage import solve_anchorage_set
+from pt_losses.services.calculator import calculate_losses
+from pt_losses.services.friction_profile import uniform_friction_profiles
+from fixtures import SAMPLE_MAPPING
+
+
+def lost_area(result) -> np.ndarray:
+    lost = result.stress_before_mpa - result.stress_after_mpa
+    return np.sum(0.5 * (lost[:, 1:] + lost[:, :-1]) * np.diff(result.x_m, axis=1), axis=1)
+
+
+class AnchorageSetTests(unittest.TestCase):
+    def test_uniform_mode_matches_simplified_formula(self) -> None:
+        loss_input = LossesInput.from_mapping(SAMPLE_MAPPING)
+        expected = calculate_losses(loss_input)
+        x, stress = uniform_friction_profiles(expected.sigma_0_mpa, 0.19, 0.18, 0.0015, 32.5)
+
+        result = solve_anchorage_set(x, stress, slip_mm=6.0, ep_mpa=195000.0, mode="uniforme")
+
+        self.assertAlmostEqual(float(result.eta_anc[0]), expected.losses.eta_anc, places=12)
+
+    def test_influence_length_balances_slip_area(self) -> None:
+        x, stress = uniform_friction_profiles(
+            [1116.0, 1116.0, 1000.0], [0.19, 0.19, 0.25], [0.18, 0.6, 0.9], [0.0015, 0.002, 0.003], [32.5, 60.0, 80.0], stations=2001
+        )
+        slip = np.array([6.0, 6.0, 8.0])
+
+        result = solve_anchorage_set(x, stress, slip_mm=slip, ep_mpa=195000.0)
+
+        np.testing.assert_allclose(lost_area(result), 195000.0 * slip / 1000.0, rtol=1e-4)
+        self.assertTrue(np.all(result.influence_length_m < x[:, -1]))
+        self.assertTrue(np.all(result.influence_length_m > 0))
+        beyond = result.x_m > result.influence_length_m[:, None]
+        np.testing.assert_array_equal(result.stress_after_mpa[beyond], result.stress_before_mpa[beyond])
+        self.assertTrue(np.all(result.eta_anc > 0))
+
+    def test_slip_beyond_tendon_spreads_remaining_loss(self) -> None:
+        x, stress = uniform_friction_profiles(1116.0, 0.05, 0.05, 0.0005, 10.0, stations=501)
+
+        result = solve_anchorage_set(x, stress, slip_mm=6.0, ep_mpa=195000.0)
+
+        self.assertEqual(float(result.influence_length_m[0]), 10.0)
+        self.assertAlmostEqual(float(lost_area(result)[0]), 195000.0 * 6.0 / 1000.0, places=3)
+
+    def test_zero_slip_leaves_profile_untouched(self) -> None:
+        x, stress = uniform_friction_profiles(1116.0, 0.19, 0.18, 0.0015, 32.5)
+
+        result = solve_anchorage_set(x, stress, slip_mm=0.0, ep_mpa=195000.0)
+
+        np.testing.assert_array_equal(result.stress_after_mpa, result.stress_before_mpa)
+        self.assertEqual(float(result.eta_anc[0]), 0.0)
+
+    def test_unknown_mode_raises(self) -> None:
+        x, stress = uniform_friction_profiles(1116.0, 0.19, 0.18, 0.0015, 32.5)
+        with self.assertRaises(ValueError):
+            solve_anchorage_set(x, stress, slip_mm=6.0, ep_mpa=195000.0, mode="otro")
+
+
+if __name__ == "__main__":
+    unittest.main()
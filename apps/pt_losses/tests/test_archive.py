@@ -0,0 +1,99 @@
+import contextlib
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from pt_losses.cli.main import run
+from pt_losses.services.archive import ColumnArchiveWriter, convert_archive, open_archive
+from pt_losses.services.monte_carlo import Distribution, run_monte_carlo
+from pt_losses.services.sweep import SweepAxis, iter_sweep_chunks, write_sweep
+from fixtures import SAMPLE_MAPPING
+
+
+class ColumnArchiveTests(unittest.TestCase):
+    def test_chunks_round_trip_through_memmaps(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "datos.npycols"
+            with ColumnArchiveWriter(path, ["a", "b"]) as writer:
+                writer.append({"a": np.arange(3.0), "b": 1.5})
+                writer.append({"a": np.arange(3.0, 5.0), "b": np.array([2.5, 3.5])})
+
+            archive = open_archive(path)
+            column = archive.column("a")
+
+            self.assertIsInstance(column, np.memmap)
+            self.assertEqual(len(archive), 5)
+            np.testing.assert_array_equal(column, np.arange(5.0))
+            np.testing.assert_array_equal(np.load(path / "b.npy"), [1.5, 1.5, 1.5, 2.5, 3.5])
+            self.assertEqual([len(chunk["a"]) for chunk in archive.iter_chunks(2)], [2, 2, 1])
+            del column
+
+    def test_unfinished_archive_has_no_manifest(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "datos.npycols"
+            writer = ColumnArchiveWriter(path, ["a"])
+            writer.append({"a": [1.0]})
+
+            with self.assertRaises(FileNotFoundError):
+                open_archive(path)
+            writer.close()
+            with self.assertRaises(KeyError):
+                ColumnArchiveWriter(path, ["a", "b"]).append({"a": [1.0]})
+
+    def test_failed_write_closes_files_without_manifest(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "datos.npycols"
+            with self.assertRaises(RuntimeError):
+                with ColumnArchiveWriter(path, ["a"]) as writer:
+                    writer.append({"a": [1.0, 2.0]})
+                    raise RuntimeError("interrumpido")
+
+            self.assertTrue(writer.closed)
+            self.assertFalse((path / "manifest.json").exists())
+            with self.assertRaises(FileNotFoundError):
+                open_archive(path)
+
+    def test_sweep_archive_matches_in_memory_results_and_converts(self) -> None:
+        axes = [SweepAxis.parse("mu_fric=0.1:0.3:7"), SweepAxis.parse("tendon_length=20,40,60")]
+        expected = [results for _, results in iter_sweep_chunks(SAMPLE_MAPPING, axes, chunk_size=100)][0]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "barrido.npycols"
+            self.assertEqual(write_sweep(path, SAMPLE_MAPPING, axes, chunk_size=4), 21)
+
+            archive = open_archive(path)
+            results = archive.results()
+            for name, values in expected.columns().items():
+                np.testing.assert_allclose(getattr(results, name), values, rtol=0, atol=0)
+            self.assertEqual(archive.parameter_names, ("mu_fric", "tendon_length"))
+
+            converted = Path(temp_dir) / "barrido.csv"
+            direct = Path(temp_dir) / "directo.csv"
+            self.assertEqual(convert_archive(path, converted, chunk_size=5), 21)
+            write_sweep(direct, SAMPLE_MAPPING, axes)
+            self.assertEqual(converted.read_text(encoding="utf-8"), direct.read_text(encoding="utf-8"))
+            del archive, results
+
+    def test_monte_carlo_and_cli_converter(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "mc.npycols"
+            summary = run_monte_carlo(
+                SAMPLE_MAPPING, {"mu_fric": Distribution.uniform(0.15, 0.25)}, 50, block_size=16, seed=3, archive=path
+            )
+            output = Path(temp_dir) / "mc.ndjson"
+            stdout = io.StringIO()
+            with contextlib.redirect_stdout(stdout):
+                self.assertEqual(run(["convertir", str(path), str(output)]), 0)
+
+            rows = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+        self.assertEqual(json.loads(stdout.getvalue())["filas"], 50)
+        self.assertEqual(len(rows), summary.samples)
+        self.assertTrue(all(0.15 <= row["mu_fric"] <= 0.25 for row in rows))
+        self.assertIn("eta_total", rows[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
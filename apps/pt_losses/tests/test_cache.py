@@ -0,0 +1,128 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from pt_losses.cli.main import run
+from pt_losses.domain.models import INPUT_KEYS, LossesInput
+from pt_losses.services.cache import CacheStats, CachedCalculator, DiskCache, input_digest
+from pt_losses.services.calculator import calculate_losses, calculate_losses_batch
+from fixtures import SAMPLE_MAPPING
+
+
+class CachedCalculatorTests(unittest.TestCase):
+    def test_hits_misses_and_evictions(self) -> None:
+        calculator = CachedCalculator(max_size=2)
+        first = LossesInput.from_mapping(SAMPLE_MAPPING)
+        second = LossesInput.from_mapping({**SAMPLE_MAPPING, "mu_fric": 0.2})
+        third = LossesInput.from_mapping({**SAMPLE_MAPPING, "mu_fric": 0.21})
+
+        result = calculator(first)
+        self.assertIs(calculator(LossesInput.from_mapping(SAMPLE_MAPPING)), result)
+        calculator(second)
+        calculator(third)
+        calculator(first)
+
+        stats = calculator.stats
+        self.assertEqual(result, calculate_losses(first))
+        self.assertEqual((stats.hits, stats.misses, stats.evictions, stats.size), (1, 4, 2, 2))
+        self.assertAlmostEqual(stats.hit_rate, 0.2)
+        self.assertEqual(stats.to_dict()["capacidad"], 2)
+
+        calculator.clear()
+        self.assertEqual(calculator.stats, CacheStats(hits=0, misses=0, evictions=0, size=0, max_size=2))
+
+    def test_recently_used_entry_survives_eviction(self) -> None:
+        calculator = CachedCalculator(max_size=2)
+        first = LossesInput.from_mapping(SAMPLE_MAPPING)
+        second = LossesInput.from_mapping({**SAMPLE_MAPPING, "mu_fric": 0.2})
+
+        calculator(first)
+        calculator(second)
+        calculator(first)
+        calculator(LossesInput.from_mapping({**SAMPLE_MAPPING, "mu_fric": 0.21}))
+        calculator(first)
+
+        self.assertEqual(calculator.stats.hits, 2)
+
+    def test_invalid_size_raises(self) -> None:
+        with self.assertRaises(ValueError):
+            CachedCalculator(max_size=0)
+
+
+class DiskCacheTests(unittest.TestCase):
+    def test_digest_is_canonical_and_versioned(self) -> None:
+        base = LossesInput.from_mapping(SAMPLE_MAPPING)
+        reordered = LossesInput.from_mapping(dict(reversed(list(SAMPLE_MAPPING.items()))))
+
+        self.assertEqual(input_digest(base), input_digest(reordered))
+        self.assertNotEqual(input_digest(base), input_digest(base, version="0.0.0"))
+        self.assertNotEqual(
+            input_digest(base), input_digest(LossesInput.from_mapping({**SAMPLE_MAPPING, "mu_fric": 0.2}))
+        )
+
+    def test_hits_survive_new_instances_and_evict_least_recent(self) -> None:
+        inputs = [LossesInput.from_mapping({**SAMPLE_MAPPING, "mu_fric": 0.18 + 0.01 * i}) for i in range(3)]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            first = DiskCache(temp_dir, max_entries=2)
+            self.assertEqual(first.nested_result(inputs[0]), calculate_losses(inputs[0]).to_nested_dict())
+            first.nested_result(inputs[1])
+            old = first._path(input_digest(inputs[0]))
+            os.utime(old, ns=(1, 1))
+
+            second = DiskCache(temp_dir, max_entries=2)
+            second.nested_result(inputs[1])
+            second.nested_result(inputs[2])
+
+            stats = second.stats
+            self.assertEqual((stats.hits, stats.misses, stats.evictions, stats.size), (1, 1, 1, 2))
+            self.assertFalse(old.exists())
+            self.assertEqual(list(Path(temp_dir).rglob(".tmp-*")), [])
+
+    def test_corrupt_entry_is_recomputed(self) -> None:
+        loss_input = LossesInput.from_mapping(SAMPLE_MAPPING)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = DiskCache(temp_dir)
+            cache.nested_result(loss_input)
+            cache._path(input_digest(loss_input)).write_text("{", encoding="utf-8")
+
+            self.assertEqual(cache.nested_result(loss_input), calculate_losses(loss_input).to_nested_dict())
+            self.assertEqual(cache.stats.misses, 2)
+
+    def test_cli_reports_hits_with_stats(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_path = Path(temp_dir) / "input.json"
+            input_path.write_text(json.dumps(SAMPLE_MAPPING), encoding="utf-8")
+            argv = ["--entrada", str(input_path), "--cache", str(Path(temp_dir) / "cache"), "--stats"]
+            reports = []
+            for _ in range(2):
+                stdout, stderr = io.StringIO(), io.StringIO()
+                with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                    self.assertEqual(run(argv), 0)
+                reports.append((json.loads(stdout.getvalue()), json.loads(stderr.getvalue())["cache"]))
+
+        self.assertEqual(reports[0][0], reports[1][0])
+        self.assertEqual((reports[0][1]["aciertos"], reports[0][1]["fallos"]), (0, 1))
+        self.assertEqual((reports[1][1]["aciertos"], reports[1][1]["fallos"]), (1, 0))
+
+
+class BatchDeduplicationTests(unittest.TestCase):
+    def test_deduplicated_batch_scatters_results(self) -> None:
+        scenarios = [SAMPLE_MAPPING, {**SAMPLE_MAPPING, "n_tendons": 4}, SAMPLE_MAPPING, SAMPLE_MAPPING]
+        columns = {key: np.array([scenario[key] for scenario in scenarios], dtype=float) for key in INPUT_KEYS}
+
+        plain = calculate_losses_batch(columns)
+        deduplicated = calculate_losses_batch(columns, deduplicate=True)
+
+        self.assertEqual(len(deduplicated), 4)
+        for name, values in plain.columns().items():
+            np.testing.assert_array_equal(getattr(deduplicated, name), values)
+
+
+if __name__ == "__main__":
+    unittest.main()
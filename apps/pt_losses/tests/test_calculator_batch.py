@@ -0,0 +1,72 @@
+import unittest
+
+import numpy as np
+
+from pt_losses.domain.models import INPUT_KEYS, LossesInput
+from pt_losses.services.calculator import MAX_TOTAL_LOSS_RATIO, calculate_losses, calculate_losses_batch
+from fixtures import SAMPLE_MAPPING, build_scenarios
+
+
+def scalar_columns(mapping: dict[str, float]) -> dict[str, float]:
+    result = calculate_losses(LossesInput.from_mapping(mapping))
+    return {
+        "sigma_max_mpa": result.sigma_max_mpa,
+        "sigma_0_mpa": result.sigma_0_mpa,
+        "sigma_inf_mpa": result.sigma_inf_mpa,
+        "eta_fr": result.losses.eta_fr,
+        "eta_anc": result.losses.eta_anc,
+        "eta_el": result.losses.eta_el,
+        "eta_rel": result.losses.eta_rel,
+        "eta_flu": result.losses.eta_flu,
+        "eta_ret": result.losses.eta_ret,
+        "eta_total": result.losses.eta_total,
+        "t0_percent": result.rfem.t0_percent,
+        "tinf_percent": result.rfem.tinf_percent,
+        "t0_permille": result.rfem.t0_permille,
+        "tinf_permille": result.rfem.tinf_permille,
+        "initial_force_per_tendon_kn": result.initial_force_per_tendon_kn,
+        "initial_force_total_kn": result.initial_force_total_kn,
+        "final_force_per_tendon_kn": result.final_force_per_tendon_kn,
+        "final_force_total_kn": result.final_force_total_kn,
+    }
+
+
+class CalculatorBatchTests(unittest.TestCase):
+    def test_batch_matches_scalar_path(self) -> None:
+        scenarios = build_scenarios()
+        columns = {key: np.array([scenario[key] for scenario in scenarios]) for key in INPUT_KEYS}
+
+        batch = calculate_losses_batch(columns)
+
+        for row, scenario in enumerate(scenarios):
+            for name, expected in scalar_columns(scenario).items():
+                self.assertAlmostEqual(getattr(batch, name)[row], expected, places=9, msg=f"{name} fila {row}")
+
+    def test_batch_applies_cap_and_zero_sigma(self) -> None:
+        scenarios = build_scenarios()
+        columns = {key: [scenario[key] for scenario in scenarios] for key in INPUT_KEYS}
+
+        batch = calculate_losses_batch(columns)
+
+        self.assertEqual(batch.eta_total[1], MAX_TOTAL_LOSS_RATIO)
+        self.assertEqual(batch.eta_anc[2], 0.0)
+        self.assertEqual(batch.eta_el[2], 0.0)
+
+    def test_batch_broadcasts_scalar_columns(self) -> None:
+        columns: dict[str, object] = dict(SAMPLE_MAPPING)
+        columns["mu_fric"] = np.linspace(0.1, 0.3, 5)
+
+        batch = calculate_losses_batch(columns)
+
+        self.assertEqual(batch.eta_total.shape, (5,))
+        self.assertTrue(np.all(np.diff(batch.eta_fr) > 0))
+
+    def test_batch_requires_every_column(self) -> None:
+        columns = dict(SAMPLE_MAPPING)
+        del columns["Ep"]
+        with self.assertRaises(KeyError):
+            calculate_losses_batch(columns)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import contextlib
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from pt_losses.cli.main import run
+from pt_losses.domain.models import INPUT_KEYS
+from pt_losses.services.coupled import concrete_stress_from_force, solve_coupled
+from fixtures import SAMPLE_MAPPING
+
+
+def member_columns(rows: int) -> dict[str, np.ndarray]:
+    columns = {key: np.full(rows, float(SAMPLE_MAPPING[key])) for key in INPUT_KEYS}
+    columns["n_tendons"] = np.linspace(4, 24, rows).round()
+    columns["eccentricity"] = np.linspace(0.0, 0.3, rows)
+    return columns
+
+
+class CoupledSolverTests(unittest.TestCase):
+    def test_solution_is_self_consistent_for_many_members(self) -> None:
+        columns = member_columns(50)
+        moment = np.linspace(0.0, 150.0, 50)
+
+        solution = solve_coupled(columns, section_area=0.5, section_inertia=0.04, external_moment=moment)
+
+        self.assertTrue(np.all(solution.converged))
+        implied = concrete_stress_from_force(
+            solution.results.final_force_total_kn, 0.5, 0.04, columns["eccentricity"], moment
+        )
+        np.testing.assert_allclose(solution.concrete_stress_mpa, implied, rtol=1e-8, atol=1e-10)
+
+    def test_aitken_needs_fewer_iterations_than_plain_updates(self) -> None:
+        columns = member_columns(10)
+
+        accelerated = solve_coupled(columns, section_area=0.2, section_inertia=0.01)
+        plain = solve_coupled(columns, section_area=0.2, section_inertia=0.01, accelerate=False, max_iterations=200)
+
+        self.assertTrue(np.all(plain.converged))
+        np.testing.assert_allclose(accelerated.concrete_stress_mpa, plain.concrete_stress_mpa, rtol=1e-7)
+        self.assertLess(accelerated.iterations.max(), plain.iterations.max())
+
+    def test_iteration_cap_is_reported_per_row(self) -> None:
+        solution = solve_coupled(member_columns(3), section_area=0.2, section_inertia=0.01, accelerate=False, max_iterations=1)
+
+        self.assertFalse(np.any(solution.converged))
+        self.assertEqual(solution.iterations.tolist(), [1, 1, 1])
+
+    def test_rejects_invalid_section(self) -> None:
+        with self.assertRaises(ValueError):
+            solve_coupled(member_columns(2), section_area=0.0, section_inertia=0.01)
+
+    def test_cli_coupled_mode(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_path = Path(temp_dir) / "input.json"
+            output_path = Path(temp_dir) / "output.json"
+            input_path.write_text(
+                json.dumps({**SAMPLE_MAPPING, "section_area": 0.5, "section_inertia": 0.04, "external_moment": 80.0}),
+                encoding="utf-8",
+            )
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                exit_code = run(["--entrada", str(input_path), "--salida", str(output_path), "--acoplado"])
+
+            self.assertEqual(exit_code, 0)
+            coupling = json.loads(output_path.read_text(encoding="utf-8"))["acoplamiento"]
+            self.assertTrue(coupling["convergido"])
+            self.assertGreater(coupling["tension_hormigon_MPa"], 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import contextlib
+import csv
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+from pt_losses.cli.main import run
+from pt_losses.domain.models import INPUT_KEYS, LossesInput
+from pt_losses.services.calculator import calculate_losses
+from pt_losses.services.io import RESULT_CSV_FIELDS, iter_csv_input_chunks, process_csv_file
+from fixtures import SAMPLE_MAPPING
+
+
+def write_schedule(path: Path, rows: list[dict[str, object]]) -> None:
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=["id", *INPUT_KEYS])
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+class CsvBulkIoTests(unittest.TestCase):
+    def test_reads_in_chunks_with_ids(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source = Path(temp_dir) / "tendones.csv"
+            write_schedule(source, [{"id": f"T{index}", **SAMPLE_MAPPING} for index in range(5)])
+
+            chunks = list(iter_csv_input_chunks(source, chunk_size=2))
+
+        self.assertEqual([ids for ids, _ in chunks], [["T0", "T1"], ["T2", "T3"], ["T4"]])
+        self.assertEqual(chunks[2][1]["Ap"].tolist(), [SAMPLE_MAPPING["Ap"]])
+
+    def test_results_csv_follows_gui_field_order(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source = Path(temp_dir) / "tendones.csv"
+            target = Path(temp_dir) / "resultados.csv"
+            write_schedule(
+                source,
+                [
+                    {"id": "A", **SAMPLE_MAPPING},
+                    {"id": "B", **SAMPLE_MAPPING, "creep_coeff": -1.0},
+                    {"id": "C", **SAMPLE_MAPPING, "n_tendons": 3},
+                ],
+            )
+
+            written = process_csv_file(source, target, chunk_size=2)
+
+            with target.open(encoding="utf-8", newline="") as handle:
+                rows = list(csv.reader(handle))
+
+        expected = calculate_losses(LossesInput.from_mapping(SAMPLE_MAPPING)).to_dict()
+        self.assertEqual(written, 3)
+        self.assertEqual(rows[0], ["id", *(key for _, key in RESULT_CSV_FIELDS), "errores"])
+        self.assertEqual(rows[1][0], "A")
+        self.assertAlmostEqual(float(rows[1][7]), expected["fuerza_final_total_kN"])
+        self.assertEqual(rows[2][1:-1], [""] * len(RESULT_CSV_FIELDS))
+        self.assertEqual(rows[2][-1], "creep_coeff no puede ser negativo.")
+        self.assertAlmostEqual(float(rows[3][7]), expected["fuerza_final_por_tendon_kN"] * 3)
+
+    def test_blank_and_non_numeric_cells_are_reported_per_row(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source = Path(temp_dir) / "tendones.csv"
+            target = Path(temp_dir) / "resultados.csv"
+            write_schedule(
+                source,
+                [
+                    {"id": "A", **SAMPLE_MAPPING, "Ap": ""},
+                    {"id": "B", **SAMPLE_MAPPING},
+                    {"id": "C", **SAMPLE_MAPPING, "mu_fric": "n/d"},
+                ],
+            )
+
+            written = process_csv_file(source, target, chunk_size=2)
+
+            with target.open(encoding="utf-8", newline="") as handle:
+                rows = list(csv.reader(handle))
+
+        self.assertEqual(written, 3)
+        self.assertEqual(rows[1][-1], "Ap vacio o no numerico.")
+        self.assertEqual(rows[2][-1], "")
+        self.assertNotEqual(rows[2][7], "")
+        self.assertEqual(rows[3][-1], "mu_fric vacio o no numerico.")
+
+    def test_cli_batch_accepts_csv(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source = Path(temp_dir) / "tendones.csv"
+            target = Path(temp_dir) / "resultados.csv"
+            write_schedule(source, [{"id": "A", **SAMPLE_MAPPING}])
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                exit_code = run(["--entrada", str(source), "--batch", "--salida", str(target)])
+
+            self.assertEqual(exit_code, 0)
+            self.assertEqual(len(target.read_text(encoding="utf-8").splitlines()), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+
+import numpy as np
+
+from pt_losses.domain.models import INPUT_KEYS
+from pt_losses.services.anchorage import solve_anchorage_set
+from pt_losses.services.double_end import double_end_envelope, solve_double_end
+from pt_losses.services.friction_profile import uniform_friction_profiles
+from fixtures import SAMPLE_MAPPING
+
+
+def long_tendon_columns(lengths: list[float]) -> dict[str, object]:
+    columns: dict[str, object] = {key: SAMPLE_MAPPING[key] for key in INPUT_KEYS}
+    columns["tendon_length"] = np.asarray(lengths)
+    columns["theta_total"] = 0.012 * np.asarray(lengths)
+    return columns
+
+
+class DoubleEndStressingTests(unittest.TestCase):
+    def test_symmetric_tendons_have_low_point_at_midspan(self) -> None:
+        lengths = [90.0, 120.0]
+
+        result = solve_double_end(long_tendon_columns(lengths), stations=401)
+
+        np.testing.assert_allclose(result.low_point_m, np.asarray(lengths) / 2.0)
+        np.testing.assert_allclose(result.envelope_mpa, result.envelope_mpa[:, ::-1])
+        self.assertTrue(np.all(result.envelope_mpa >= result.stress_left_mpa))
+        self.assertTrue(np.all(result.envelope_mpa >= result.stress_right_mpa))
+        self.assertTrue(np.all(result.low_point_stress_mpa <= result.average_stress_mpa))
+
+    def test_anchorage_set_can_govern_short_tendons(self) -> None:
+        result = solve_double_end(long_tendon_columns([60.0]), stations=401)
+
+        self.assertEqual(result.low_point_m[0], 0.0)
+        self.assertAlmostEqual(result.low_point_stress_mpa[0], result.envelope_mpa[0, -1])
+
+    def test_improves_on_single_end_stressing(self) -> None:
+        columns = long_tendon_columns([100.0])
+        result = solve_double_end(columns, stations=401)
+        x, stress = uniform_friction_profiles(1116.0, 0.19, 1.2, 0.0015, 100.0, stations=401)
+
+        single = solve_anchorage_set(x, stress, slip_mm=6.0, ep_mpa=195000.0).stress_after_mpa
+
+        self.assertGreater(result.low_point_stress_mpa[0], single[0, -1])
+        expected_force = result.average_stress_mpa[0] * SAMPLE_MAPPING["n_tendons"] * SAMPLE_MAPPING["Ap"] / 1000.0
+        self.assertAlmostEqual(result.average_force_total_kn[0], expected_force)
+
+    def test_unequal_anchor_profiles_shift_low_point(self) -> None:
+        x = np.linspace(0.0, 80.0, 321)
+        from_left = 1200.0 * np.exp(-0.004 * x)
+        from_right = 1100.0 * np.exp(-0.004 * (80.0 - x))
+
+        result = double_end_envelope(x, from_left, from_right, slip_mm=0.0, ep_mpa=195000.0)
+
+        self.assertGreater(result.low_point_m[0], 40.0)
+        np.testing.assert_array_equal(result.influence_left_m, [0.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
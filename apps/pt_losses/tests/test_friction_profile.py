@@ -0,0 +1,69 @@
+import math
+import unittest
+
+import numpy as np
+
+from pt_losses.domain.models import LossesInput
+from pt_losses.domain.tendon_geometry import TendonGeometry
+from pt_losses.services.calculator import calculate_losses
+from pt_losses.services.friction_profile import FrictionProfile
+from fixtures import SAMPLE_MAPPING
+
+
+class TendonSegmentsTests(unittest.TestCase):
+    def test_from_segments_derives_totals(self) -> None:
+        geometry = TendonGeometry.from_segments(150.0, 4, [(10.0, 0.05), (12.5, 0.1), (10.0, 0.03)], 0.2)
+
+        self.assertAlmostEqual(geometry.length_m, 32.5)
+        self.assertAlmostEqual(geometry.theta_total_rad, 0.18)
+        self.assertEqual(len(geometry.profile), 3)
+
+    def test_segments_must_match_totals(self) -> None:
+        with self.assertRaises(ValueError):
+            TendonGeometry(150.0, 4, 30.0, 0.18, 0.2, segments=((10.0, 0.18),))
+
+    def test_from_mapping_accepts_segments(self) -> None:
+        mapping = {key: value for key, value in SAMPLE_MAPPING.items() if key not in {"tendon_length", "theta_total"}}
+        mapping["tendon_segments"] = [[10.0, 0.05], [12.5, 0.1], [10.0, 0.03]]
+
+        segmented = LossesInput.from_mapping(mapping)
+
+        self.assertAlmostEqual(
+            calculate_losses(segmented).losses.eta_fr,
+            calculate_losses(LossesInput.from_mapping(SAMPLE_MAPPING)).losses.eta_fr,
+            places=12,
+        )
+
+
+class FrictionProfileTests(unittest.TestCase):
+    def test_single_segment_matches_dead_end_loss(self) -> None:
+        loss_input = LossesInput.from_mapping(SAMPLE_MAPPING)
+        profile = FrictionProfile.from_input(loss_input)
+
+        self.assertAlmostEqual(
+            float(profile.loss_ratio_at(loss_input.geometry.length_m)),
+            calculate_losses(loss_input).losses.eta_fr,
+            places=12,
+        )
+
+    def test_segmented_angles_follow_prefix_sums(self) -> None:
+        geometry = TendonGeometry.from_segments(150.0, 4, [(10.0, 0.0), (10.0, 0.2)], 0.2)
+        profile = FrictionProfile.from_geometry(geometry, mu_fric=0.2, k_wobble=0.001)
+
+        angles = profile.angle_at([0.0, 5.0, 10.0, 15.0, 20.0])
+        stresses = profile.stress_at(np.linspace(0.0, 20.0, 1001), sigma_0_mpa=1000.0)
+
+        np.testing.assert_allclose(angles, [0.0, 0.0, 0.0, 0.1, 0.2])
+        self.assertEqual(stresses[0], 1000.0)
+        self.assertTrue(np.all(np.diff(stresses) < 0))
+        self.assertAlmostEqual(stresses[-1], 1000.0 * math.exp(-(0.2 * 0.2 + 0.001 * 20.0)))
+
+    def test_stations_outside_tendon_raise(self) -> None:
+        profile = FrictionProfile.from_input(LossesInput.from_mapping(SAMPLE_MAPPING))
+
+        with self.assertRaises(ValueError):
+            profile.stress_at([40.0], sigma_0_mpa=1000.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
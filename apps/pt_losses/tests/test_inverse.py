@@ -0,0 +1,77 @@
+import unittest
+
+import numpy as np
+
+from pt_losses.domain.models import INPUT_KEYS, LossesInput
+from pt_losses.services.calculator import MAX_TOTAL_LOSS_RATIO, calculate_losses
+from pt_losses.services.inverse import bracketed_root, solve_for_target
+from fixtures import SAMPLE_MAPPING
+
+
+def sample_columns(**overrides: object) -> dict[str, object]:
+    return {key: overrides.get(key, SAMPLE_MAPPING[key]) for key in INPUT_KEYS}
+
+
+class BracketedRootTests(unittest.TestCase):
+    def test_solves_many_rows_and_accepts_warm_start(self) -> None:
+        targets = np.array([0.1, 0.5, 2.0])
+
+        cold, cold_iterations = bracketed_root(lambda x: x**3 - targets, 0.0, 2.0)
+        warm, warm_iterations = bracketed_root(lambda x: x**3 - targets, 0.0, 2.0, guess=cold + 1e-4)
+
+        np.testing.assert_allclose(cold, np.cbrt(targets), rtol=1e-10)
+        np.testing.assert_allclose(warm, np.cbrt(targets), rtol=1e-10)
+        self.assertLessEqual(warm_iterations, cold_iterations)
+
+
+class InverseSolverTests(unittest.TestCase):
+    def test_jacking_ratio_reproduces_target_force(self) -> None:
+        expected = calculate_losses(LossesInput.from_mapping(SAMPLE_MAPPING))
+        targets = np.array([0.5, 1.0, 1.2]) * expected.final_force_total_kn
+
+        solution = solve_for_target(sample_columns(), target_force_kn=targets)
+
+        np.testing.assert_allclose(solution.results.final_force_total_kn, targets, rtol=1e-9)
+        self.assertAlmostEqual(solution.mu_tesado[1], SAMPLE_MAPPING["mu_tesado"], places=9)
+        self.assertTrue(np.all(solution.feasible))
+
+    def test_target_sigma_inf_within_capped_region(self) -> None:
+        columns = sample_columns(k_wobble=0.5, relaxation_loss_ratio=0.5)
+
+        solution = solve_for_target(columns, target_sigma_inf_mpa=10.0)
+
+        self.assertEqual(solution.results.eta_total[0], MAX_TOTAL_LOSS_RATIO)
+        self.assertAlmostEqual(solution.results.sigma_inf_mpa[0], 10.0, places=8)
+
+    def test_unreachable_target_is_flagged(self) -> None:
+        solution = solve_for_target(sample_columns(), target_force_kn=1e6)
+
+        self.assertFalse(solution.feasible[0])
+        self.assertEqual(solution.mu_tesado[0], 1.0)
+
+    def test_minimum_tendon_count(self) -> None:
+        per_tendon = calculate_losses(LossesInput.from_mapping(SAMPLE_MAPPING)).final_force_per_tendon_kn
+
+        solution = solve_for_target(sample_columns(), target_force_kn=[per_tendon * 7, per_tendon * 7 + 1.0], mode="n_tendons")
+
+        self.assertEqual(solution.n_tendons.tolist(), [7, 8])
+        np.testing.assert_array_equal(solution.mu_tesado, SAMPLE_MAPPING["mu_tesado"])
+
+    def test_both_uses_fewest_tendons_then_solves_ratio(self) -> None:
+        target = 2000.0
+
+        solution = solve_for_target(sample_columns(), target_force_kn=target, mode="ambos")
+
+        self.assertTrue(solution.feasible[0])
+        self.assertLessEqual(solution.mu_tesado[0], 1.0)
+        self.assertAlmostEqual(solution.results.final_force_total_kn[0], target, places=6)
+        fewer = solve_for_target(sample_columns(n_tendons=solution.n_tendons[0] - 1), target_force_kn=target)
+        self.assertFalse(fewer.feasible[0])
+
+    def test_requires_single_target(self) -> None:
+        with self.assertRaises(ValueError):
+            solve_for_target(sample_columns(), target_force_kn=1000.0, target_sigma_inf_mpa=800.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+
+import numpy as np
+
+from pt_losses.domain.models import INPUT_KEYS, RESULT_FIELDS, LossesInput
+from pt_losses.services import kernels
+from pt_losses.services.calculator import MAX_TOTAL_LOSS_RATIO, calculate_losses, calculate_losses_batch
+from pt_losses.services.kernels import available_backends, resolve_backend
+from fixtures import build_scenarios
+
+
+def scenario_columns() -> dict[str, np.ndarray]:
+    scenarios = build_scenarios()
+    return {key: np.array([scenario[key] for scenario in scenarios], dtype=float) for key in INPUT_KEYS}
+
+
+class BackendEquivalenceTests(unittest.TestCase):
+    def test_every_backend_matches_scalar_calculator(self) -> None:
+        expected = [calculate_losses(LossesInput.from_mapping(scenario)) for scenario in build_scenarios()]
+
+        for backend in available_backends():
+            with self.subTest(backend=backend):
+                batch = calculate_losses_batch(scenario_columns(), backend=backend)
+                for row, result in zip(batch, expected):
+                    expected_values = result.to_dict()
+                    for key, value in row.to_dict().items():
+                        self.assertAlmostEqual(value, expected_values[key], places=9, msg=key)
+
+    def test_uncompiled_kernel_matches_numpy_pipeline(self) -> None:
+        columns = scenario_columns()
+        inputs = np.column_stack([columns[key] for key in INPUT_KEYS])
+        out = np.empty((len(RESULT_FIELDS), inputs.shape[0]))
+
+        getattr(kernels.fused_rows, "py_func", kernels.fused_rows)(inputs, MAX_TOTAL_LOSS_RATIO, out)
+
+        reference = calculate_losses_batch(columns, backend="numpy")
+        for position, (name, _) in enumerate(RESULT_FIELDS):
+            np.testing.assert_allclose(out[position], getattr(reference, name), rtol=1e-13, atol=1e-13, err_msg=name)
+
+    @unittest.skipIf(kernels.numba is None, "numba no esta instalado")
+    def test_numba_kernel_matches_numpy_pipeline(self) -> None:
+        columns = scenario_columns()
+        compiled = calculate_losses_batch(columns, backend="numba")
+        reference = calculate_losses_batch(columns, backend="numpy")
+        for name, _ in RESULT_FIELDS:
+            np.testing.assert_allclose(getattr(compiled, name), getattr(reference, name), rtol=1e-12, atol=1e-12, err_msg=name)
+
+
+class BackendSelectionTests(unittest.TestCase):
+    def test_auto_picks_an_installed_backend(self) -> None:
+        self.assertIn(resolve_backend("auto"), available_backends())
+
+    def test_rejects_unknown_or_missing_backend(self) -> None:
+        with self.assertRaises(ValueError):
+            resolve_backend("cuda")
+        if kernels.numba is None:
+            with self.assertRaises(ValueError):
+                calculate_losses_batch(scenario_columns(), backend="numba")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+
+import numpy as np
+
+from pt_losses.services.monte_carlo import Distribution, StreamingStatistics, run_monte_carlo
+from fixtures import SAMPLE_MAPPING
+
+
+class StreamingStatisticsTests(unittest.TestCase):
+    def test_matches_numpy_across_blocks_with_growing_range(self) -> None:
+        rng = np.random.default_rng(7)
+        blocks = [rng.normal(0.0, 1.0, 5000), rng.normal(10.0, 3.0, 5000), rng.normal(-20.0, 1.0, 5000)]
+        stats = StreamingStatistics()
+
+        for block in blocks:
+            stats.update(block)
+
+        everything = np.concatenate(blocks)
+        self.assertEqual(stats.count, everything.size)
+        self.assertAlmostEqual(stats.mean, float(everything.mean()), places=9)
+        self.assertAlmostEqual(stats.variance, float(everything.var(ddof=1)), places=6)
+        self.assertEqual(stats.minimum, float(everything.min()))
+        tolerance = (everything.max() - everything.min()) / 1000
+        for percent in (5, 50, 95):
+            self.assertAlmostEqual(stats.percentile(percent), float(np.percentile(everything, percent)), delta=tolerance)
+
+    def test_constant_values(self) -> None:
+        stats = StreamingStatistics()
+        stats.update(np.full(10, 3.5))
+
+        self.assertEqual(stats.percentile(50), 3.5)
+        self.assertEqual(stats.std, 0.0)
+
+
+class MonteCarloTests(unittest.TestCase):
+    def test_seeded_runs_are_reproducible(self) -> None:
+        distributions = {
+            "mu_fric": Distribution.normal(0.19, 0.03),
+            "creep_coeff": Distribution.lognormal(1.8, 0.3),
+            "relaxation_loss_ratio": Distribution.uniform(0.02, 0.03),
+        }
+
+        first = run_monte_carlo(SAMPLE_MAPPING, distributions, samples=20_000, block_size=3_000, seed=11)
+        second = run_monte_carlo(SAMPLE_MAPPING, distributions, samples=20_000, block_size=3_000, seed=11)
+
+        summary = first.to_dict()["estadisticas"]["sigma_inf_mpa"]
+        self.assertEqual(summary, second.to_dict()["estadisticas"]["sigma_inf_mpa"])
+        self.assertEqual(summary["muestras"], 20_000)
+        self.assertLess(summary["p5"], summary["p50"])
+        self.assertLess(summary["p50"], summary["p95"])
+
+    def test_samples_are_truncated_to_valid_ranges(self) -> None:
+        distributions = {"mu_tesado": Distribution.normal(0.98, 0.05), "shrinkage_strain": Distribution.normal(0.0, 0.0002)}
+
+        result = run_monte_carlo(SAMPLE_MAPPING, distributions, samples=5_000, seed=3, outputs=("sigma_0_mpa",))
+
+        stats = result.statistics["sigma_0_mpa"]
+        self.assertLessEqual(stats.maximum, 1488.0)
+
+    def test_segments_only_base(self) -> None:
+        base = {key: value for key, value in SAMPLE_MAPPING.items() if key not in ("tendon_length", "theta_total")}
+        base["tendon_segments"] = [[20.0, 0.1], [12.5, 0.08]]
+
+        result = run_monte_carlo(base, {"mu_fric": Distribution.uniform(0.18, 0.20)}, samples=100, seed=5)
+
+        self.assertEqual(result.statistics["sigma_inf_mpa"].count, 100)
+
+    def test_unknown_key_raises(self) -> None:
+        with self.assertRaises(ValueError):
+            run_monte_carlo(SAMPLE_MAPPING, {"mu": Distribution.normal(0.2, 0.01)}, samples=10)
+
+
+if __name__ == "__main__":
+    unittest.main()
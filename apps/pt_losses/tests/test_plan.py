@@ -0,0 +1,55 @@
+import unittest
+
+import numpy as np
+
+from pt_losses.domain.models import LossesInput, LossesResultBatch
+from pt_losses.domain.tendon_geometry import TendonGeometry
+from pt_losses.services.calculator import calculate_losses
+from pt_losses.services.plan import CalculationPlan, calculate_losses_planned
+from fixtures import SAMPLE_MAPPING
+
+
+def assert_batches_close(test: unittest.TestCase, actual: LossesResultBatch, expected: LossesResultBatch) -> None:
+    for name, values in expected.columns().items():
+        np.testing.assert_allclose(getattr(actual, name), values, rtol=1e-12, atol=1e-12, err_msg=name)
+
+
+class CalculationPlanTests(unittest.TestCase):
+    def test_evaluate_matches_calculate_losses(self) -> None:
+        loss_input = LossesInput.from_mapping(SAMPLE_MAPPING)
+        plan = CalculationPlan.from_input(loss_input)
+
+        result = plan.evaluate(loss_input.geometry)
+        expected = calculate_losses(loss_input)
+
+        assert_batches_close(self, LossesResultBatch.from_results([result]), LossesResultBatch.from_results([expected]))
+        self.assertEqual(plan.to_input(loss_input.geometry), loss_input)
+
+    def test_evaluate_many_geometries(self) -> None:
+        plan = CalculationPlan.from_input(LossesInput.from_mapping(SAMPLE_MAPPING))
+        geometries = [TendonGeometry(150.0, count, length, theta, 0.2) for count, length, theta in [(4, 10.0, 0.0), (12, 32.5, 0.18), (8, 90.0, 1.2)]]
+
+        batch = plan.evaluate_many(geometries)
+
+        expected = LossesResultBatch.from_results(calculate_losses(plan.to_input(geometry)) for geometry in geometries)
+        assert_batches_close(self, batch, expected)
+
+    def test_planned_batch_keeps_input_order_across_material_pairs(self) -> None:
+        mappings = [
+            {**SAMPLE_MAPPING, "tendon_length": 20.0 + index, "Ec": 30000.0 + 2000.0 * (index % 3), "fpk": 1770.0 + 90.0 * (index % 2)}
+            for index in range(12)
+        ]
+        inputs = [LossesInput.from_mapping(mapping) for mapping in mappings]
+
+        batch = calculate_losses_planned(inputs)
+
+        assert_batches_close(self, batch, LossesResultBatch.from_results(calculate_losses(item) for item in inputs))
+
+    def test_zero_jacking_ratio_has_no_relative_losses(self) -> None:
+        plan = CalculationPlan.from_input(LossesInput.from_mapping({**SAMPLE_MAPPING, "mu_tesado": 0.0}))
+
+        self.assertEqual((plan.eta_el, plan.eta_flu, plan.eta_ret, plan.anchorage_factor), (0.0, 0.0, 0.0, 0.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+import contextlib
+import csv
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from pt_losses.cli.main import run
+from pt_losses.domain.models import LossesInput
+from pt_losses.services.calculator import calculate_losses
+from pt_losses.services.project import ProjectStore
+from fixtures import SAMPLE_MAPPING
+
+
+def tendon_records(count: int) -> list[dict[str, object]]:
+    return [
+        {
+            **SAMPLE_MAPPING,
+            "id": f"T{index}",
+            "grupo": "A" if index % 2 else "B",
+            "miembro": 100 + index,
+            "material": "Y1860",
+            "mu_fric": 0.10 + 0.02 * index,
+        }
+        for index in range(count)
+    ]
+
+
+class ProjectStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = ProjectStore(Path(self.temp_dir.name) / "proyecto.db")
+
+    def tearDown(self) -> None:
+        self.store.close()
+        self.temp_dir.cleanup()
+
+    def test_results_match_single_calculation_and_filters(self) -> None:
+        records = tendon_records(10)
+        self.assertEqual(self.store.add_tendons(records, chunk_size=3), 10)
+        self.assertEqual(self.store.recalculate(chunk_size=4), 10)
+
+        rows = list(self.store.query_results())
+        expected = [calculate_losses(LossesInput.from_mapping(record)).to_dict() for record in records]
+        for row, reference in zip(rows, expected):
+            for key, value in reference.items():
+                self.assertAlmostEqual(row[key], value)
+
+        high = list(self.store.query_results(min_eta_total=0.30, tendon_group="A", material="Y1860"))
+        self.assertTrue(high)
+        self.assertTrue(all(row["eta_total"] > 0.30 and row["grupo"] == "A" for row in high))
+        self.assertEqual([row["id"] for row in self.store.query_results(member_no=103)], ["T3"])
+        count = self.store.connection.execute("SELECT COUNT(*) FROM materials").fetchone()[0]
+        self.assertEqual(count, 1)
+
+    def test_only_changed_tendons_are_recalculated(self) -> None:
+        records = tendon_records(6)
+        self.store.add_tendons(records)
+        self.store.recalculate()
+
+        records[2] = {**records[2], "mu_fric": 0.3}
+        records[4] = {**records[4], "grupo": "C"}
+        self.store.add_tendons(records)
+
+        self.assertEqual(self.store.dirty_count(), 1)
+        self.assertEqual(self.store.recalculate(), 1)
+        self.store.add_tendons([{**record, "tendon_length": 40.0} for record in records])
+        self.assertEqual(self.store.dirty_count(), 6)
+
+    def test_material_names_are_kept_per_tendon(self) -> None:
+        records = tendon_records(2)
+        records[1] = {**records[1], "material": "Y1860-lote1"}
+        self.store.add_tendons(records)
+        self.store.add_tendons([{**SAMPLE_MAPPING, "id": "T9"}])
+        self.store.recalculate()
+
+        self.assertEqual([row["id"] for row in self.store.query_results(material="Y1860")], ["T0"])
+        self.assertEqual([row["id"] for row in self.store.query_results(material="Y1860-lote1")], ["T1"])
+        rows = {row["id"]: row for row in self.store.query_results()}
+        self.assertIsNone(rows["T9"]["material"])
+        count = self.store.connection.execute("SELECT COUNT(*) FROM materials").fetchone()[0]
+        self.assertEqual(count, 3)
+
+    def test_invalid_rows_store_null_results(self) -> None:
+        self.store.add_tendons([{**SAMPLE_MAPPING, "id": "malo", "mu_tesado": 1.5}, *tendon_records(1)])
+        self.store.recalculate()
+
+        rows = {row["id"]: row for row in self.store.query_results()}
+        self.assertIsNone(rows["malo"]["eta_total"])
+        self.assertIsNotNone(rows["T0"]["eta_total"])
+
+    def test_rfem_records_and_errors(self) -> None:
+        self.store.add_tendons(tendon_records(1))
+
+        record_id = self.store.record_rfem_application("T0", {"casos": [1, 2]}, model_path="modelo.rf6")
+
+        stored = self.store.connection.execute("SELECT member_no, payload FROM rfem_records WHERE id = ?", (record_id,))
+        member_no, payload = stored.fetchone()
+        self.assertEqual((member_no, json.loads(payload)), (100, {"casos": [1, 2]}))
+        with self.assertRaises(KeyError):
+            self.store.record_rfem_application("T9", {})
+        with self.assertRaisesRegex(KeyError, "'id'"):
+            self.store.add_tendons([SAMPLE_MAPPING])
+
+
+class ProjectCliTests(unittest.TestCase):
+    def test_import_calculate_and_query(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source = Path(temp_dir) / "tendones.csv"
+            records = tendon_records(4)
+            with source.open("w", encoding="utf-8", newline="") as handle:
+                writer = csv.DictWriter(handle, fieldnames=list(records[0]))
+                writer.writeheader()
+                writer.writerows(records)
+            project = str(Path(temp_dir) / "proyecto.sqlite")
+
+            stdout = io.StringIO()
+            with contextlib.redirect_stdout(stdout):
+                self.assertEqual(run(["proyecto", project, "--importar", str(source), "--calcular"]), 0)
+            self.assertEqual(json.loads(stdout.getvalue())["recalculados"], 4)
+
+            stdout = io.StringIO()
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(io.StringIO()):
+                run(["proyecto", project, "--consultar", "--grupo", "A"])
+            rows = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        self.assertEqual([row["id"] for row in rows], ["T1", "T3"])
+
+    def test_malformed_import_is_reported_by_the_parser(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source = Path(temp_dir) / "tendones.ndjson"
+            source.write_text(json.dumps({"Ep": 195000.0}) + "\n", encoding="utf-8")
+            project = str(Path(temp_dir) / "proyecto.sqlite")
+
+            stderr = io.StringIO()
+            with contextlib.redirect_stderr(stderr), self.assertRaises(SystemExit):
+                run(["proyecto", project, "--importar", str(source)])
+
+        self.assertIn("No se pudo importar: Cada tendon del proyecto necesita la clave 'id'.", stderr.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from pt_losses.cli.main import run
+from pt_losses.services import io as io_service
+from pt_losses.services.io import iter_input_mappings, load_input_mapping
+
+PROJECT_TEXT = """
+defaults:
+  Ep: 195000.0
+  mu_tesado: 0.75
+  notas: [a, b]
+tendones:
+  - id: T1
+  - id: T2
+    mu_tesado: 0.7
+    # comentario
+    Ep: 196000
+---
+id: V1
+Ep: 190000.0
+...
+"""
+
+EXAMPLE = Path(__file__).resolve().parents[1] / "examples" / "project_tendons.yaml"
+
+
+class SimpleYamlParserTests(unittest.TestCase):
+    def test_fallback_parses_documents_and_tendon_lists(self) -> None:
+        documents = io_service._parse_simple_yaml_documents(PROJECT_TEXT)
+
+        self.assertEqual(len(documents), 2)
+        self.assertEqual(documents[0]["defaults"], {"Ep": 195000.0, "mu_tesado": 0.75, "notas": "[a, b]"})
+        self.assertEqual(documents[0]["tendones"], [{"id": "T1"}, {"id": "T2", "mu_tesado": 0.7, "Ep": 196000}])
+        self.assertEqual(documents[1], {"id": "V1", "Ep": 190000.0})
+
+    def test_fallback_matches_pyyaml_on_the_example(self) -> None:
+        text = EXAMPLE.read_text(encoding="utf-8")
+        fallback = io_service._parse_simple_yaml_documents(text)
+        if io_service.yaml is not None:
+            self.assertEqual(fallback, list(io_service.yaml.safe_load_all(text)))
+        self.assertEqual(len(fallback[0]["tendones"]), 3)
+
+    def test_fallback_accepts_list_items_at_column_zero(self) -> None:
+        text = "tendones:\n- id: T1\n  Ep: 196000\n- id: T2\nEc: 34000.0\n"
+        documents = io_service._parse_simple_yaml_documents(text)
+
+        self.assertEqual(documents, [{"tendones": [{"id": "T1", "Ep": 196000}, {"id": "T2"}], "Ec": 34000.0}])
+        if io_service.yaml is not None:
+            self.assertEqual(documents, list(io_service.yaml.safe_load_all(text)))
+
+    def test_fallback_rejects_unexpected_indentation(self) -> None:
+        with self.assertRaisesRegex(ValueError, "Linea 1"):
+            io_service._parse_simple_yaml_documents("  Ep: 1\n")
+
+
+class ProjectLayoutTests(unittest.TestCase):
+    def test_tendons_override_shared_defaults(self) -> None:
+        tendons = list(iter_input_mappings(EXAMPLE))
+
+        self.assertEqual([tendon["id"] for tendon in tendons], ["T1", "T2", "T3", "V1"])
+        self.assertIsInstance(tendons[1], dict)
+        self.assertEqual(len({tuple(tendon) for tendon in tendons[:3]}), 1)
+        self.assertEqual(tendons[1]["tendon_length"], 41.0)
+        self.assertEqual(tendons[2]["tendon_length"], 32.5)
+        self.assertEqual(tendons[3]["Ec"], 31000.0)
+
+    def test_single_case_loader_points_to_batch_mode(self) -> None:
+        with self.assertRaisesRegex(ValueError, "--batch"):
+            load_input_mapping(EXAMPLE)
+
+    def test_cli_batch_runs_every_tendon(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = Path(temp_dir) / "output.ndjson"
+
+            exit_code = run(["--entrada", str(EXAMPLE), "--salida", str(output_path), "--lote"])
+
+            rows = [json.loads(line) for line in output_path.read_text(encoding="utf-8").splitlines()]
+        self.assertEqual(exit_code, 0)
+        self.assertEqual([row["id"] for row in rows], ["T1", "T2", "T3", "V1"])
+        self.assertTrue(all("errores" not in row for row in rows))
+        self.assertGreater(rows[0]["fuerza_final_total_kN"], rows[2]["fuerza_final_total_kN"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+
+import numpy as np
+
+from pt_losses.domain.models import INPUT_KEYS, LossesInput, LossesResultBatch
+from pt_losses.services.calculator import calculate_losses, calculate_losses_batch
+from fixtures import SAMPLE_MAPPING
+
+
+def build_batch() -> tuple[LossesResultBatch, list]:
+    scenarios = [{**SAMPLE_MAPPING, "mu_fric": value} for value in (0.12, 0.19, 0.25)]
+    columns = {key: [scenario[key] for scenario in scenarios] for key in INPUT_KEYS}
+    results = [calculate_losses(LossesInput.from_mapping(scenario)) for scenario in scenarios]
+    return calculate_losses_batch(columns), results
+
+
+class LossesResultBatchTests(unittest.TestCase):
+    def test_row_view_behaves_like_result(self) -> None:
+        batch, results = build_batch()
+
+        row = batch[1]
+
+        self.assertAlmostEqual(row.sigma_inf_mpa, results[1].sigma_inf_mpa, places=9)
+        self.assertAlmostEqual(row.losses.eta_total, results[1].losses.eta_total, places=12)
+        self.assertAlmostEqual(row.rfem.tinf_percent, results[1].rfem.tinf_percent, places=12)
+        self.assertEqual(list(row.to_dict()), list(results[1].to_dict()))
+        self.assertEqual(row.to_result(), results[1])
+
+    def test_nested_dict_matches_scalar_rendering(self) -> None:
+        batch, results = build_batch()
+
+        for rendered, result in zip(batch.iter_nested_dicts(), results):
+            self.assertEqual(rendered, result.to_nested_dict())
+
+    def test_slicing_and_fancy_indexing_return_batches(self) -> None:
+        batch, _ = build_batch()
+
+        tail = batch[1:]
+        picked = batch[np.array([2, 0, 2])]
+
+        self.assertEqual(len(tail), 2)
+        self.assertEqual(picked.eta_fr[0], batch.eta_fr[2])
+        self.assertEqual(batch[-1].final_force_total_kn, batch.final_force_total_kn[2])
+        with self.assertRaises(IndexError):
+            batch[3]
+
+    def test_from_results_and_concatenate(self) -> None:
+        batch, results = build_batch()
+
+        rebuilt = LossesResultBatch.concatenate([LossesResultBatch.from_results(results[:1]), batch[1:]])
+
+        np.testing.assert_allclose(rebuilt.eta_total, batch.eta_total)
+        self.assertTrue(rebuilt.eta_total.flags.c_contiguous)
+        self.assertEqual(len(LossesResultBatch.from_results([])), 0)
+
+    def test_mismatched_columns_raise(self) -> None:
+        batch, _ = build_batch()
+        columns = batch.columns()
+        columns["eta_fr"] = columns["eta_fr"][:2]
+
+        with self.assertRaises(ValueError):
+            LossesResultBatch.from_columns(columns)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import csv
+import io
+import unittest
+
+import numpy as np
+
+from pt_losses.domain.models import INPUT_KEYS, LossesInput
+from pt_losses.services.calculator import columns_from_inputs
+from pt_losses.services.schema import InputSchema, input_at, iter_inputs
+from fixtures import SAMPLE_MAPPING, build_scenarios
+
+
+class InputSchemaTests(unittest.TestCase):
+    def test_mappings_become_typed_columns(self) -> None:
+        scenarios = build_scenarios()
+
+        columns = InputSchema().columns_from_mappings(scenarios)
+
+        expected = columns_from_inputs([LossesInput.from_mapping(item) for item in scenarios])
+        for key in INPUT_KEYS:
+            np.testing.assert_array_equal(columns[key], expected[key])
+            self.assertEqual(columns[key].dtype, np.float64)
+
+    def test_rfem_aliases_and_defaults(self) -> None:
+        rfem_row = {key: value for key, value in SAMPLE_MAPPING.items() if key not in {"Ep", "Ap", "n_tendons"}}
+        rfem_row.update({"Ep_MPa": 200000.0, "Ap_mm2": 140.0, "cantidad_cordones": 4})
+        schema = InputSchema(defaults={"creep_coeff": 2.0})
+        del rfem_row["creep_coeff"]
+
+        columns = schema.columns_from_mappings([rfem_row, {**SAMPLE_MAPPING, "Ep_MPa": 1.0}])
+
+        self.assertEqual(columns["Ep"].tolist(), [200000.0, SAMPLE_MAPPING["Ep"]])
+        self.assertEqual(columns["n_tendons"].tolist(), [4.0, 12.0])
+        self.assertEqual(columns["creep_coeff"].tolist(), [2.0, SAMPLE_MAPPING["creep_coeff"]])
+
+    def test_later_rows_with_extra_keys_use_their_own_values(self) -> None:
+        schema = InputSchema(defaults={"creep_coeff": 2.0})
+        without_creep = {key: value for key, value in SAMPLE_MAPPING.items() if key != "creep_coeff"}
+        aliased = {**SAMPLE_MAPPING, "Ep_MPa": 1.0}
+        del aliased["Ep"]
+
+        columns = schema.columns_from_mappings(
+            [without_creep, {**without_creep, "creep_coeff": 3.0}, aliased, {**aliased, "Ep": 196000.0}]
+        )
+
+        creep = SAMPLE_MAPPING["creep_coeff"]
+        self.assertEqual(columns["creep_coeff"].tolist(), [2.0, 3.0, creep, creep])
+        self.assertEqual(columns["Ep"].tolist(), [SAMPLE_MAPPING["Ep"]] * 2 + [1.0, 196000.0])
+
+    def test_csv_reader_in_chunks(self) -> None:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(["id", *INPUT_KEYS])
+        for row in range(5):
+            writer.writerow([f"T{row}", *(SAMPLE_MAPPING[key] for key in INPUT_KEYS)])
+        buffer.seek(0)
+
+        chunks = list(InputSchema().iter_csv_columns(csv.reader(buffer), chunk_size=2))
+
+        self.assertEqual([len(chunk["Ep"]) for chunk in chunks], [2, 2, 1])
+        self.assertEqual(chunks[0]["mu_fric"][0], SAMPLE_MAPPING["mu_fric"])
+
+    def test_blank_rows_inside_the_data_do_not_end_the_file(self) -> None:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(INPUT_KEYS)
+        writer.writerow([SAMPLE_MAPPING[key] for key in INPUT_KEYS])
+        buffer.write("\r\n\r\n")
+        writer.writerow([{**SAMPLE_MAPPING, "Ap": 140.0}[key] for key in INPUT_KEYS])
+        buffer.seek(0)
+
+        chunks = list(InputSchema().iter_csv_columns(csv.reader(buffer), chunk_size=1))
+
+        self.assertEqual([chunk["Ap"].tolist() for chunk in chunks], [[SAMPLE_MAPPING["Ap"]], [140.0]])
+
+    def test_missing_key_and_lazy_inputs(self) -> None:
+        with self.assertRaises(KeyError):
+            InputSchema().columns_from_mappings([{"Ep": 1.0}])
+
+        columns = InputSchema().columns_from_mappings(build_scenarios())
+        self.assertEqual(input_at(columns, 0), LossesInput.from_mapping(SAMPLE_MAPPING))
+        self.assertEqual(len(list(iter_inputs(columns))), len(build_scenarios()))
+
+
+if __name__ == "__main__":
+    unittest.main()
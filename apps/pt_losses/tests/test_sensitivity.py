@@ -0,0 +1,84 @@
+import contextlib
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from pt_losses.cli.main import run
+from pt_losses.domain.models import INPUT_KEYS
+from pt_losses.services.calculator import calculate_losses_batch
+from pt_losses.services.sensitivity import SENSITIVITY_OUTPUTS, calculate_sensitivities, format_tornado
+from fixtures import SAMPLE_MAPPING
+
+
+def scenario_columns() -> dict[str, np.ndarray]:
+    scenarios = [
+        SAMPLE_MAPPING,
+        {**SAMPLE_MAPPING, "fp01k": 1500.0, "mu_tesado": 0.6},
+        {**SAMPLE_MAPPING, "k_wobble": 0.5, "relaxation_loss_ratio": 0.5},
+    ]
+    return {key: np.array([scenario[key] for scenario in scenarios], dtype=float) for key in INPUT_KEYS}
+
+
+class SensitivityTests(unittest.TestCase):
+    def test_matches_central_finite_differences(self) -> None:
+        columns = scenario_columns()
+
+        sensitivities = calculate_sensitivities(columns)
+
+        for key in INPUT_KEYS:
+            if key == "n_tendons":
+                continue
+            step = 1e-6 * np.maximum(np.abs(columns[key]), 1e-3)
+            upper = calculate_losses_batch({**columns, key: columns[key] + step})
+            lower = calculate_losses_batch({**columns, key: columns[key] - step})
+            for output in SENSITIVITY_OUTPUTS:
+                numeric = (getattr(upper, output) - getattr(lower, output)) / (2.0 * step)
+                np.testing.assert_allclose(
+                    sensitivities.derivative(output, key),
+                    numeric,
+                    rtol=1e-5,
+                    atol=1e-7 * max(1.0, float(np.max(np.abs(numeric)))),
+                    err_msg=f"d{output}/d{key}",
+                )
+
+    def test_cap_zeroes_total_loss_derivatives(self) -> None:
+        sensitivities = calculate_sensitivities(scenario_columns())
+
+        self.assertEqual(sensitivities.capped.tolist(), [False, False, True])
+        self.assertTrue(all(sensitivities.derivative("eta_total", key)[2] == 0.0 for key in INPUT_KEYS))
+        self.assertGreater(sensitivities.derivative("sigma_inf_mpa", "mu_tesado")[2], 0.0)
+
+    def test_tornado_is_ranked_and_renders(self) -> None:
+        sensitivities = calculate_sensitivities(scenario_columns())
+
+        tornado = sensitivities.tornado(row=0)
+        impacts = [entry["impacto"] for entry in tornado]
+        table = format_tornado(tornado, "fuerza_final_total_kN")
+
+        self.assertEqual(impacts, sorted(impacts, reverse=True))
+        self.assertEqual(len(tornado), len(INPUT_KEYS))
+        self.assertIn(tornado[0]["parametro"], table.splitlines()[1])
+        self.assertNotIn("fc", [line.split()[1] for line in table.splitlines()[1:]])
+
+    def test_cli_adds_ranked_sensitivities(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_path = Path(temp_dir) / "input.json"
+            output_path = Path(temp_dir) / "output.json"
+            input_path.write_text(json.dumps(SAMPLE_MAPPING), encoding="utf-8")
+            table = io.StringIO()
+
+            with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(table):
+                exit_code = run(["--entrada", str(input_path), "--salida", str(output_path), "--sensibilidades"])
+
+            self.assertEqual(exit_code, 0)
+            ranking = json.loads(output_path.read_text(encoding="utf-8"))["sensibilidades"]
+            self.assertEqual(ranking[0]["parametro"], "mu_tesado")
+            self.assertIn("Sensibilidad", table.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
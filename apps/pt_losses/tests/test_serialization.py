@@ -0,0 +1,100 @@
+import contextlib
+import gzip
+import io
+import json
+import lzma
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from pt_losses.cli.main import run
+from pt_losses.domain.models import LossesInput
+from pt_losses.services import serialization
+from pt_losses.services.calculator import calculate_losses
+from pt_losses.services.io import write_result_file
+from pt_losses.services.serialization import JsonSerializer
+from fixtures import SAMPLE_MAPPING
+
+
+def sample_payload() -> dict[str, object]:
+    payload = calculate_losses(LossesInput.from_mapping(SAMPLE_MAPPING)).to_nested_dict()
+    payload["rfem_real"] = {
+        "casos": [{"numero": index, "miembros": list(range(index)), "vacio": {}} for index in range(4)],
+        "modelo": "puente.rf6",
+        "unidad": "adimensional",
+    }
+    payload["muestras"] = np.linspace(0.0, 1.0, 3)
+    return payload
+
+
+class JsonSerializerTests(unittest.TestCase):
+    def backends(self) -> list[str]:
+        return ["json", "orjson"] if serialization.orjson is not None else ["json"]
+
+    def test_default_layout_matches_json_module(self) -> None:
+        payload = {"b": [1, {"d": 2.5, "c": []}], "a": {}}
+        for backend in self.backends():
+            with self.subTest(backend=backend):
+                rendered = JsonSerializer(backend=backend).dumps(payload)
+                self.assertEqual(rendered.decode("utf-8"), json.dumps(payload, indent=2, sort_keys=True))
+                compact = JsonSerializer(compact=True, backend=backend).dumps(payload)
+                self.assertEqual(compact, b'{"a":{},"b":[1,{"c":[],"d":2.5}]}')
+
+    def test_default_backend_matches_json_module_on_special_values(self) -> None:
+        payload = {"nan": float("nan"), "pequeno": 1e-05, "texto": "tendón"}
+        expected = json.dumps(payload, indent=2, sort_keys=True).encode("utf-8")
+        self.assertEqual(JsonSerializer().dumps(payload), expected)
+
+    @unittest.skipIf(serialization.orjson is None, "orjson no esta instalado")
+    def test_orjson_differences_from_json_module(self) -> None:
+        payload = {"nan": float("nan"), "pequeno": 1e-05, "texto": "tendón"}
+        rendered = JsonSerializer(compact=True, backend="orjson").dumps(payload)
+        self.assertEqual(rendered, '{"nan":null,"pequeno":0.00001,"texto":"tendón"}'.encode("utf-8"))
+        self.assertTrue(JsonSerializer(backend="auto").uses_orjson)
+
+    def test_stream_chunks_join_to_the_rendered_document(self) -> None:
+        payload = sample_payload()
+        for backend in self.backends():
+            for compact in (False, True):
+                with self.subTest(backend=backend, compact=compact):
+                    serializer = JsonSerializer(compact=compact, backend=backend)
+                    chunks = list(serializer.iter_chunks(payload, depth=2))
+                    self.assertGreater(len(chunks), 10)
+                    self.assertEqual(b"".join(chunks), serializer.dumps(payload))
+                    self.assertEqual(json.loads(b"".join(chunks))["muestras"], [0.0, 0.5, 1.0])
+
+    def test_compressed_output_is_chosen_by_suffix(self) -> None:
+        payload = sample_payload()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for suffix, opener in ((".json.gz", gzip.open), (".json.xz", lzma.open), (".json", open)):
+                path = Path(temp_dir) / f"resultado{suffix}"
+                write_result_file(path, payload)
+                with opener(path, "rb") as handle:
+                    self.assertEqual(json.loads(handle.read())["rfem_real"]["modelo"], "puente.rf6")
+
+    def test_unknown_backend_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            JsonSerializer(backend="ujson")
+
+
+class CliSerializationTests(unittest.TestCase):
+    def test_stdout_and_compressed_file_share_the_rendered_bytes(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_path = Path(temp_dir) / "input.json"
+            output_path = Path(temp_dir) / "output.json.gz"
+            input_path.write_text(json.dumps(SAMPLE_MAPPING), encoding="utf-8")
+            stdout = io.StringIO()
+
+            with contextlib.redirect_stdout(stdout):
+                exit_code = run(["--entrada", str(input_path), "--salida", str(output_path), "--compacto"])
+
+            self.assertEqual(exit_code, 0)
+            printed = stdout.getvalue()
+            self.assertEqual(len(printed.splitlines()), 1)
+            self.assertEqual(gzip.decompress(output_path.read_bytes()).decode("utf-8"), printed.rstrip("\n"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import contextlib
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from pt_losses.cli.main import run
+from pt_losses.domain.models import LossesInput
+from pt_losses.services import streaming
+from pt_losses.services.calculator import calculate_losses
+from pt_losses.services.streaming import iter_json_records, stream_batch
+from fixtures import SAMPLE_MAPPING
+
+
+class JsonRecordReaderTests(unittest.TestCase):
+    def test_reads_ndjson_and_arrays_across_block_boundaries(self) -> None:
+        records = [{"id": index, "value": index * 1.25e-3} for index in range(20)]
+        ndjson = "\n".join(json.dumps(record) for record in records) + "\n\n"
+        array = " [\n" + ",\n".join(json.dumps(record) for record in records) + "\n]"
+
+        original = streaming.READ_BLOCK_CHARS
+        streaming.READ_BLOCK_CHARS = 7
+        try:
+            self.assertEqual(list(iter_json_records(io.StringIO(ndjson))), records)
+            self.assertEqual(list(iter_json_records(io.StringIO(array))), records)
+        finally:
+            streaming.READ_BLOCK_CHARS = original
+
+    def test_malformed_ndjson_line_becomes_an_error_line(self) -> None:
+        text = json.dumps({"id": 1, **SAMPLE_MAPPING}) + "\n{roto\n" + json.dumps({"id": 3, **SAMPLE_MAPPING}) + "\n"
+        lines: list[str] = []
+
+        written = stream_batch(iter_json_records(io.StringIO(text)), lines.append)
+
+        rows = [json.loads(line) for line in "".join(lines).splitlines()]
+        self.assertEqual(written, 3)
+        self.assertEqual([row.get("id") for row in rows], [1, None, 3])
+        self.assertTrue(rows[1]["errores"][0].startswith("Linea 2: JSON invalido"))
+
+    def test_rejects_unterminated_array(self) -> None:
+        with self.assertRaises(ValueError):
+            list(iter_json_records(io.StringIO('[{"a": 1}, {"a": 2}')))
+
+
+class StreamBatchTests(unittest.TestCase):
+    def test_lines_keep_ids_and_report_bad_records(self) -> None:
+        records = [
+            {"id": "T1", **SAMPLE_MAPPING},
+            {"id": "T2", **SAMPLE_MAPPING, "mu_tesado": 1.4},
+            {"id": "T3", "Ep": 195000.0},
+            [1, 2, 3],
+            {**SAMPLE_MAPPING, "n_tendons": 4},
+        ]
+        lines: list[str] = []
+
+        written = stream_batch(records, lines.append, chunk_size=2)
+
+        rows = [json.loads(line) for line in "".join(lines).splitlines()]
+        expected = calculate_losses(LossesInput.from_mapping(SAMPLE_MAPPING)).to_dict()
+        self.assertEqual(written, 5)
+        self.assertEqual(rows[0]["id"], "T1")
+        self.assertAlmostEqual(rows[0]["fuerza_final_total_kN"], expected["fuerza_final_total_kN"])
+        self.assertEqual(rows[1], {"id": "T2", "errores": ["mu_tesado debe estar entre 0 y 1."]})
+        self.assertEqual(rows[2]["id"], "T3")
+        self.assertIn("Faltan columnas", rows[2]["errores"][0])
+        self.assertIn("errores", rows[3])
+        self.assertNotIn("id", rows[4])
+
+    def test_non_numeric_values_do_not_stop_the_stream(self) -> None:
+        records = [
+            {"id": "A", **SAMPLE_MAPPING, "Ep": "abc"},
+            {"id": "B", **SAMPLE_MAPPING, "Ec": [1, 2]},
+            {"id": "C", **SAMPLE_MAPPING, "fc": {"valor": 45}},
+            {"id": "D", **SAMPLE_MAPPING},
+        ]
+        lines: list[str] = []
+
+        stream_batch(records, lines.append, chunk_size=4)
+
+        rows = [json.loads(line) for line in "".join(lines).splitlines()]
+        self.assertEqual([row["id"] for row in rows], ["A", "B", "C", "D"])
+        self.assertTrue(all("errores" in row for row in rows[:3]))
+        self.assertIn("fuerza_final_total_kN", rows[3])
+
+    def test_infinite_values_do_not_stop_the_stream(self) -> None:
+        text = "\n".join(
+            [
+                json.dumps({"id": "A", **SAMPLE_MAPPING, "Ep": float("inf")}),
+                json.dumps({"id": "B", **SAMPLE_MAPPING}),
+            ]
+        )
+        lines: list[str] = []
+
+        stream_batch(iter_json_records(io.StringIO(text)), lines.append)
+
+        rows = [json.loads(line) for line in "".join(lines).splitlines()]
+        self.assertEqual([row["id"] for row in rows], ["A", "B"])
+        self.assertIn("errores", rows[0])
+        self.assertIn("fuerza_final_total_kN", rows[1])
+
+    def test_cli_batch_writes_one_line_per_record(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_path = Path(temp_dir) / "input.json"
+            output_path = Path(temp_dir) / "output.ndjson"
+            input_path.write_text(
+                json.dumps([{"id": index, **SAMPLE_MAPPING} for index in range(3)]), encoding="utf-8"
+            )
+
+            exit_code = run(["--entrada", str(input_path), "--salida", str(output_path), "--lote"])
+
+            self.assertEqual(exit_code, 0)
+            lines = output_path.read_text(encoding="utf-8").splitlines()
+            self.assertEqual([json.loads(line)["id"] for line in lines], [0, 1, 2])
+
+    def test_cli_batch_rejects_single_case_options(self) -> None:
+        with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            run(["--entrada", "-", "--batch", "--sensibilidades"])
+
+
+if __name__ == "__main__":
+    unittest.main()
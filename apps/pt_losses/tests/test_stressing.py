@@ -0,0 +1,57 @@
+import unittest
+
+import numpy as np
+
+from pt_losses.domain.models import INPUT_KEYS, LossesInput
+from pt_losses.services.calculator import calculate_losses
+from pt_losses.services.stressing import (
+    sequential_elastic_loss_ratio,
+    sequential_elastic_shortening,
+    sequential_shortening_factor,
+)
+from fixtures import SAMPLE_MAPPING
+
+
+class SequentialStressingTests(unittest.TestCase):
+    def test_average_matches_closed_form(self) -> None:
+        loss_input = LossesInput.from_mapping(SAMPLE_MAPPING)
+        simultaneous = calculate_losses(loss_input).losses.eta_el
+
+        sequence = sequential_elastic_shortening(loss_input)
+
+        count = SAMPLE_MAPPING["n_tendons"]
+        self.assertAlmostEqual(sequence.average_eta_el, simultaneous * (count - 1) / (2 * count), places=12)
+        self.assertEqual(sequence.eta_el[-1], 0.0)
+        self.assertTrue(np.all(np.diff(sequence.loss_mpa) < 0))
+
+    def test_custom_order_moves_losses_with_the_tendon(self) -> None:
+        loss_input = LossesInput.from_mapping(SAMPLE_MAPPING)
+        count = loss_input.geometry.count
+        order = list(range(count, 0, -1))
+
+        forward = sequential_elastic_shortening(loss_input)
+        backward = sequential_elastic_shortening(loss_input, order=order)
+
+        np.testing.assert_allclose(backward.loss_mpa, forward.loss_mpa[::-1])
+        self.assertAlmostEqual(backward.average_loss_mpa, forward.average_loss_mpa)
+
+    def test_rejects_order_that_is_not_a_permutation(self) -> None:
+        loss_input = LossesInput.from_mapping(SAMPLE_MAPPING)
+
+        with self.assertRaises(ValueError):
+            sequential_elastic_shortening(loss_input, order=[1, 1] + list(range(3, loss_input.geometry.count + 1)))
+
+    def test_batch_ratio_over_tendon_counts(self) -> None:
+        counts = np.array([1, 2, 12, 40])
+        columns = {key: SAMPLE_MAPPING[key] for key in INPUT_KEYS}
+        columns["n_tendons"] = counts
+
+        ratios = sequential_elastic_loss_ratio(columns)
+
+        simultaneous = calculate_losses(LossesInput.from_mapping(SAMPLE_MAPPING)).losses.eta_el
+        np.testing.assert_allclose(ratios, simultaneous * sequential_shortening_factor(counts))
+        self.assertEqual(ratios[0], 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
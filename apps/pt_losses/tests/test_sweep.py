@@ -0,0 +1,108 @@
+import contextlib
+import csv
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from pt_losses.cli.main import run
+from pt_losses.domain.models import LossesInput
+from pt_losses.services.calculator import calculate_losses
+from pt_losses.services.sweep import SweepAxis, iter_sweep_chunks, sweep_size, write_sweep
+from fixtures import SAMPLE_MAPPING
+
+
+class SweepTests(unittest.TestCase):
+    def test_parse_range_and_list(self) -> None:
+        ranged = SweepAxis.parse("mu_fric=0.10:0.30:3")
+        listed = SweepAxis.parse("k_wobble=0.001, 0.002")
+
+        self.assertEqual(ranged.key, "mu_fric")
+        self.assertEqual(len(ranged), 3)
+        self.assertAlmostEqual(ranged.values[1], 0.20)
+        self.assertEqual(listed.values, (0.001, 0.002))
+        with self.assertRaises(ValueError):
+            SweepAxis.parse("desconocido=1,2")
+
+    def test_chunks_cover_product_in_order(self) -> None:
+        axes = [SweepAxis.parse("mu_fric=0.1,0.2,0.3"), SweepAxis.parse("tendon_length=20,40")]
+
+        chunks = list(iter_sweep_chunks(SAMPLE_MAPPING, axes, chunk_size=4))
+
+        self.assertEqual(sweep_size(axes), 6)
+        self.assertEqual([len(results) for _, results in chunks], [4, 2])
+        parameters, results = chunks[1]
+        self.assertEqual(parameters["mu_fric"].tolist(), [0.3, 0.3])
+        self.assertEqual(parameters["tendon_length"].tolist(), [20.0, 40.0])
+        expected = calculate_losses(
+            LossesInput.from_mapping({**SAMPLE_MAPPING, "mu_fric": 0.3, "tendon_length": 40.0})
+        )
+        self.assertAlmostEqual(results[1].sigma_inf_mpa, expected.sigma_inf_mpa, places=9)
+
+    def test_segments_only_base_is_swept(self) -> None:
+        base = {key: value for key, value in SAMPLE_MAPPING.items() if key not in ("tendon_length", "theta_total")}
+        base["tendon_segments"] = [[20.0, 0.1], [12.5, 0.08]]
+
+        chunks = list(iter_sweep_chunks(base, [SweepAxis.parse("mu_fric=0.1,0.2")]))
+
+        parameters, results = chunks[0]
+        self.assertEqual(parameters["mu_fric"].tolist(), [0.1, 0.2])
+        expected = calculate_losses(LossesInput.from_mapping({**base, "mu_fric": 0.2}))
+        self.assertAlmostEqual(results[1].sigma_inf_mpa, expected.sigma_inf_mpa, places=9)
+
+    def test_invalid_sweep_value_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            list(iter_sweep_chunks(SAMPLE_MAPPING, [SweepAxis.parse("mu_tesado=0.5,1.2")]))
+
+    def test_write_csv_streams_every_row(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = Path(temp_dir) / "barrido.csv"
+
+            rows = write_sweep(output_path, SAMPLE_MAPPING, [SweepAxis.parse("n_tendons=4,8,12")], chunk_size=2)
+
+            with output_path.open(encoding="utf-8", newline="") as handle:
+                records = list(csv.DictReader(handle))
+        self.assertEqual(rows, 3)
+        self.assertEqual([record["n_tendons"] for record in records], ["4", "8", "12"])
+
+    def test_cli_sweep_writes_ndjson(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_path = Path(temp_dir) / "base.json"
+            output_path = Path(temp_dir) / "barrido.ndjson"
+            input_path.write_text(json.dumps(SAMPLE_MAPPING), encoding="utf-8")
+
+            exit_code = run(
+                [
+                    "sweep",
+                    "--entrada",
+                    str(input_path),
+                    "--parametro",
+                    "mu_fric=0.1:0.3:5",
+                    "--parametro",
+                    "mu_tesado=0.7,0.75",
+                    "--salida",
+                    str(output_path),
+                ]
+            )
+
+            lines = output_path.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(len(lines), 10)
+        first = json.loads(lines[0])
+        self.assertEqual(first["mu_tesado"], 0.7)
+        self.assertIn("fuerza_final_total_kN", first)
+
+    def test_cli_sweep_rejects_unsupported_output_suffix(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_path = Path(temp_dir) / "base.json"
+            input_path.write_text(json.dumps(SAMPLE_MAPPING), encoding="utf-8")
+
+            with contextlib.redirect_stderr(io.StringIO()) as stderr, self.assertRaises(SystemExit):
+                run(["sweep", "--entrada", str(input_path), "--salida", str(Path(temp_dir) / "barrido.xlsx")])
+
+        self.assertIn("--salida debe terminar en", stderr.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+
+import numpy as np
+
+from pt_losses.domain.models import LossesInput
+from pt_losses.services.calculator import calculate_losses
+from pt_losses.services.time_history import TimeModel, calculate_time_history
+from fixtures import SAMPLE_MAPPING
+
+
+class TimeHistoryTests(unittest.TestCase):
+    def test_losses_grow_over_default_grid(self) -> None:
+        loss_input = LossesInput.from_mapping(SAMPLE_MAPPING)
+
+        history = calculate_time_history(loss_input)
+
+        self.assertEqual(history.eta_total.shape, (1, 5))
+        self.assertTrue(np.all(np.diff(history.eta_total[0]) > 0))
+        self.assertTrue(np.all(np.diff(history.final_force_total_kn[0]) < 0))
+        simple = calculate_losses(loss_input)
+        self.assertLess(history.eta_flu[0, -1], simple.losses.eta_flu)
+        self.assertGreater(history.eta_flu[0, -1], 0.5 * simple.losses.eta_flu)
+
+    def test_relaxation_only_reaches_calibrated_ratio(self) -> None:
+        mapping = {**SAMPLE_MAPPING, "concrete_stress_at_tendon": 0.0, "shrinkage_strain": 0.0, "creep_coeff": 0.0}
+        loss_input = LossesInput.from_mapping(mapping)
+        model = TimeModel()
+        reference_days = model.relaxation_reference_hours / 24.0
+
+        history = calculate_time_history(loss_input, times_days=[1000.0 / 24.0, reference_days], model=model)
+
+        immediate = history.immediate[0]
+        sigma_initial = immediate.sigma_0_mpa * (1.0 - immediate.losses.eta_fr - immediate.losses.eta_anc)
+        expected = mapping["relaxation_loss_ratio"] * sigma_initial / immediate.sigma_0_mpa
+        self.assertAlmostEqual(history.eta_rel[0, -1], expected, places=9)
+        self.assertLess(history.eta_rel[0, 0], 0.25 * expected)
+        self.assertEqual(history.eta_flu[0, -1], 0.0)
+
+    def test_batches_many_tendons_and_serializes_rows(self) -> None:
+        inputs = [LossesInput.from_mapping({**SAMPLE_MAPPING, "creep_coeff": value}) for value in (1.0, 2.0, 3.0)]
+
+        history = calculate_time_history(inputs, times_days=[0.0, 28.0, 36500.0])
+
+        self.assertEqual(history.eta_flu.shape, (3, 3))
+        np.testing.assert_array_equal(history.eta_flu[:, 0], 0.0)
+        self.assertTrue(np.all(np.diff(history.eta_flu[:, -1]) > 0))
+        self.assertEqual(history.to_dict(row=2)["tiempos_dias"], [0.0, 28.0, 36500.0])
+
+    def test_times_must_increase(self) -> None:
+        with self.assertRaises(ValueError):
+            calculate_time_history(LossesInput.from_mapping(SAMPLE_MAPPING), times_days=[28.0, 7.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+
+import numpy as np
+
+from pt_losses.domain.models import INPUT_KEYS, LossesInput
+from pt_losses.services.calculator import calculate_losses_batch
+from pt_losses.services.validation import FIELD_RULES, validate_columns
+from fixtures import SAMPLE_MAPPING
+
+
+def project_columns(rows: int) -> dict[str, np.ndarray]:
+    columns = {key: np.full(rows, float(SAMPLE_MAPPING[key])) for key in INPUT_KEYS}
+    columns["Ep"][3] = 0.0
+    columns["mu_tesado"][3] = 1.5
+    columns["creep_coeff"][7] = -0.1
+    columns["n_tendons"][9] = 0.5
+    columns["Ap"][11] = np.nan
+    return columns
+
+
+class ValidationTests(unittest.TestCase):
+    def test_reports_every_violation_in_row_order(self) -> None:
+        report = validate_columns(project_columns(50_000))
+
+        self.assertEqual(
+            list(report.issues()),
+            [
+                (3, "Ep", "Ep debe ser mayor que cero."),
+                (3, "mu_tesado", "mu_tesado debe estar entre 0 y 1."),
+                (7, "creep_coeff", "creep_coeff no puede ser negativo."),
+                (9, "n_tendons", "n_tendons debe ser mayor que cero."),
+                (11, "Ap", "Ap debe ser mayor que cero."),
+            ],
+        )
+        self.assertEqual(int(report.invalid.sum()), 4)
+        self.assertEqual(report.to_dict()["filas_invalidas"], 4)
+
+    def test_rules_agree_with_domain_checks(self) -> None:
+        probes = {key: [rule.lower - 1e-9, rule.lower, 0.5, 1.0 + 1e-9] for key, rule in FIELD_RULES.items()}
+
+        for key, values in probes.items():
+            for value in values:
+                mapping = {**SAMPLE_MAPPING, key: value}
+                try:
+                    LossesInput.from_mapping(mapping)
+                    accepted = True
+                except ValueError:
+                    accepted = False
+                report = validate_columns(mapping)
+                self.assertEqual(report.is_valid, accepted, msg=f"{key}={value}")
+
+    def test_summary_is_truncated(self) -> None:
+        columns = {key: SAMPLE_MAPPING[key] for key in INPUT_KEYS}
+        columns["k_wobble"] = -np.ones(25)
+
+        summary = validate_columns(columns).summary(limit=3)
+
+        self.assertEqual(len(summary.splitlines()), 4)
+        self.assertIn("22 errores mas", summary)
+
+
+class BatchOnInvalidTests(unittest.TestCase):
+    def test_skip_and_mask_keep_valid_rows(self) -> None:
+        columns = project_columns(20)
+        valid = validate_columns(columns).valid
+
+        skipped = calculate_losses_batch(columns, on_invalid="skip")
+        masked = calculate_losses_batch(columns, on_invalid="mask", deduplicate=True)
+
+        self.assertEqual(len(skipped), int(valid.sum()))
+        self.assertEqual(len(masked), 20)
+        self.assertTrue(np.all(np.isnan(masked.sigma_inf_mpa[~valid])))
+        np.testing.assert_array_equal(masked.sigma_inf_mpa[valid], skipped.sigma_inf_mpa)
+
+    def test_raise_lists_the_bad_rows(self) -> None:
+        with self.assertRaisesRegex(ValueError, "fila 7: creep_coeff"):
+            calculate_losses_batch(project_columns(20), on_invalid="raise")
+
+    def test_valid_input_is_untouched(self) -> None:
+        columns = {key: SAMPLE_MAPPING[key] for key in INPUT_KEYS}
+
+        checked = calculate_losses_batch(columns, on_invalid="raise")
+
+        np.testing.assert_array_equal(checked.sigma_inf_mpa, calculate_losses_batch(columns).sigma_inf_mpa)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from pt_losses.cli.main import run
+from pt_losses.domain.models import LossesInput
+from pt_losses.services.calculator import calculate_losses
+from pt_losses.services.watch import DirectoryWatcher
+from fixtures import SAMPLE_MAPPING
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def write_input(path: Path, mapping: dict[str, object], mtime_ns: int) -> None:
+    path.write_text(json.dumps(mapping), encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class DirectoryWatcherTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.directory = Path(self.temp_dir.name)
+        self.clock = FakeClock()
+        self.watcher = DirectoryWatcher(self.directory, debounce=1.0, clock=self.clock)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def advance(self, seconds: float) -> list[str]:
+        self.clock.now += seconds
+        return self.watcher.poll()
+
+    def test_bursts_are_debounced_and_only_changed_files_recomputed(self) -> None:
+        write_input(self.directory / "viga.json", SAMPLE_MAPPING, 1_000)
+        write_input(self.directory / "losa.json", SAMPLE_MAPPING, 1_000)
+
+        self.assertEqual(self.advance(0.0), [])
+        lines = self.advance(1.0)
+        self.assertEqual([line.split(":")[0] for line in lines], ["losa.json", "viga.json"])
+        output = self.watcher.output_path(self.directory / "viga.json")
+        expected = calculate_losses(LossesInput.from_mapping(SAMPLE_MAPPING)).to_nested_dict()
+        self.assertEqual(json.loads(output.read_text(encoding="utf-8")), expected)
+
+        write_input(self.directory / "viga.json", {**SAMPLE_MAPPING, "mu_fric": 0.25}, 2_000)
+        self.assertEqual(self.advance(0.5), [])
+        write_input(self.directory / "viga.json", {**SAMPLE_MAPPING, "mu_fric": 0.30}, 3_000)
+        self.assertEqual(self.advance(0.5), [])
+        lines = self.advance(1.0)
+
+        self.assertEqual(len(lines), 1)
+        self.assertRegex(lines[0], r"^viga\.json: eta_total 0\.\d{4} -> 0\.\d{4} \(\+0\.\d{4}\) \| fuerza_final_total_kN")
+        self.assertEqual(self.watcher.calculator.stats.misses, 2)
+        self.assertEqual(self.advance(5.0), [])
+
+    def test_errors_and_removals_are_reported(self) -> None:
+        write_input(self.directory / "malo.yaml", {"Ep": 1}, 1_000)
+        write_input(self.directory / "viga.json", SAMPLE_MAPPING, 1_000)
+        self.advance(0.0)
+
+        lines = self.advance(1.0)
+        (self.directory / "viga.json").unlink()
+        self.advance(0.0)
+
+        self.assertTrue(lines[0].startswith("malo.yaml: error:"))
+        self.assertEqual(self.advance(1.0), ["viga.json: eliminado"])
+
+    def test_same_stem_with_different_suffixes_keeps_both_results(self) -> None:
+        write_input(self.directory / "viga.json", SAMPLE_MAPPING, 1_000)
+        write_input(self.directory / "viga.yaml", {**SAMPLE_MAPPING, "mu_fric": 0.25}, 1_000)
+        self.advance(0.0)
+        self.advance(1.0)
+
+        outputs = {self.watcher.output_path(self.directory / name) for name in ("viga.json", "viga.yaml")}
+        self.assertEqual(len(outputs), 2)
+        results = {json.loads(output.read_text(encoding="utf-8"))["perdidas"]["eta_fr"] for output in outputs}
+        self.assertEqual(len(results), 2)
+
+
+class WatchCliTests(unittest.TestCase):
+    def test_once_writes_every_result(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            write_input(Path(temp_dir) / "viga.json", SAMPLE_MAPPING, 1_000)
+            stdout = io.StringIO()
+
+            with contextlib.redirect_stdout(stdout):
+                exit_code = run(["watch", temp_dir, "--una-vez"])
+
+            self.assertEqual(exit_code, 0)
+            self.assertTrue((Path(temp_dir) / "resultados" / "viga.json.resultado.json").exists())
+        self.assertTrue(stdout.getvalue().startswith("viga.json: eta_total "))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import random
+import time
+
+import numpy as np
+
+from pt_losses.domain.models import LossesInput, LossesResultBatch
+from pt_losses.domain.tendon_geometry import TendonGeometry
+from pt_losses.services.calculator import calculate_losses, calculate_losses_batch, columns_from_inputs
+from pt_losses.services.plan import CalculationPlan, calculate_losses_planned
+
+GEOMETRIES = 100_000
+REPEATS = 5
+SEED = 2024
+BASE_INPUT = {
+    "Ep": 195000.0,
+    "Ec": 34000.0,
+    "fpk": 1860.0,
+    "fp01k": 1640.0,
+    "fc": 45.0,
+    "Ap": 150.0,
+    "n_tendons": 12,
+    "tendon_length": 32.5,
+    "theta_total": 0.18,
+    "eccentricity": 0.22,
+    "mu_tesado": 0.75,
+    "mu_fric": 0.19,
+    "k_wobble": 0.0015,
+    "anchorage_slip_mm": 6.0,
+    "concrete_stress_at_tendon": 9.5,
+    "creep_coeff": 1.8,
+    "shrinkage_strain": 0.0002,
+    "relaxation_loss_ratio": 0.025,
+}
+MATERIAL_PAIRS = [
+    {"Ec": 31000.0, "fc": 30.0, "fpk": 1770.0, "fp01k": 1560.0},
+    {"Ec": 34000.0, "fc": 45.0, "fpk": 1860.0, "fp01k": 1640.0},
+    {"Ec": 36000.0, "fc": 55.0, "fpk": 1860.0, "fp01k": 1600.0},
+]
+
+
+def build_inputs() -> list[LossesInput]:
+    rng = random.Random(SEED)
+    plans = [CalculationPlan.from_input(LossesInput.from_mapping({**BASE_INPUT, **pair})) for pair in MATERIAL_PAIRS]
+    return [
+        rng.choice(plans).to_input(
+            TendonGeometry(
+                area_mm2=rng.choice([100.0, 140.0, 150.0]),
+                count=rng.randint(2, 24),
+                length_m=rng.uniform(8.0, 90.0),
+                theta_total_rad=rng.uniform(0.0, 1.2),
+                eccentricity_m=rng.uniform(0.0, 0.3),
+            )
+        )
+        for _ in range(GEOMETRIES)
+    ]
+
+
+def timed(label: str, function, *args):
+    """Best of ``REPEATS`` runs, so a noisy machine does not decide the ratio."""
+    elapsed = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        value = function(*args)
+        elapsed = min(elapsed, time.perf_counter() - start)
+    print(f"{label:<38}: {elapsed * 1000.0:10.1f} ms")
+    return value, elapsed
+
+
+def main() -> None:
+    inputs = build_inputs()
+    print(f"{GEOMETRIES} geometrias, {len(MATERIAL_PAIRS)} pares de materiales")
+
+    scalar, scalar_time = timed("calculate_losses (uno por uno)", lambda items: [calculate_losses(item) for item in items], inputs)
+    # The batch baseline starts from the same LossesInput list, so stacking the columns is part of its cost.
+    batch, batch_time = timed(
+        "calculate_losses_batch", lambda items: calculate_losses_batch(columns_from_inputs(items)), inputs
+    )
+    planned, planned_time = timed("calculate_losses_planned", calculate_losses_planned, inputs)
+
+    expected = LossesResultBatch.from_results(scalar)
+    deviation = max(
+        float(np.max(np.abs(getattr(result, name) - values)))
+        for result in (batch, planned)
+        for name, values in expected.columns().items()
+    )
+    print(f"{'aceleracion vs uno por uno':<38}: {scalar_time / planned_time:10.1f} x")
+    print(f"{'aceleracion vs calculate_losses_batch':<38}: {batch_time / planned_time:10.1f} x")
+    print(f"{'diferencia maxima':<38}: {deviation:10.3e}")
+
+
+if __name__ == "__main__":
+    main()